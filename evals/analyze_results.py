@@ -11,8 +11,8 @@ from collections import defaultdict
 from pathlib import Path
 
 import numpy as np
-from sklearn.cluster import DBSCAN
 
+from llm_consortium.clustering import dbscan
 from llm_consortium.db import get_embedding_records_for_run
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -26,20 +26,17 @@ def compute_clusters(records, eps=0.5, min_samples=2):
     embeddings = []
     vector_ids = []
     for r in records:
-        if r.get("embedding_json"):
-            try:
-                vec = json.loads(r["embedding_json"])
-                embeddings.append(vec)
-                vector_ids.append(r["response_id"])
-            except:
-                pass
+        if r.get("embedding") is not None:
+            embeddings.append(r["embedding"])
+            vector_ids.append(r["response_id"])
                 
     if not embeddings:
         return 0, {}
         
-    X = np.array(embeddings)
-    clusterer = DBSCAN(eps=eps, min_samples=min_samples, metric="euclidean")
-    labels = clusterer.fit_predict(X)
+    X = np.vstack(embeddings).astype(float)
+    squared = np.einsum("ij,ij->i", X, X)
+    distances = np.sqrt(np.maximum(squared[:, None] + squared[None, :] - 2.0 * X @ X.T, 0.0))
+    labels = dbscan(distances, eps, min_samples)
     
     unique_clusters = set(labels) - {-1}
     cluster_count = len(unique_clusters)
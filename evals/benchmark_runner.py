@@ -12,12 +12,14 @@ import multiprocessing
 from pathlib import Path
 
 from llm_consortium import create_consortium
+from llm_consortium.embeddings import get_embedding_backend
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("benchmark_runner")
 
 
-def run_strategy(strategy_name, prompt_data, models, str_params=None, arbiter=None, embedding_backend=None, embedding_model=None):
+def run_strategy(strategy_name, prompt_data, models, str_params=None, arbiter=None, embedding_backend=None, embedding_model=None,
+                 cache_policy="off", use_cache=True):
     prompt_text = prompt_data.get("prompt", "")
     category = prompt_data.get("category", "unknown")
     expected_agreement = prompt_data.get("expected_agreement", 0.5)
@@ -31,14 +33,15 @@ def run_strategy(strategy_name, prompt_data, models, str_params=None, arbiter=No
         strategy=strategy_name,
         strategy_params=str_params or {},
         embedding_backend=embedding_backend if strategy_name == "semantic" else None,
-        embedding_model=embedding_model if strategy_name == "semantic" else None
+        embedding_model=embedding_model if strategy_name == "semantic" else None,
+        cache_policy=cache_policy,
     )
     # Inject metadata for db logging
     orch.config.category = category
     orch.config.expected_agreement = expected_agreement
 
     start_t = time.time()
-    result = orch.orchestrate(prompt_text)
+    result = orch.orchestrate(prompt_text, use_cache=use_cache)
     elapsed = time.time() - start_t
 
     synthesis = result.get("synthesis", {})
@@ -62,6 +65,9 @@ def _run_main():
     parser.add_argument("--arbiter", help="Arbiter model name (e.g. gpt-4o)")
     parser.add_argument("--embedding-backend", default="sentence-transformers", help="Embedding backend string")
     parser.add_argument("--embedding-model", default=None, help="Embedding model string")
+    parser.add_argument("--cache-policy", default="off", choices=["off", "read_write", "read_only", "refresh"],
+                        help="Member response cache policy for repeated benchmark runs")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the member response cache for this run")
     args = parser.parse_args()
 
     # Parse models
@@ -81,6 +87,10 @@ def _run_main():
         return
 
     results = []
+
+    if args.embedding_backend:
+        # Every orchestrator shares this backend; load it once before the timed runs start
+        get_embedding_backend(args.embedding_backend, args.embedding_model).warm_up()
     
     max_workers = min(5, multiprocessing.cpu_count())
     logger.info(f"Running benchmarks with {max_workers} concurrent parallel workers")
@@ -92,7 +102,9 @@ def _run_main():
             "default", p_data, models_config,
             arbiter=args.arbiter,
             embedding_backend=args.embedding_backend,
-            embedding_model=args.embedding_model
+            embedding_model=args.embedding_model,
+            cache_policy=args.cache_policy,
+            use_cache=not args.no_cache,
         )
         
         res_semantic = run_strategy(
@@ -102,7 +114,9 @@ def _run_main():
             str_params={"clustering_algorithm": "dbscan", "eps": 0.5, "min_samples": 2},
             arbiter=args.arbiter,
             embedding_backend=args.embedding_backend,
-            embedding_model=args.embedding_model
+            embedding_model=args.embedding_model,
+            cache_policy=args.cache_policy,
+            use_cache=not args.no_cache,
         )
         
         return {
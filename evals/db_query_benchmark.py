@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Query benchmark for the consortium logs schema indexes.
+
+Builds a synthetic logs DB (runs x members rows in consortium_members, responses and
+response_embeddings, plus one arbiter decision per run) with every migration before
+`m004_indexes`, times the hot read queries, then applies the index migration and
+times them again. Runs against a throwaway file unless --db is given.
+"""
+import argparse
+import datetime
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import sqlite_utils
+
+from llm_consortium.migrations import migrate
+
+QUERIES = {
+    "runs --since": (
+        "SELECT * FROM consortium_runs WHERE created_at >= ? ORDER BY created_at DESC LIMIT 10",
+        lambda run_id, since: [since],
+    ),
+    "run-info members": (
+        "SELECT cm.*, r.model, r.response FROM consortium_members cm "
+        "JOIN responses r ON cm.response_id = r.id "
+        "WHERE cm.run_id = ? ORDER BY cm.iteration, cm.member_index",
+        lambda run_id, since: [run_id],
+    ),
+    "embedding records": (
+        "SELECT re.response_id, re.run_id, re.model, re.embedding_json, re.embedding_model, re.created_at, "
+        "cm.iteration, cm.member_index, ad.geometric_confidence "
+        "FROM response_embeddings re "
+        "LEFT JOIN consortium_members cm ON cm.response_id = re.response_id AND cm.run_id = re.run_id "
+        "LEFT JOIN arbiter_decisions ad ON ad.run_id = re.run_id AND ad.iteration = cm.iteration "
+        "WHERE re.run_id = ? ORDER BY cm.iteration, cm.member_index, re.response_id",
+        lambda run_id, since: [run_id],
+    ),
+}
+
+
+def build(db, runs, members):
+    conn = db.conn
+    conn.execute("CREATE TABLE IF NOT EXISTS responses (id TEXT PRIMARY KEY, model TEXT, response TEXT)")
+    start = datetime.datetime(2024, 1, 1)
+    rng = random.Random(0)
+    with conn:
+        for run in range(runs):
+            run_id = f"run-{run:08d}"
+            created = (start + datetime.timedelta(seconds=rng.randint(0, 3 * 365 * 86400))).isoformat()
+            conn.execute(
+                "INSERT INTO consortium_runs (id, created_at, strategy, judging_method, user_prompt) VALUES (?, ?, ?, ?, ?)",
+                [run_id, created, "default", "default", f"prompt {run}"],
+            )
+            member_rows = [(run_id, f"{run_id}-m{m}", "member", 1 + m % 2, m) for m in range(members)]
+            conn.executemany(
+                "INSERT INTO consortium_members (run_id, response_id, role, iteration, member_index) VALUES (?, ?, ?, ?, ?)",
+                member_rows,
+            )
+            conn.executemany(
+                "INSERT INTO responses (id, model, response) VALUES (?, ?, ?)",
+                [(row[1], "model-a", "answer") for row in member_rows],
+            )
+            conn.executemany(
+                "INSERT INTO response_embeddings (response_id, run_id, model, embedding_json, created_at) VALUES (?, ?, ?, ?, ?)",
+                [(row[1], run_id, "model-a", "[0.0, 1.0]", created) for row in member_rows],
+            )
+            conn.execute(
+                "INSERT INTO arbiter_decisions (run_id, iteration, response_id, confidence) VALUES (?, ?, ?, ?)",
+                [run_id, 1, f"{run_id}-arbiter", 0.9],
+            )
+
+
+def time_queries(db, runs, repeats):
+    rng = random.Random(1)
+    timings = {}
+    for name, (sql, params) in QUERIES.items():
+        start = time.perf_counter()
+        for _ in range(repeats):
+            run_id = f"run-{rng.randrange(runs):08d}"
+            db.conn.execute(sql, params(run_id, "2026-12-01")).fetchall()
+        timings[name] = (time.perf_counter() - start) / repeats
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=200000, help="Synthetic consortium runs")
+    parser.add_argument("--members", type=int, default=5, help="Member responses per run")
+    parser.add_argument("--repeats", type=int, default=20, help="Timed executions per query")
+    parser.add_argument("--db", help="Build the synthetic DB at this path instead of a temp file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(args.db) if args.db else Path(directory) / "bench_logs.db"
+        db = sqlite_utils.Database(sqlite3.connect(path))
+        migrate(db, until="m003_embedding_tables")
+        start = time.perf_counter()
+        build(db, args.runs, args.members)
+        total_rows = sum(db[table].count for table in (
+            "consortium_runs", "consortium_members", "responses", "response_embeddings", "arbiter_decisions",
+        ))
+        print(f"Built {total_rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+        before = time_queries(db, args.runs, args.repeats)
+        start = time.perf_counter()
+        migrate(db)
+        print(f"Applied index migration in {time.perf_counter() - start:.1f}s\n")
+        after = time_queries(db, args.runs, args.repeats)
+        db.conn.close()
+
+    print(f"{'query':<20} {'before':>12} {'after':>12} {'speedup':>9}")
+    for name in QUERIES:
+        print(f"{name:<20} {before[name] * 1000:>10.2f}ms {after[name] * 1000:>10.2f}ms {before[name] / after[name]:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
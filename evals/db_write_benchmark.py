@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for consortium trace writes.
+
+Simulates member threads each writing `consortium_members` rows and compares:
+
+- legacy: per-thread connection with schema setup, rollback journal, synchronous=FULL
+  and one commit per row (the logger's behaviour before WAL and write-behind)
+- tuned: the package's WAL connections, pragmas and group-commit background writer
+
+Runs against a throwaway database directory, never the user's logs DB.
+"""
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import sqlite_utils
+
+import llm_consortium.db as consortium_db
+from llm_consortium.db import DatabaseConnection, flush_writes, save_consortium_member
+from llm_consortium.migrations import m001_initial_schema
+
+
+def _member_rows(threads, rows_per_thread):
+    run_id = str(uuid.uuid4())
+    return [
+        [(run_id, str(uuid.uuid4()), "member", 1, t) for _ in range(rows_per_thread)]
+        for t in range(threads)
+    ]
+
+
+def _run_threads(target, batches):
+    workers = [threading.Thread(target=target, args=(batch,)) for batch in batches]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_legacy(path, batches):
+    def write(batch):
+        conn = sqlite3.connect(path, timeout=30)
+        conn.execute("PRAGMA journal_mode = DELETE")
+        conn.execute("PRAGMA synchronous = FULL")
+        m001_initial_schema(sqlite_utils.Database(conn))
+        conn.commit()
+        for row in batch:
+            conn.execute(
+                "INSERT INTO consortium_members (run_id, response_id, role, iteration, member_index) VALUES (?, ?, ?, ?, ?)",
+                row,
+            )
+            conn.commit()
+        conn.close()
+
+    return _run_threads(write, batches)
+
+
+def bench_tuned(directory, batches):
+    consortium_db.user_dir = lambda: Path(directory)
+
+    def write(batch):
+        for run_id, response_id, role, iteration, member_index in batch:
+            save_consortium_member(run_id, response_id, role, iteration, member_index)
+
+    start = time.perf_counter()
+    _run_threads(write, batches)
+    flush_writes()
+    elapsed = time.perf_counter() - start
+    DatabaseConnection.close_all()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent writer threads (members)")
+    parser.add_argument("--rows", type=int, default=250, help="Rows written by each thread")
+    args = parser.parse_args()
+
+    total = args.threads * args.rows
+    with tempfile.TemporaryDirectory() as legacy_dir, tempfile.TemporaryDirectory() as tuned_dir:
+        legacy = bench_legacy(str(Path(legacy_dir) / "consortium_logs.db"), _member_rows(args.threads, args.rows))
+        tuned = bench_tuned(tuned_dir, _member_rows(args.threads, args.rows))
+
+    print(f"{total} rows from {args.threads} threads")
+    print(f"legacy (rollback journal, FULL sync, commit per row): {legacy:.3f}s  {total / legacy:,.0f} rows/s")
+    print(f"tuned  (WAL, NORMAL sync, group commit):              {tuned:.3f}s  {total / tuned:,.0f} rows/s")
+    print(f"speedup: {legacy / tuned:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the embedding backend registry.
+
+Times the first embedding of each of --runs semantic runs (one orchestrator each, as in
+benchmark_runner.py) three ways:
+
+- fresh: a new backend per orchestrator (the behaviour before the shared registry)
+- shared: the process-wide registry, loading the backend on the first run
+- warmed: the registry with warm_up() started in the background at "plugin load",
+  --idle seconds before the first run
+
+No member or arbiter calls are made; only embedding startup is measured.
+"""
+import argparse
+import time
+import types
+
+from llm_consortium.embeddings.registry import get_embedding_service, reset_embedding_registry, warm_up
+from llm_consortium.embeddings.service import create_embedding_service
+
+
+def _config(args):
+    # Persistent cache off so every run actually reaches the backend
+    return types.SimpleNamespace(
+        embedding_backend=args.embedding_backend,
+        embedding_model=args.embedding_model,
+        embedding_cache_enabled=True,
+        embedding_cache_max_entries=0,
+    )
+
+
+def _time_runs(args, get_service):
+    timings = []
+    for run in range(args.runs):
+        start = time.perf_counter()
+        get_service().embed(f"benchmark prompt {run}")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--embedding-backend", default="sentence-transformers", help="Embedding backend string")
+    parser.add_argument("--embedding-model", default=None, help="Embedding model string")
+    parser.add_argument("--runs", type=int, default=5, help="Semantic runs (orchestrators) to time")
+    parser.add_argument("--idle", type=float, default=5.0, help="Seconds between plugin load and the first run")
+    args = parser.parse_args()
+    config = _config(args)
+
+    fresh = _time_runs(args, lambda: create_embedding_service(config))
+
+    reset_embedding_registry()
+    shared = _time_runs(args, lambda: get_embedding_service(config))
+
+    reset_embedding_registry()
+    warm_up([config], background=True)
+    time.sleep(args.idle)
+    warmed = _time_runs(args, lambda: get_embedding_service(config))
+
+    print(f"Time to first embedding per run ({args.embedding_backend}:{args.embedding_model or 'default'})")
+    print(f"{'run':>4} {'fresh':>10} {'shared':>10} {'warmed':>10}")
+    for run in range(args.runs):
+        print(f"{run + 1:>4} {fresh[run]:>9.3f}s {shared[run]:>9.3f}s {warmed[run]:>9.3f}s")
+    print(f"{'sum':>4} {sum(fresh):>9.3f}s {sum(shared):>9.3f}s {sum(warmed):>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Geometry benchmark for one semantic iteration.
+
+Times the per-iteration geometry work (DBSCAN clustering, distances to the consensus
+centroid, per-cluster density and radius, geometric confidence and outlier detection)
+on synthetic clustered embeddings. The legacy path is the per-vector
+`_cosine_distance` loops, with sklearn's DBSCAN recomputing cosine distances
+itself. The context path builds one GeometryContext (a single GEMM) and clusters
+its distance matrix with the NumPy DBSCAN from llm_consortium.clustering. It also
+reports what importing sklearn.cluster costs a fresh process. The legacy path
+needs scikit-learn; without it only the context path is timed.
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from llm_consortium.clustering import dbscan
+from llm_consortium.geometry import GeometricConfidenceCalculator, GeometryContext, _cosine_distance
+
+try:
+    from sklearn.cluster import DBSCAN
+except ImportError:  # pragma: no cover - optional dependency
+    DBSCAN = None
+
+
+def make_embeddings(members, dim, clusters, seed):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dim))
+    labels = rng.integers(0, clusters, size=members)
+    return (centres[labels] + 0.3 * rng.standard_normal((members, dim))).astype(np.float32)
+
+
+def legacy(embeddings, eps, min_samples):
+    """The pre-GeometryContext code path, one _cosine_distance call per vector."""
+    vectors = list(embeddings.astype(float))
+    labels = DBSCAN(eps=eps, min_samples=min_samples, metric="cosine").fit(np.vstack(vectors)).labels_.tolist()
+    densities = {}
+    for cid in set(labels) - {-1}:
+        cluster = [vectors[i] for i, label in enumerate(labels) if label == cid]
+        centroid = np.mean(np.vstack(cluster), axis=0)
+        distances = [_cosine_distance(vector, centroid) for vector in cluster]
+        densities[cid] = (1.0 - float(np.mean(distances)), float(np.max(distances)))
+    # GeometricConfidenceCalculator.compute and detect_outliers each computed their own centroid
+    centroid = np.mean(np.vstack(vectors), axis=0)
+    confidence = 1.0 - float(np.mean([_cosine_distance(vector, centroid) for vector in vectors]))
+    centroid = np.mean(np.vstack(vectors), axis=0)
+    distances = np.array([_cosine_distance(vector, centroid) for vector in vectors])
+    outliers = np.flatnonzero(distances > distances.mean() + 2.0 * distances.std()).tolist()
+    return labels, densities, confidence, outliers
+
+
+def with_context(embeddings, eps, min_samples):
+    context = GeometryContext(embeddings)
+    labels = dbscan(context.cosine_distances(), eps, min_samples).tolist()
+    densities = {cid: context.density([i for i, label in enumerate(labels) if label == cid]) for cid in set(labels) - {-1}}
+    confidence, _ = GeometricConfidenceCalculator.compute(context)
+    outliers = GeometricConfidenceCalculator.detect_outliers(context)
+    return labels, densities, confidence, outliers
+
+
+def best_of(fn, repeats, *args):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def import_seconds(statement, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, nargs="+", default=[10, 50, 100, 250, 500], help="Responses per iteration")
+    parser.add_argument("--dim", type=int, default=1024, help="Embedding dimension")
+    parser.add_argument("--clusters", type=int, default=3, help="Synthetic answer clusters")
+    parser.add_argument("--eps", type=float, default=0.3, help="DBSCAN eps (cosine distance)")
+    parser.add_argument("--min-samples", type=int, default=2, help="DBSCAN min_samples")
+    parser.add_argument("--repeats", type=int, default=5, help="Timing repeats (best is reported)")
+    args = parser.parse_args()
+
+    print(f"Per-iteration geometry, dim={args.dim}{'' if DBSCAN is not None else ' (no sklearn: legacy path skipped)'}")
+    print(f"{'members':>8} {'legacy':>10} {'context':>10} {'speedup':>8} {'result':>7}")
+    for members in args.members:
+        embeddings = make_embeddings(members, args.dim, args.clusters, seed=members)
+        new, new_result = best_of(with_context, args.repeats, embeddings, args.eps, args.min_samples)
+        if DBSCAN is None:
+            print(f"{members:>8} {'-':>10} {new * 1000:>8.2f}ms {'-':>8} {'-':>7}")
+            continue
+        old, old_result = best_of(legacy, args.repeats, embeddings, args.eps, args.min_samples)
+        same = "same" if old_result[0] == new_result[0] and abs(old_result[2] - new_result[2]) < 1e-5 else "DIFF"
+        print(f"{members:>8} {old * 1000:>8.2f}ms {new * 1000:>8.2f}ms {old / new:>7.1f}x {same:>7}")
+
+    if DBSCAN is not None:
+        baseline = import_seconds("import numpy")
+        with_sklearn = import_seconds("import numpy, sklearn.cluster")
+        print(f"\nFresh-process import: numpy {baseline:.2f}s, numpy + sklearn.cluster {with_sklearn:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
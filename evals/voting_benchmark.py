@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Voting benchmark for one iteration's response grouping.
+
+Builds synthetic member responses (a few answer families of ~2000 characters,
+each member a lightly edited copy of its family's text) and times
+VotingStrategy._group_similar_responses. The legacy path is the old per-pair
+code: normalise both texts and run difflib.SequenceMatcher for every comparison.
+The other rows use one normalisation per response with each similarity_method,
+and minhash with LSH bucketing. "groups" reports whether each method recovered
+the answer families. At this length difflib's autojunk heuristic treats every
+common letter as junk, so near-identical answers score close to 0 and the
+difflib rows do not group them.
+"""
+import argparse
+import difflib
+import random
+import string
+import time
+
+from llm_consortium.similarity import normalize_answer
+from llm_consortium.strategies.voting import VotingStrategy
+
+WORDS = ["".join(random.Random(i).choices(string.ascii_lowercase, k=3 + i % 6)) for i in range(2000)]
+
+
+def make_responses(members, families, length, seed):
+    rng = random.Random(seed)
+    bases = [" ".join(rng.choice(WORDS) for _ in range(length // 6))[:length] for _ in range(families)]
+    responses = []
+    for i in range(members):
+        family = i % families
+        words = bases[family].split()
+        for _ in range(len(words) // 20):
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+        responses.append({"model": f"m{i}", "response": "Sure! " + " ".join(words), "family": family})
+    return responses
+
+
+def legacy_group(responses, threshold, answer_length):
+    """The pre-fingerprint code path: normalise and diff both texts for every pair."""
+    def similarity(text1, text2):
+        norm1 = normalize_answer(text1)[:answer_length]
+        norm2 = normalize_answer(text2)[:answer_length]
+        if not norm1 or not norm2:
+            return 1.0 if norm1 == norm2 else 0.0
+        return difflib.SequenceMatcher(None, norm1, norm2).ratio()
+
+    groups, used = [], set()
+    for i, response in enumerate(responses):
+        if i in used:
+            continue
+        group = [response]
+        used.add(i)
+        for j, other in enumerate(responses):
+            if j > i and j not in used and similarity(response["response"], other["response"]) >= threshold:
+                group.append(other)
+                used.add(j)
+        groups.append(group)
+    return groups
+
+
+def families_recovered(groups):
+    """True when every group is exactly one answer family."""
+    families = [{r["family"] for r in group} for group in groups]
+    return all(len(f) == 1 for f in families) and len(groups) == len(set().union(*families))
+
+
+def best_of(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, nargs="+", default=[5, 20, 50, 100], help="Responses per iteration")
+    parser.add_argument("--families", type=int, default=3, help="Distinct answers among the members")
+    parser.add_argument("--length", type=int, default=2000, help="Characters per response")
+    parser.add_argument("--threshold", type=float, default=0.5, help="similarity_threshold")
+    parser.add_argument("--simhash-threshold", type=float, default=0.75, help="similarity_threshold for simhash (unrelated texts score ~0.5)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timing repeats (best is reported)")
+    args = parser.parse_args()
+
+    methods = [
+        ("difflib", {"similarity_method": "difflib"}),
+        ("minhash", {"similarity_method": "minhash", "lsh_min_responses": 10 ** 9}),
+        ("minhash+lsh", {"similarity_method": "minhash", "lsh_min_responses": 0}),
+        ("simhash", {"similarity_method": "simhash", "similarity_threshold": args.simhash_threshold}),
+    ]
+    print(f"Voting grouping, {args.length}-char responses, {args.families} answer families")
+    print(f"{'members':>8} {'method':>12} {'time':>11} {'speedup':>8} {'groups':>7}")
+    for members in args.members:
+        responses = make_responses(members, args.families, args.length, seed=members)
+        old, groups = best_of(lambda: legacy_group(responses, args.threshold, args.length), args.repeats)
+        print(f"{members:>8} {'legacy':>12} {old * 1000:>9.1f}ms {'1.0x':>8} {'ok' if families_recovered(groups) else 'MIXED':>7}")
+        for name, params in methods:
+            strategy = VotingStrategy(None, {"similarity_threshold": args.threshold, "answer_length": args.length, **params})
+            new, groups = best_of(lambda: strategy._group_similar_responses(responses), args.repeats)
+            print(f"{members:>8} {name:>12} {new * 1000:>9.1f}ms {old / new:>7.1f}x {'ok' if families_recovered(groups) else 'MIXED':>7}")
+
+
+if __name__ == "__main__":
+    main()
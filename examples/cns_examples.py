@@ -196,6 +196,8 @@ def cns_vote_binary():
             "require_majority": True,
             "fallback_to_all": False,
             "answer_length": 50,
+            "answer_extractor": "yes_no",
+            "early_stop": True,
         },
     )
     return orch.orchestrate(
@@ -749,6 +751,7 @@ def cns_math_olympiad():
             "require_majority": True,
             "fallback_to_all": True,
             "answer_length": 100,
+            "answer_extractor": r"regex:ANSWER:\s*(.+)",
         },
         system_prompt=(
             "Solve step by step. Show all work. State the final numerical answer "
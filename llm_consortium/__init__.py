@@ -48,11 +48,12 @@ __version__ = "0.8.0"
 
 # Import core classes for public API and to satisfy tests
 from .db import DatabaseConnection
-from .models import ConsortiumConfig, ConsortiumModel
+from .models import AsyncConsortiumModel, ConsortiumConfig, ConsortiumModel
 from .orchestrator import ConsortiumOrchestrator, IterationContext
 
 # Import CLI and model registration hooks for llm
 from .cli import register_commands
+from .embeddings.registry import warm_up, warmup_enabled_by_env
 import llm
 import json
 import logging
@@ -67,21 +68,26 @@ def register_models(register):
         if "consortium_configs" not in db.table_names():
             return
         
+        configs = []
         for row in db["consortium_configs"].rows:
             name = row.get("name")
             if name:
                 try:
                     config_data = json.loads(row.get("config", "{}"))
                     config = ConsortiumConfig.from_dict(config_data)
-                    model = ConsortiumModel(name, config)
-                    register(model)
+                    register(ConsortiumModel(name, config), AsyncConsortiumModel(name, config))
+                    configs.append(config)
                     logger.debug(f"Registered consortium model: {name}")
                 except Exception as e:
                     logger.error(f"Failed to register consortium model '{name}': {e}")
+        # Opt-in: load embedding models in the background so the first semantic run doesn't pay for it
+        if warmup_enabled_by_env():
+            warm_up(configs, background=True)
     except Exception as e:
         logger.error(f"Failed to register consortium models: {e}")
 
 __all__ = [
+    "AsyncConsortiumModel",
     "ConsortiumOrchestrator",
     "IterationContext",
     "ConsortiumConfig",
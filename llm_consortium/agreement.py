@@ -0,0 +1,56 @@
+"""Agreement checks that let an iteration skip the arbiter.
+
+When every member already gave essentially the same answer, an arbiter call adds
+latency and cost but nothing else. `check_agreement` decides whether responses
+agree and, if they do, which response best represents them:
+
+- `exact`: all responses are equal after the voting normalisation (score 1.0);
+  the first one represents them.
+- `similarity`: every pair's MinHash similarity of character shingles is at least
+  the threshold; the score is the smallest pairwise similarity and the response
+  most similar to the rest represents them.
+- `geometric`: the responses' geometric confidence (1 - mean cosine distance to
+  their centroid) is at least the threshold; the response nearest the centroid
+  represents them. Every response needs an embedding, so this suits the
+  semantic strategy.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .geometry import GeometryContext
+from .similarity import normalize_answer, pairwise_similarity
+
+ARBITER_SKIP_METHODS = ("off", "exact", "similarity", "geometric")
+
+
+def check_agreement(responses: List[Dict[str, Any]], method: str, threshold: float,
+                    context: Optional[GeometryContext] = None) -> Optional[Tuple[int, float]]:
+    """(representative index, agreement score) if the responses agree, else None.
+
+    `context` may supply the geometry for `geometric`; it must hold the responses
+    in the same order.
+    """
+    if method == "off" or len(responses) < 2:
+        return None
+    texts = [normalize_answer(response.get("response", "")) for response in responses]
+
+    if method == "exact":
+        return (0, 1.0) if texts[0] and len(set(texts)) == 1 else None
+
+    if method == "similarity":
+        if not all(texts):
+            return None
+        similarity = pairwise_similarity(texts, "minhash")
+        score = float(similarity[~np.eye(len(texts), dtype=bool)].min())
+        return (int(np.argmax(similarity.sum(axis=1))), score) if score >= threshold else None
+
+    if method == "geometric":
+        if context is None:
+            if any(response.get("embedding") is None for response in responses):
+                return None
+            context = GeometryContext.for_responses(responses)
+        score = context.confidence()
+        return (int(np.argmin(context.centroid_distances())), score) if score >= threshold else None
+
+    raise ValueError(f"arbiter_skip must be one of {', '.join(ARBITER_SKIP_METHODS)}")
@@ -0,0 +1,164 @@
+"""Answer extraction for structured voting.
+
+For binary, numeric and multiple-choice prompts the members' final answers can
+be pulled out of their responses and compared exactly. Each extractor returns
+a canonical string, or None when it finds no answer, so that equal answers are
+equal strings: numbers become reduced fractions ("0.50", "1/2" -> "1/2"; "1,000.0"
+-> "1000"), yes/no answers become "yes" or "no", and free text goes through the
+same normalisation as fuzzy voting.
+
+Extractors are chosen with a spec string:
+
+- `number`: the last number in the response
+- `yes_no`: the first standalone yes/no/true/false
+- `tag` or `tag:<name>`: the content of the last `<answer>` (or `<name>`) tag
+- `json` or `json:<field.path>`: a field of the first JSON object in the response
+- `regex:<pattern>`: the first group (or whole match) of the pattern's last match
+"""
+import json
+import re
+from decimal import Decimal, InvalidOperation
+from fractions import Fraction
+from typing import Any, Callable, Optional
+
+from .similarity import normalize_answer
+
+AnswerExtractor = Callable[[str], Optional[str]]
+
+_NUMBER = re.compile(
+    r"(?:(?<![\w.])-)?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:[eE][-+]?\d+)?(?:\s*/\s*\d+(?:\.\d+)?)?"
+)
+_YES_NO = re.compile(r"\b(yes|no|true|false)\b", re.IGNORECASE)
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+# Bounds on the numbers canonicalised exactly; anything bigger falls back to fuzzy grouping
+_MAX_DIGITS = 1000
+_MAX_EXPONENT = 1000
+
+
+def _bounded_fraction(text: str) -> Fraction:
+    """Exact value of a decimal string; raises ValueError for non-finite or oversized numbers."""
+    number = Decimal(text)
+    if not number.is_finite():
+        raise ValueError(f"not a finite number: {text!r}")
+    # Fraction(Decimal) expands the exponent exactly, so "1e199999999" would take minutes
+    sign, digits, exponent = number.as_tuple()
+    if len(digits) > _MAX_DIGITS or abs(exponent) > _MAX_EXPONENT:
+        raise ValueError(f"number too large to canonicalise: {text[:40]!r}")
+    return Fraction(number)
+
+
+def canonical_number(text: str) -> Optional[str]:
+    """A number (or a/b fraction) as its reduced fraction string, or None."""
+    numerator, _, denominator = text.replace(",", "").replace(" ", "").partition("/")
+    try:
+        value = _bounded_fraction(numerator)
+        if denominator:
+            value /= _bounded_fraction(denominator)
+        return str(value)
+    except (InvalidOperation, ValueError, OverflowError, ZeroDivisionError):
+        return None
+
+
+def canonical_answer(value: Any) -> Optional[str]:
+    """Canonical string for an extracted value: numbers reduced, text normalised."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, (int, float)):
+        try:
+            return canonical_number(repr(value))
+        except ValueError:
+            # Integers beyond the interpreter's int-to-str digit limit
+            return None
+    if not isinstance(value, str):
+        return json.dumps(value, sort_keys=True, separators=(",", ":"))
+    stripped = value.strip()
+    if _NUMBER.fullmatch(stripped):
+        return canonical_number(stripped)
+    return normalize_answer(stripped) or None
+
+
+def extract_number(text: str) -> Optional[str]:
+    matches = _NUMBER.findall(text)
+    return canonical_number(matches[-1]) if matches else None
+
+
+def extract_yes_no(text: str) -> Optional[str]:
+    match = _YES_NO.search(text)
+    if not match:
+        return None
+    return "yes" if match.group(1).lower() in ("yes", "true") else "no"
+
+
+def _tag_extractor(tag: str) -> AnswerExtractor:
+    pattern = re.compile(rf"<{re.escape(tag)}>(.*?)</{re.escape(tag)}>", re.DOTALL | re.IGNORECASE)
+
+    def extract(text: str) -> Optional[str]:
+        matches = pattern.findall(text)
+        return canonical_answer(matches[-1]) if matches else None
+    return extract
+
+
+def _first_json_object(text: str) -> Any:
+    candidates = _JSON_FENCE.findall(text) + [text]
+    decoder = json.JSONDecoder()
+    for candidate in candidates:
+        start = candidate.find("{")
+        while start != -1:
+            try:
+                return decoder.raw_decode(candidate, start)[0]
+            except ValueError:
+                # JSONDecodeError, or an integer literal beyond the int-to-str digit limit
+                start = candidate.find("{", start + 1)
+    return None
+
+
+def _json_extractor(path: str) -> AnswerExtractor:
+    keys = [key for key in path.split(".") if key]
+
+    def extract(text: str) -> Optional[str]:
+        value = _first_json_object(text)
+        for key in keys:
+            if isinstance(value, dict):
+                value = value.get(key)
+            elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            else:
+                return None
+        return canonical_answer(value)
+    return extract
+
+
+def _regex_extractor(pattern: str) -> AnswerExtractor:
+    compiled = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+
+    def extract(text: str) -> Optional[str]:
+        matches = list(compiled.finditer(text))
+        if not matches:
+            return None
+        match = matches[-1]
+        return canonical_answer(match.group(1) if compiled.groups else match.group(0))
+    return extract
+
+
+def get_answer_extractor(spec: str) -> AnswerExtractor:
+    """Extractor for a spec such as "number", "tag:final" or "regex:ANSWER:\\s*(.+)"."""
+    name, _, argument = spec.strip().partition(":")
+    name = name.strip().lower()
+    if name == "number":
+        return extract_number
+    if name in ("yes_no", "yesno", "boolean"):
+        return extract_yes_no
+    if name == "tag":
+        return _tag_extractor(argument.strip() or "answer")
+    if name == "json":
+        return _json_extractor(argument.strip() or "answer")
+    if name == "regex" and argument:
+        try:
+            return _regex_extractor(argument)
+        except re.error as e:
+            raise ValueError(f"Invalid answer_extractor pattern {argument!r}: {e}") from e
+    raise ValueError(
+        f"Unknown answer_extractor {spec!r}. Use number, yes_no, tag[:name], json[:field] or regex:<pattern>"
+    )
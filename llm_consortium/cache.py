@@ -0,0 +1,127 @@
+"""Opt-in SQLite cache of member responses.
+
+Entries are keyed by a hash of (model id, instance, instance system prompt, iteration
+prompt, options, previous turn). Automatic-context members chain the key of their
+previous turn, so a hit always implies the same conversation so far.
+
+`cache_policy` on ConsortiumConfig controls use:
+
+- ``off`` (default): never read or write.
+- ``read_write``: serve hits and store misses.
+- ``read_only``: serve hits, never store.
+- ``refresh``: always call the model and overwrite the stored entry.
+
+Setting ``LLM_CONSORTIUM_NO_CACHE=1`` (or the ``no_cache`` model option) bypasses the
+cache for a run regardless of policy.
+
+Expired entries are never served. They are swept out, together with entries beyond
+``max_entries``, at most once per ``sweep_interval_s`` rather than on every write.
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+
+from .db import DatabaseConnection, submit_write
+
+logger = logging.getLogger(__name__)
+
+CACHE_POLICIES = ("off", "read_write", "read_only", "refresh")
+DEFAULT_CACHE_TTL_S = 7 * 24 * 3600.0
+DEFAULT_CACHE_MAX_ENTRIES = 10000
+DEFAULT_SWEEP_INTERVAL_S = 60.0
+
+
+def cache_disabled_by_env() -> bool:
+    return os.environ.get("LLM_CONSORTIUM_NO_CACHE", "").lower() in ("1", "true", "yes")
+
+
+def normalize_options(options: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Prompt options as compared for caching: unset ones dropped, values as strings."""
+    return {str(name): str(value) for name, value in (options or {}).items() if value is not None}
+
+
+def member_cache_key(model_id: str, instance: int, system_prompt: Optional[str], prompt: str,
+                     options: Optional[Dict[str, Any]] = None, previous_key: Optional[str] = None) -> str:
+    payload = json.dumps(
+        [model_id, instance, system_prompt or "", prompt, normalize_options(options), previous_key or ""],
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemberResponseCache:
+    """TTL- and size-bounded member response store in the consortium logs database."""
+
+    def __init__(self, ttl_s: Optional[float] = DEFAULT_CACHE_TTL_S, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                 sweep_interval_s: float = DEFAULT_SWEEP_INTERVAL_S):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self.sweep_interval_s = sweep_interval_s
+        self._last_sweep: Optional[float] = None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            db = DatabaseConnection.get_connection()
+            row = db.conn.execute(
+                "SELECT response_text, response_id, response_json, created_at FROM member_response_cache WHERE key = ?",
+                [key],
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if self.ttl_s is not None and now - row[3] > self.ttl_s:
+                submit_write(_delete_entry, key)
+                return None
+            submit_write(_touch_entry, key, now)
+            return {"text": row[0], "response_id": row[1], "response_json": row[2]}
+        except Exception as e:
+            logger.error(f"Error reading member response cache: {e}")
+            return None
+
+    def put(self, key: str, model_id: str, text: str, response_id: Optional[str] = None,
+            response_json: Optional[str] = None) -> None:
+        # Written behind by the DB writer so member threads never wait on the commit
+        now = time.time()
+        sweep = self._last_sweep is None or now - self._last_sweep >= self.sweep_interval_s
+        if sweep:
+            self._last_sweep = now
+        submit_write(_put_entry, key, model_id, text, response_id, response_json, now,
+                     self.ttl_s if sweep else None, self.max_entries if sweep else 0)
+
+
+def _delete_entry(db, key: str) -> None:
+    db.conn.execute("DELETE FROM member_response_cache WHERE key = ?", [key])
+
+
+def _touch_entry(db, key: str, now: float) -> None:
+    db.conn.execute(
+        "UPDATE member_response_cache SET last_used_at = ?, hits = hits + 1 WHERE key = ?",
+        [now, key],
+    )
+
+
+def _put_entry(db, key: str, model_id: str, text: str, response_id: Optional[str], response_json: Optional[str],
+               now: float, ttl_s: Optional[float], max_entries: int) -> None:
+    db.conn.execute(
+        """
+        INSERT OR REPLACE INTO member_response_cache
+            (key, model, response_text, response_id, response_json, created_at, last_used_at, hits)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+        """,
+        [key, model_id, text, response_id, response_json, now, now],
+    )
+    # ttl_s / max_entries are only passed when this write is due to sweep
+    if ttl_s is not None:
+        db.conn.execute("DELETE FROM member_response_cache WHERE created_at < ?", [now - ttl_s])
+    if max_entries:
+        db.conn.execute(
+            """
+            DELETE FROM member_response_cache WHERE key IN (
+                SELECT key FROM member_response_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            [max_entries],
+        )
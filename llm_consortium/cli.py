@@ -6,6 +6,7 @@ import llm
 
 from .db import DatabaseConnection
 from .models import ConsortiumConfig, parse_models, _save_consortium_config, _get_consortium_configs
+from .ratelimit import parse_rate_limit_spec
 from .strategies.factory import list_available_strategies
 
 logger = logging.getLogger(__name__)
@@ -61,6 +62,17 @@ def register_commands(cli):
         help="Model to use as arbiter",
         required=True
     )
+    @click.option(
+        "--escalate-to", "arbiter_escalation",
+        multiple=True,
+        help="Stronger arbiter to ask when the previous one's confidence is too low or its output cannot be parsed. Repeat for a longer cascade, cheapest first.",
+    )
+    @click.option(
+        "--escalation-threshold",
+        type=click.FloatRange(min=0, max=1),
+        default=None,
+        help="Arbiter confidence below which --escalate-to arbiters are asked (defaults to the confidence threshold).",
+    )
     @click.option(
         "--confidence-threshold",
         type=float,
@@ -101,9 +113,9 @@ def register_commands(cli):
     )
     @click.option(
         "--embedding-backend",
-        type=click.Choice(["openai", "sentence-transformers", "chutes"], case_sensitive=False),
+        type=click.Choice(["openai", "sentence-transformers", "chutes", "hashing"], case_sensitive=False),
         default=None,
-        help="Embedding backend (openai, sentence-transformers, chutes)."
+        help="Embedding backend (openai, sentence-transformers, chutes, or hashing for offline deterministic embeddings)."
     )
     @click.option(
         "--embedding-model",
@@ -114,13 +126,13 @@ def register_commands(cli):
         "--clustering-algorithm",
         type=click.Choice(["dbscan", "hdbscan", "tropical"], case_sensitive=False),
         default=None,
-        help="Semantic clustering algorithm to use."
+        help="Semantic clustering algorithm: dbscan, hdbscan or tropical (DBSCAN on tropical distances)."
     )
     @click.option(
         "--cluster-eps",
         type=float,
         default=0.5,
-        help="DBSCAN epsilon parameter."
+        help="DBSCAN epsilon; for hdbscan, the cluster selection epsilon."
     )
     @click.option(
         "--cluster-min-samples",
@@ -128,15 +140,134 @@ def register_commands(cli):
         default=2,
         help="Minimum points required to form a semantic cluster."
     )
+    @click.option(
+        "--min-quorum",
+        type=float,
+        default=None,
+        help="Start synthesis once this many members have answered (a count, or a fraction below 1)."
+    )
+    @click.option(
+        "--member-deadline",
+        type=float,
+        default=None,
+        help="Seconds to wait for slower members once the quorum is met."
+    )
+    @click.option(
+        "--max-concurrency",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Maximum member calls in flight for one run of this consortium."
+    )
+    @click.option(
+        "--global-max-concurrency",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Cap on sync member calls across all concurrent runs of this consortium. The process-wide pool is sized by LLM_CONSORTIUM_MAX_WORKERS (default 64)."
+    )
+    @click.option(
+        "--max-retries",
+        type=click.IntRange(min=0),
+        default=2,
+        help="Retries with jittered backoff for transient member errors (rate limits, timeouts, 5xx). Default 2."
+    )
+    @click.option(
+        "--breaker-threshold",
+        type=click.IntRange(min=0),
+        default=5,
+        help="Consecutive failures before a model's circuit breaker opens and it is skipped (0 disables). Default 5."
+    )
+    @click.option(
+        "--breaker-reset",
+        type=click.FloatRange(min=0),
+        default=60.0,
+        help="Seconds before an open circuit breaker lets a probe call through. Default 60."
+    )
+    @click.option(
+        "--cache-policy",
+        type=click.Choice(["off", "read_write", "read_only", "refresh"], case_sensitive=False),
+        default="off",
+        help="Reuse member responses for identical (model, system prompt, prompt) calls. Bypass per run with -o no_cache 1 or LLM_CONSORTIUM_NO_CACHE=1."
+    )
+    @click.option(
+        "--cache-ttl",
+        type=click.FloatRange(min=0, min_open=True),
+        default=None,
+        help="Seconds a cached member response stays valid (default 7 days)."
+    )
+    @click.option(
+        "--embedding-cache-size",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Embeddings kept in the persistent cache shared across processes (default 50000; 0 disables it)."
+    )
+    @click.option(
+        "--semantic-cache",
+        is_flag=True,
+        default=False,
+        help="Answer near-duplicate prompts from a previous run's synthesis (requires --embedding-backend)."
+    )
+    @click.option(
+        "--semantic-cache-distance",
+        type=click.FloatRange(min=0, max=2),
+        default=0.05,
+        help="Maximum cosine distance between prompt embeddings for a semantic cache hit. Default 0.05."
+    )
+    @click.option(
+        "--semantic-cache-max-age",
+        type=click.FloatRange(min=0, min_open=True),
+        default=None,
+        help="Seconds a past run stays eligible for semantic cache hits (default 1 day)."
+    )
+    @click.option(
+        "--fan-in", "hierarchical_fan_in",
+        type=click.IntRange(min=2),
+        default=None,
+        help="Most member responses in one arbiter prompt. Larger fan-outs are split into groups that sub-arbiters synthesise in parallel before a final merge.",
+    )
+    @click.option(
+        "--max-depth", "hierarchical_max_depth",
+        type=click.IntRange(min=1),
+        default=2,
+        help="Levels of sub-synthesis at most before the final merge (with --fan-in). Default 2.",
+    )
+    @click.option(
+        "--partition", "hierarchical_partition",
+        type=click.Choice(["round_robin", "embedding"], case_sensitive=False),
+        default="round_robin",
+        help="How --fan-in groups are formed: round_robin, or embedding to group similar responses (needs --embedding-backend).",
+    )
+    @click.option(
+        "--arbiter-skip",
+        type=click.Choice(["off", "exact", "similarity", "geometric"], case_sensitive=False),
+        default="off",
+        help="Skip the arbiter when members already agree: identical normalised answers (exact), MinHash similarity, or geometric confidence (needs --embedding-backend)."
+    )
+    @click.option(
+        "--arbiter-skip-threshold",
+        type=click.FloatRange(min=0, max=1),
+        default=0.9,
+        help="Agreement score the similarity and geometric checks must reach to skip the arbiter. Default 0.9."
+    )
+    @click.option(
+        "--rate-limit", "rate_limits_list",
+        type=(str, str),
+        multiple=True,
+        metavar="MODEL SPEC",
+        help="Client-side limit for a model id or provider prefix, e.g. --rate-limit openrouter/ rps=2,burst=4,max_in_flight=3. Can be provided multiple times.",
+    )
     @click.option(
         "--strategy-param", "strategy_params_list",
         multiple=True,
         help="Parameters for the strategy, format KEY=VALUE. Can be provided multiple times.",
     )
-    def save_command(name, models, count, arbiter, confidence_threshold, max_iterations,
+    def save_command(name, models, count, arbiter, arbiter_escalation, escalation_threshold, confidence_threshold, max_iterations,
                      min_iterations, system_prompt_content, judging_method, manual_context, strategy,
                      embedding_backend, embedding_model, clustering_algorithm, cluster_eps, cluster_min_samples,
-                     strategy_params_list):
+                     min_quorum, member_deadline, max_concurrency, global_max_concurrency, max_retries,
+                     breaker_threshold, breaker_reset, cache_policy, cache_ttl, embedding_cache_size, semantic_cache,
+                     semantic_cache_distance, semantic_cache_max_age, hierarchical_fan_in, hierarchical_max_depth,
+                     hierarchical_partition, arbiter_skip, arbiter_skip_threshold,
+                     rate_limits_list, strategy_params_list):
         """Save a consortium configuration to be used as a model."""
         
         model_dict = parse_models(models, count)
@@ -154,9 +285,27 @@ def register_commands(cli):
         elif confidence_threshold < 0.0:
              raise click.UsageError("Confidence threshold must be non-negative.")
 
+        if semantic_cache and not embedding_backend:
+             raise click.UsageError("--semantic-cache requires --embedding-backend.")
+        if arbiter_skip.lower() == "geometric" and not embedding_backend:
+             raise click.UsageError("--arbiter-skip geometric requires --embedding-backend.")
+        if min_quorum is not None and min_quorum <= 0:
+             raise click.UsageError("--min-quorum must be positive.")
+        if member_deadline is not None and member_deadline < 0:
+             raise click.UsageError("--member-deadline must be non-negative.")
+
+        rate_limits = {}
+        for pattern, spec in rate_limits_list:
+            try:
+                rate_limits[pattern] = parse_rate_limit_spec(spec)
+            except ValueError as e:
+                raise click.UsageError(f"Invalid --rate-limit for '{pattern}': {e}")
+
         config = ConsortiumConfig(
             models=model_dict,
             arbiter=arbiter,
+            arbiter_escalation=list(arbiter_escalation) or None,
+            arbiter_escalation_threshold=escalation_threshold,
             confidence_threshold=confidence_threshold,
             max_iterations=max_iterations,
             minimum_iterations=min_iterations,
@@ -166,8 +315,30 @@ def register_commands(cli):
             strategy_params=strategy_params,
             embedding_backend=embedding_backend,
             embedding_model=embedding_model,
-            manual_context=manual_context
+            manual_context=manual_context,
+            min_quorum=min_quorum,
+            member_deadline_s=member_deadline,
+            max_concurrency=max_concurrency,
+            global_max_concurrency=global_max_concurrency,
+            max_retries=max_retries,
+            breaker_failure_threshold=breaker_threshold,
+            breaker_reset_s=breaker_reset,
+            rate_limits=rate_limits or None,
+            cache_policy=cache_policy,
+            semantic_cache_enabled=semantic_cache,
+            semantic_cache_max_distance=semantic_cache_distance,
+            hierarchical_fan_in=hierarchical_fan_in,
+            hierarchical_max_depth=hierarchical_max_depth,
+            hierarchical_partition=hierarchical_partition,
+            arbiter_skip=arbiter_skip,
+            arbiter_skip_threshold=arbiter_skip_threshold,
         )
+        if cache_ttl is not None:
+            config.cache_ttl_s = cache_ttl
+        if semantic_cache_max_age is not None:
+            config.semantic_cache_max_age_s = semantic_cache_max_age
+        if embedding_cache_size is not None:
+            config.embedding_cache_max_entries = embedding_cache_size
         try:
             _save_consortium_config(name, config)
             click.echo(f"Consortium configuration '{name}' saved.")
@@ -208,6 +379,9 @@ def register_commands(cli):
             click.echo(f"Name: {name}")
             click.echo(f"  Models: {', '.join(f'{k}:{v}' for k, v in config.models.items())}")
             click.echo(f"  Arbiter: {config.arbiter}")
+            if config.arbiter_escalation:
+                threshold = config.arbiter_escalation_threshold
+                click.echo(f"  Escalates To: {', '.join(config.arbiter_escalation)} (below {config.confidence_threshold if threshold is None else threshold})")
             click.echo(f"  Confidence Threshold: {config.confidence_threshold}")
             click.echo(f"  Max Iterations: {config.max_iterations}")
             click.echo(f"  Min Iterations: {config.minimum_iterations}")
@@ -217,6 +391,21 @@ def register_commands(cli):
             click.echo(f"  System Prompt: {system_prompt_display or 'Default'}")
             click.echo(f"  Judging Method: {config.judging_method}")
             click.echo(f"  Context Mode: {'Manual' if config.manual_context else 'Automatic'}")
+            if config.min_quorum is not None or config.member_deadline_s is not None:
+                click.echo(f"  Quorum: {config.min_quorum or 1} (deadline: {config.member_deadline_s or 0}s)")
+            if config.max_concurrency or config.global_max_concurrency:
+                click.echo(f"  Concurrency: {config.max_concurrency or 'unlimited'} per run, {config.global_max_concurrency or 'unlimited'} across runs")
+            if config.cache_policy != "off":
+                click.echo(f"  Member Cache: {config.cache_policy} (ttl {config.cache_ttl_s or 'none'}s, max {config.cache_max_entries})")
+            if config.semantic_cache_enabled:
+                click.echo(f"  Semantic Cache: distance <= {config.semantic_cache_max_distance}, max age {config.semantic_cache_max_age_s or 'none'}s")
+            if config.hierarchical_fan_in:
+                click.echo(f"  Hierarchical Synthesis: fan-in {config.hierarchical_fan_in}, depth {config.hierarchical_max_depth}, {config.hierarchical_partition} groups")
+            if config.arbiter_skip != "off":
+                click.echo(f"  Arbiter Skip: {config.arbiter_skip} (threshold {config.arbiter_skip_threshold})")
+            for pattern, limits in (config.rate_limits or {}).items():
+                spec = ", ".join(f"{key}={value:g}" for key, value in limits.items())
+                click.echo(f"  Rate Limit: {pattern} ({spec})")
             click.echo("")
 
 
@@ -301,7 +490,7 @@ def register_commands(cli):
         decisions = list(db.query(
             "SELECT ad.*, r.response as full_response FROM arbiter_decisions ad "
             "JOIN responses r ON ad.response_id = r.id "
-            "WHERE ad.run_id = ? ORDER BY ad.iteration", 
+            "WHERE ad.run_id = ? ORDER BY ad.iteration, ad.attempt", 
             [consortium_id]
         ))
 
@@ -321,9 +510,10 @@ def register_commands(cli):
         
         for iteration in range(1, run_data.get('max_iterations', 0) + 1):
             iter_members = [m for m in members if m['iteration'] == iteration]
-            iter_decision = next((d for d in decisions if d['iteration'] == iteration), None)
+            iter_decisions = [d for d in decisions if d['iteration'] == iteration]
+            iter_decision = next((d for d in iter_decisions if not d.get('escalated')), None)
             
-            if not iter_members and not iter_decision:
+            if not iter_members and not iter_decisions:
                 continue
                 
             click.echo(f"\n--- Iteration {iteration} ---")
@@ -337,6 +527,9 @@ def register_commands(cli):
                         content = content[:97] + "..."
                     click.echo(f"    {content}")
             
+            for escalated in (d for d in iter_decisions if d.get('escalated')):
+                click.echo(f"\n  Escalated from {escalated.get('arbiter_model')} ({escalated.get('escalation_reason')}, confidence {escalated.get('confidence')})")
+
             if iter_decision:
                 click.echo(f"\n  Arbiter Decision (Confidence: {iter_decision.get('confidence')}, Geometric: {iter_decision.get('geometric_confidence')}):")
                 click.echo(f"    Synthesis: {iter_decision.get('synthesis')}")
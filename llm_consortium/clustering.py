@@ -0,0 +1,275 @@
+"""NumPy-only clustering over a precomputed distance matrix.
+
+A semantic iteration clusters a few dozen response embeddings at most, and the
+GeometryContext already holds their pairwise distances. Importing scikit-learn for
+that costs seconds and a large footprint, so these small implementations run on
+the matrix directly:
+
+- `dbscan` gives the same labels as `sklearn.cluster.DBSCAN(metric="precomputed")`:
+  neighbourhoods are `distance <= eps` including the point itself, and clusters are
+  numbered in order of their first core point.
+- `hdbscan` follows the reference HDBSCAN algorithm: mutual-reachability distances,
+  a Prim minimum spanning tree, single linkage, the condensed tree, and
+  excess-of-mass cluster selection. It gives the same labels as
+  `sklearn.cluster.HDBSCAN(metric="precomputed")`, including how ties between
+  equal-weight edges are broken.
+- `tropical_distances` is the tropical (max-plus projective) metric between vectors,
+  scaled into [0, 1] so DBSCAN's eps keeps its meaning.
+"""
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+def dbscan(distances: np.ndarray, eps: float, min_samples: int) -> np.ndarray:
+    """DBSCAN labels (-1 for noise) for a square distance matrix."""
+    n = distances.shape[0]
+    labels = np.full(n, -1, dtype=np.intp)
+    if n == 0:
+        return labels
+    adjacency = distances <= eps
+    is_core = adjacency.sum(axis=1) >= min_samples
+
+    # Each cluster is the set of cores reachable from its lowest-index core,
+    # grown a whole frontier at a time
+    label = 0
+    for start in np.flatnonzero(is_core):
+        if labels[start] != -1:
+            continue
+        members = np.zeros(n, dtype=bool)
+        members[start] = True
+        frontier = members
+        while frontier.any():
+            frontier = adjacency[frontier].any(axis=0) & is_core & ~members
+            members |= frontier
+        labels[members] = label
+        label += 1
+
+    # A border point joins the first (lowest-numbered) cluster that reaches it
+    if label:
+        core_labels = np.where(adjacency[:, is_core], labels[is_core][None, :], label)
+        border = ~is_core & adjacency[:, is_core].any(axis=1)
+        labels[border] = core_labels[border].min(axis=1)
+    return labels
+
+
+_MIN_DISTANCE = 1e-12
+
+
+def _mutual_reachability(distances: np.ndarray, min_samples: int) -> np.ndarray:
+    k = min(min_samples, distances.shape[0]) - 1
+    core = np.partition(distances, k, axis=1)[:, k]
+    return np.maximum(distances, np.maximum.outer(core, core))
+
+
+def _prim_mst(weights: np.ndarray) -> np.ndarray:
+    """(n - 1, 3) rows of (from, to, weight), in the order Prim's algorithm adds them."""
+    n = weights.shape[0]
+    in_tree = np.zeros(n, dtype=bool)
+    best = np.full(n, np.inf)
+    edges = np.empty((n - 1, 3))
+    current = 0
+    for i in range(n - 1):
+        in_tree[current] = True
+        best = np.where(in_tree, np.inf, np.minimum(best, weights[current]))
+        nearest = int(np.argmin(best))
+        edges[i] = (current, nearest, best[nearest])
+        current = nearest
+    return edges
+
+
+def _single_linkage(edges: np.ndarray, n: int) -> np.ndarray:
+    """scipy-style linkage: row i merges nodes (left, right) at distance into node n + i."""
+    order = np.argsort(edges[:, 2])
+    parent = np.arange(2 * n - 1)
+    size = np.ones(2 * n - 1, dtype=np.intp)
+
+    def find(x: int) -> int:
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    linkage = np.empty((n - 1, 4))
+    for i, edge in enumerate(order):
+        a, b, distance = int(edges[edge, 0]), int(edges[edge, 1]), edges[edge, 2]
+        left, right = find(a), find(b)
+        node = n + i
+        parent[left] = parent[right] = node
+        size[node] = size[left] + size[right]
+        linkage[i] = (left, right, distance, size[node])
+    return linkage
+
+
+def _leaves(linkage: np.ndarray, node: int, n: int) -> List[int]:
+    leaves, stack = [], [node]
+    while stack:
+        current = stack.pop()
+        if current < n:
+            leaves.append(current)
+        else:
+            left, right = linkage[current - n, :2]
+            stack.extend((int(right), int(left)))
+    return leaves
+
+
+def _condense(linkage: np.ndarray, n: int, min_cluster_size: int) -> List[Tuple[int, int, float, int]]:
+    """Condensed tree rows (parent cluster, child cluster or point, lambda, child size)."""
+    root = 2 * n - 2
+    relabel = {root: n}
+    next_label = n + 1
+    rows: List[Tuple[int, int, float, int]] = []
+    queue = [root]
+    while queue:
+        node = queue.pop(0)
+        left, right, distance, _ = linkage[node - n]
+        left, right = int(left), int(right)
+        # Identical responses merge at distance 0; a finite lambda keeps stabilities comparable
+        lam = 1.0 / max(distance, _MIN_DISTANCE)
+        sizes = [int(linkage[child - n, 3]) if child >= n else 1 for child in (left, right)]
+        big = [size >= min_cluster_size for size in sizes]
+        cluster = relabel[node]
+        for child, size, is_big in zip((left, right), sizes, big):
+            if is_big and all(big):
+                relabel[child] = next_label
+                rows.append((cluster, next_label, lam, size))
+                next_label += 1
+                queue.append(child)
+            elif is_big:
+                # The cluster carries on under the larger child; the small side falls out
+                relabel[child] = cluster
+                queue.append(child)
+            else:
+                rows.extend((cluster, point, lam, 1) for point in _leaves(linkage, child, n))
+    return rows
+
+
+def _select_clusters(rows: List[Tuple[int, int, float, int]], n: int, allow_single_cluster: bool) -> List[int]:
+    births: Dict[int, float] = {n: 0.0}
+    for _, child, lam, size in rows:
+        if size > 1:
+            births[child] = lam
+    stability: Dict[int, float] = {cluster: 0.0 for cluster in births}
+    for parent, _, lam, size in rows:
+        stability[parent] += (lam - births[parent]) * size
+    children: Dict[int, List[int]] = {}
+    for parent, child, _, size in rows:
+        if size > 1:
+            children.setdefault(parent, []).append(child)
+
+    nodes = sorted(stability, reverse=True)
+    if not allow_single_cluster:
+        nodes = [node for node in nodes if node != n]
+    selected = {node: True for node in nodes}
+    for node in nodes:
+        subtree = sum(stability[child] for child in children.get(node, []))
+        if subtree > stability[node]:
+            selected[node] = False
+            stability[node] = subtree
+        else:
+            stack = list(children.get(node, []))
+            while stack:
+                descendant = stack.pop()
+                selected[descendant] = False
+                stack.extend(children.get(descendant, []))
+    return sorted(node for node, keep in selected.items() if keep)
+
+
+def _epsilon_search(selected: List[int], rows: List[Tuple[int, int, float, int]], n: int,
+                    epsilon: float, allow_single_cluster: bool) -> List[int]:
+    """Replace selected clusters born closer than epsilon by their nearest ancestor born beyond it."""
+    if selected == [n]:
+        return selected if allow_single_cluster else []
+    parent_of = {child: parent for parent, child, _, size in rows if size > 1}
+    birth = {child: 1.0 / lam for _, child, lam, size in rows if size > 1}
+    children: Dict[int, List[int]] = {}
+    for child, parent in parent_of.items():
+        children.setdefault(parent, []).append(child)
+
+    def upwards(leaf: int) -> int:
+        parent = parent_of[leaf]
+        if parent == n:
+            return parent if allow_single_cluster else leaf
+        return parent if birth[parent] > epsilon else upwards(parent)
+
+    chosen: List[int] = []
+    processed = set()
+    for leaf in sorted(selected):
+        if birth[leaf] >= epsilon:
+            chosen.append(leaf)
+        elif leaf not in processed:
+            ancestor = upwards(leaf)
+            chosen.append(ancestor)
+            stack = list(children.get(ancestor, []))
+            while stack:
+                descendant = stack.pop()
+                processed.add(descendant)
+                stack.extend(children.get(descendant, []))
+    return sorted(set(chosen))
+
+
+def hdbscan(distances: np.ndarray, min_cluster_size: int, min_samples: Optional[int] = None,
+            allow_single_cluster: bool = False, cluster_selection_epsilon: float = 0.0) -> np.ndarray:
+    """HDBSCAN labels (-1 for noise) for a square distance matrix.
+
+    `cluster_selection_epsilon` merges clusters that split below that distance and,
+    when everything forms a single cluster, keeps each point that joined it within
+    that distance (otherwise only the points that stay until the cluster dissolves).
+    """
+    n = distances.shape[0]
+    labels = np.full(n, -1, dtype=np.intp)
+    if n < 2 or n < min_cluster_size:
+        return labels
+    min_cluster_size = max(2, min_cluster_size)
+    weights = _mutual_reachability(distances, min_samples or min_cluster_size)
+    linkage = _single_linkage(_prim_mst(weights), n)
+    rows = _condense(linkage, n, min_cluster_size)
+    clusters = _select_clusters(rows, n, allow_single_cluster)
+    if cluster_selection_epsilon and any(size > 1 for _, _, _, size in rows):
+        clusters = _epsilon_search(clusters, rows, n, cluster_selection_epsilon, allow_single_cluster)
+    if not clusters:
+        return labels
+
+    # Each point belongs to the cluster it fell out of, followed up to a selected one
+    parent_of = {child: parent for parent, child, _, size in rows if size > 1}
+    label_of = {cluster: i for i, cluster in enumerate(clusters)}
+    if cluster_selection_epsilon:
+        root_threshold = 1.0 / cluster_selection_epsilon
+    else:
+        root_threshold = max((lam for parent, _, lam, _ in rows if parent == n), default=0.0)
+    for parent, point, lam, size in rows:
+        if size != 1:
+            continue
+        cluster = parent
+        while cluster not in label_of and cluster in parent_of:
+            cluster = parent_of[cluster]
+        if cluster not in label_of:
+            continue
+        if cluster == n and lam < root_threshold:
+            # In single-cluster mode, points that fell away early are still noise
+            continue
+        labels[point] = label_of[cluster]
+    return labels
+
+
+def tropical_distances(matrix: np.ndarray, block_elements: int = 1 << 22) -> np.ndarray:
+    """Pairwise tropical distances, scaled into [0, 1].
+
+    The tropical projective distance is d(x, y) = max(x - y) - min(x - y). It is
+    divided by d(x, 0) + d(y, 0) (each vector's own range), which bounds it by 1 and
+    makes it independent of the embedding dimension.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    n = matrix.shape[0]
+    spans = matrix.max(axis=1) - matrix.min(axis=1) if matrix.size else np.zeros(n, dtype=np.float32)
+    distances = np.zeros((n, n), dtype=np.float32)
+    step = max(1, block_elements // max(1, n * max(1, matrix.shape[1])))
+    for start in range(0, n, step):
+        diff = matrix[start:start + step, None, :] - matrix[None, :, :]
+        distances[start:start + step] = diff.max(axis=2) - diff.min(axis=2)
+    scale = np.add.outer(spans, spans)
+    scaled = np.divide(distances, scale, out=np.zeros_like(distances), where=scale > 0)
+    np.fill_diagonal(scaled, 0.0)
+    return np.clip(scaled, 0.0, 1.0)
@@ -1,7 +1,11 @@
+import atexit
 import logging
+import os
+import queue
 import threading
+import time
 import sqlite_utils
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List, Tuple
 import datetime
 import json
 import sqlite3
@@ -9,6 +13,9 @@ import pathlib
 import click
 import numpy as np
 
+from .migrations import migrate
+from .vectors import VECTOR_DTYPE, VectorLike, pack_vector, stack_vectors, unpack_vector
+
 logger = logging.getLogger(__name__)
 
 def user_dir() -> pathlib.Path:
@@ -20,98 +27,260 @@ def logs_db_path() -> pathlib.Path:
     """Get path to logs database."""
     return user_dir() / "consortium_logs.db"
 
+# Applied to every connection. WAL lets the writer thread commit while other threads
+# read; NORMAL sync is durable across application crashes in WAL mode and avoids an
+# fsync per commit.
+CONNECTION_PRAGMAS = (
+    ("synchronous", "NORMAL"),
+    ("cache_size", -16000),  # KiB, i.e. ~16 MB of page cache per connection
+    ("mmap_size", 128 * 1024 * 1024),
+    ("temp_store", "MEMORY"),
+)
+
 class DatabaseConnection:
     _thread_local = threading.local()
+    # Every open connection and the thread that owns it, so connections belonging to
+    # finished threads can be closed instead of leaking
+    _connections: Dict[int, tuple] = {}
+    # (pid, db path) pairs whose migrations have been applied in this process
+    _initialized: set = set()
+    _lock = threading.Lock()
 
     @classmethod
     def get_connection(cls) -> sqlite_utils.Database:
         """Get thread-local database connection to ensure thread safety."""
-        if not hasattr(cls._thread_local, 'db'):
-            # Use timeout=30 to wait for locks instead of failing immediately
-            conn = sqlite3.connect(logs_db_path(), timeout=30)
+        path = logs_db_path()
+        # Long-lived threads (the DB writer, shared pool workers) reconnect if the logs DB moves
+        if not hasattr(cls._thread_local, 'db') or getattr(cls._thread_local, 'path', path) != path:
+            cls._reap()
+            key = (os.getpid(), str(path))
+            needs_schema = key not in cls._initialized or not path.exists()
+            # Use timeout=30 to wait for locks instead of failing immediately. Connections
+            # are only used by their own thread but may be closed by another once it exits.
+            conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
             db = sqlite_utils.Database(conn)
+            for pragma, value in CONNECTION_PRAGMAS:
+                conn.execute(f"PRAGMA {pragma} = {value}")
+            if needs_schema:
+                with cls._lock:
+                    if key not in cls._initialized or not path.exists():
+                        cls._init_schema(db)
+                        cls._initialized.add(key)
+            cls._register(db)
             cls._thread_local.db = db
-            
-            # Initialize consortium schema
-            db.execute("""
-                CREATE TABLE IF NOT EXISTS consortium_runs (
-                    id TEXT PRIMARY KEY,
-                    created_at TEXT,
-                    config_name TEXT,
-                    strategy TEXT,
-                    judging_method TEXT,
-                    confidence_threshold REAL,
-                    max_iterations INTEGER,
-                    iteration_count INTEGER,
-                    final_confidence REAL,
-                    user_prompt TEXT,
-                    category TEXT,
-                    expected_agreement REAL,
-                    status TEXT,
-                    FOREIGN KEY (config_name) REFERENCES consortium_configs(name)
-                )
-            """)
-            db.execute("""
-                CREATE TABLE IF NOT EXISTS consortium_members (
-                    run_id TEXT,
-                    response_id TEXT,
-                    role TEXT,
-                    iteration INTEGER,
-                    member_index INTEGER,
-                    PRIMARY KEY (run_id, response_id),
-                    FOREIGN KEY (run_id) REFERENCES consortium_runs(id),
-                    FOREIGN KEY (response_id) REFERENCES responses(id)
-                )
-            """)
-            db.execute("""
-                CREATE TABLE IF NOT EXISTS arbiter_decisions (
-                    run_id TEXT,
-                    iteration INTEGER,
-                    response_id TEXT,
-                    chosen_response_id TEXT,
-                    confidence REAL,
-                    synthesis TEXT,
-                    decision_json TEXT,
-                    ranking_json TEXT,
-                    refinement_areas TEXT,
-                    geometric_confidence REAL,
-                    centroid_vector TEXT,
-                    PRIMARY KEY (run_id, iteration),
-                    FOREIGN KEY (run_id) REFERENCES consortium_runs(id),
-                    FOREIGN KEY (response_id) REFERENCES responses(id),
-                    FOREIGN KEY (chosen_response_id) REFERENCES responses(id)
-                )
-            """)
-            db.execute("""
-                CREATE TABLE IF NOT EXISTS consortium_configs (
-                    name TEXT PRIMARY KEY,
-                    config TEXT NOT NULL,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            cls._thread_local.path = path
         return cls._thread_local.db
 
-def log_response(response, model: str, consortium_run_id: Optional[str] = None):
-    """Log model response to database and log file."""
-    try:
-        db = DatabaseConnection.get_connection()
-        response.log_to_db(db)
-        
-        logger.debug(f"Response from {model} logged to database")
+    @staticmethod
+    def _init_schema(db: sqlite_utils.Database) -> None:
+        # journal_mode is persistent, so it only needs setting when the file is set up
+        db.conn.execute("PRAGMA journal_mode = WAL")
+        migrate(db)
 
-        # Explicitly commit to release any locks held by this thread
-        db.conn.commit()
+    @classmethod
+    def _register(cls, db: sqlite_utils.Database) -> None:
+        thread = threading.current_thread()
+        with cls._lock:
+            previous = cls._connections.get(thread.ident)
+            cls._connections[thread.ident] = (thread, db)
+        if previous is not None and previous[1] is not db:
+            _close_quietly(previous[1])
 
-        # Check for truncation in various formats
-        if response.response_json:
-            finish_reason = _get_finish_reason(response.response_json)
-            truncation_indicators = ['length', 'max_tokens', 'max_token']
+    @classmethod
+    def _reap(cls) -> None:
+        """Close connections whose owning thread has exited."""
+        with cls._lock:
+            dead = [ident for ident, (thread, _) in cls._connections.items() if not thread.is_alive()]
+            closing = [cls._connections.pop(ident)[1] for ident in dead]
+        for db in closing:
+            _close_quietly(db)
 
-            if finish_reason and any(indicator in finish_reason for indicator in truncation_indicators):
-                logger.warning(f"Response from {model} truncated. Reason: {finish_reason}")
+    @classmethod
+    def close_connection(cls) -> None:
+        """Close the calling thread's connection, if any (e.g. at the end of a worker's life)."""
+        db = getattr(cls._thread_local, 'db', None)
+        if db is None:
+            return
+        del cls._thread_local.db
+        with cls._lock:
+            entry = cls._connections.get(threading.get_ident())
+            if entry is not None and entry[1] is db:
+                del cls._connections[threading.get_ident()]
+        _close_quietly(db)
 
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every tracked connection; threads reconnect on their next access."""
+        with cls._lock:
+            closing = [db for _, db in cls._connections.values()]
+            cls._connections.clear()
+        for db in closing:
+            _close_quietly(db)
+        if hasattr(cls._thread_local, 'db'):
+            del cls._thread_local.db
+
+
+def _close_quietly(db: sqlite_utils.Database) -> None:
+    try:
+        db.conn.close()
     except Exception as e:
-        logger.error(f"Error logging to database: {e}")
+        logger.debug(f"Error closing consortium DB connection: {e}")
+
+DEFAULT_WRITE_QUEUE_SIZE = 10000
+DEFAULT_WRITE_BATCH_SIZE = 256
+DEFAULT_FLUSH_TIMEOUT_S = 30.0
+ATEXIT_FLUSH_TIMEOUT_S = 10.0
+_FLUSH_POLL_S = 0.1
+
+
+class BackgroundWriter:
+    """
+    Write-behind logger: one daemon thread applies queued writes in group commits.
+
+    Callers enqueue `fn(db, *args)` and return immediately; the writer drains up to
+    `batch_size` queued writes, runs each inside its own savepoint and commits the batch
+    once. The queue is bounded, so a writer that falls far behind applies backpressure
+    instead of growing without limit. `flush()` blocks until everything queued before
+    it is committed, or its timeout passes; if the writer thread has died, the caller
+    applies the queued writes itself. Set LLM_CONSORTIUM_SYNC_WRITES=1 to write inline
+    instead.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_WRITE_QUEUE_SIZE, batch_size: int = DEFAULT_WRITE_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._maxsize = maxsize
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def reset_after_fork(self) -> None:
+        """In a forked child the writer thread is gone and its locks may be held; start afresh.
+
+        Writes queued before the fork belong to the parent, which still commits them.
+        """
+        self._queue = queue.Queue(self._maxsize)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        if os.environ.get("LLM_CONSORTIUM_SYNC_WRITES") == "1" or threading.current_thread() is self._thread:
+            self._apply([(fn, args, kwargs)])
+            return
+        self._ensure_started()
+        self._queue.put((fn, args, kwargs))
+
+    def flush(self, timeout: Optional[float] = DEFAULT_FLUSH_TIMEOUT_S) -> bool:
+        """Wait until every write queued so far is committed. Returns False on timeout."""
+        if threading.current_thread() is self._thread:
+            return True
+        if self._thread is None or not self._thread.is_alive():
+            self._drain_inline()
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not done.wait(_FLUSH_POLL_S if deadline is None else min(_FLUSH_POLL_S, max(0.0, deadline - time.monotonic()))):
+            if not self._thread.is_alive():
+                logger.warning("Background DB writer thread died; applying queued writes inline")
+                self._drain_inline()
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning(f"Timed out after {timeout}s waiting for background DB writes")
+                return False
+        return True
+
+    def _drain_inline(self) -> None:
+        """Apply whatever is queued on the calling thread (the writer thread is not running)."""
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._apply_batch(batch)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="consortium-db-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._apply_batch(batch)
+
+    def _apply_batch(self, batch: List[Any]) -> None:
+        try:
+            self._apply([item for item in batch if not isinstance(item, threading.Event)])
+        finally:
+            # Release flushes even if a write brought the thread down
+            for marker in batch:
+                if isinstance(marker, threading.Event):
+                    marker.set()
+
+    def _apply(self, writes: List[tuple]) -> None:
+        if not writes:
+            return
+        try:
+            db = DatabaseConnection.get_connection()
+            with db.atomic():
+                for fn, args, kwargs in writes:
+                    try:
+                        with db.atomic():
+                            fn(db, *args, **kwargs)
+                    except Exception as e:
+                        logger.error(f"Error in background DB write {getattr(fn, '__name__', fn)}: {e}")
+        except Exception as e:
+            logger.error(f"Error committing background DB writes: {e}")
+
+
+_writer = BackgroundWriter()
+atexit.register(_writer.flush, ATEXIT_FLUSH_TIMEOUT_S)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_writer.reset_after_fork)
+
+
+def submit_write(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Queue fn(db, *args, **kwargs) on the background writer."""
+    _writer.submit(fn, *args, **kwargs)
+
+
+def flush_writes(timeout: Optional[float] = DEFAULT_FLUSH_TIMEOUT_S) -> bool:
+    """Block until all queued DB writes are committed (call at the end of a run or before reads)."""
+    return _writer.flush(timeout)
+
+
+def _insert_row(db: sqlite_utils.Database, table: str, row: Dict[str, Any], **insert_kwargs: Any) -> None:
+    db[table].insert(row, **insert_kwargs)
+
+
+def _log_response(db: sqlite_utils.Database, response, model: str) -> None:
+    response.log_to_db(db)
+    logger.debug(f"Response from {model} logged to database")
+
+    # Check for truncation in various formats
+    if response.response_json:
+        finish_reason = _get_finish_reason(response.response_json)
+        truncation_indicators = ['length', 'max_tokens', 'max_token']
+
+        if finish_reason and any(indicator in finish_reason for indicator in truncation_indicators):
+            logger.warning(f"Response from {model} truncated. Reason: {finish_reason}")
+
+
+def log_response(response, model: str, consortium_run_id: Optional[str] = None):
+    """Queue a model response for logging to the database."""
+    submit_write(_log_response, response, model)
 
 def _get_finish_reason(response_json: Dict[str, Any]) -> Optional[str]:
     """Helper function to extract finish reason from various API response formats."""
@@ -161,7 +330,7 @@ def save_consortium_run(
             "category": category,
             "expected_agreement": expected_agreement,
             "status": status
-        }, ignore=True, alter=True)
+        }, ignore=True)
         db.conn.commit()
     except Exception as e:
         logger.error(f"Error persisting consortium_run: {e}")
@@ -194,20 +363,40 @@ def save_consortium_member(
     response_id: str,
     role: str,
     iteration: int,
-    member_index: int
+    member_index: int,
+    status: Optional[str] = None
 ):
-    try:
-        db = DatabaseConnection.get_connection()
-        db["consortium_members"].insert({
-            "run_id": run_id,
-            "response_id": response_id,
-            "role": role,
-            "iteration": iteration,
-            "member_index": member_index
-        }, ignore=True)
-        db.conn.commit()
-    except Exception as e:
-        logger.error(f"Error saving consortium member: {e}")
+    row = {
+        "run_id": run_id,
+        "response_id": response_id,
+        "role": role,
+        "iteration": iteration,
+        "member_index": member_index
+    }
+    if status is not None:
+        row["status"] = status
+    submit_write(_insert_row, "consortium_members", row, ignore=True)
+
+
+def _mark_member_late(db: sqlite_utils.Database, run_id: str, response_id: str) -> None:
+    db.conn.execute(
+        "UPDATE consortium_members SET status = ? WHERE run_id = ? AND response_id = ?",
+        ["late", run_id, response_id],
+    )
+
+def mark_consortium_member_late(run_id: str, response_id: str) -> None:
+    """Flag a member response that arrived after its iteration had moved on to synthesis."""
+    # Queued behind the member's own insert, so the row is always there to update
+    submit_write(_mark_member_late, run_id, response_id)
+
+def save_circuit_breaker_event(model: str, previous_state: str, state: str, reason: str) -> None:
+    submit_write(_insert_row, "circuit_breaker_events", {
+        "model": model,
+        "previous_state": previous_state,
+        "state": state,
+        "reason": reason,
+        "created_at": datetime.datetime.utcnow().isoformat(),
+    })
 
 def save_arbiter_decision(
     run_id: str,
@@ -216,14 +405,22 @@ def save_arbiter_decision(
     parsed_result: Dict[str, Any],
     judging_method: str,
     geometric_confidence: Optional[float] = None,
-    centroid_vector: Optional[List[float]] = None,
+    centroid_vector: Optional[VectorLike] = None,
+    arbiter_model: Optional[str] = None,
+    attempt: int = 0,
+    escalation_reason: Optional[str] = None,
 ):
+    """Record an arbiter's decision; `escalation_reason` marks one a stronger arbiter replaced."""
     try:
-        db = DatabaseConnection.get_connection()
+        # Serialize now so later changes to parsed_result don't leak into the queued row
         chosen_id = parsed_result.get('chosen_response_id')
-        db["arbiter_decisions"].insert({
+        row = {
             "run_id": run_id,
             "iteration": iteration,
+            "attempt": attempt,
+            "arbiter_model": arbiter_model,
+            "escalated": 1 if escalation_reason else 0,
+            "escalation_reason": escalation_reason,
             "response_id": response_id,
             "chosen_response_id": chosen_id,
             "confidence": parsed_result.get('confidence', 0.0),
@@ -232,78 +429,139 @@ def save_arbiter_decision(
             "ranking_json": json.dumps(parsed_result.get('ranking', [])) if judging_method == 'rank' else None,
             "refinement_areas": json.dumps(parsed_result.get('refinement_areas', [])),
             "geometric_confidence": geometric_confidence,
-            "centroid_vector": json.dumps(centroid_vector) if centroid_vector is not None else None,
-        }, ignore=True, alter=True)
-        db.conn.commit()
+        }
+        row.update(_vector_columns("centroid", centroid_vector))
     except Exception as e:
         logger.error(f"Error logging arbiter decision: {e}")
+        return
+    submit_write(_insert_row, "arbiter_decisions", row, ignore=True)
+
+
+def _vector_columns(prefix: str, vector: Optional[VectorLike]) -> Dict[str, Any]:
+    """`{prefix}`, `{prefix}_dim` and `{prefix}_dtype` column values for a stored vector."""
+    if vector is None or len(vector) == 0:
+        return {prefix: None, f"{prefix}_dim": None, f"{prefix}_dtype": None}
+    blob, dim = pack_vector(vector)
+    return {prefix: blob, f"{prefix}_dim": dim, f"{prefix}_dtype": VECTOR_DTYPE}
 
 
 def save_response_embedding(
     response_id: str,
     run_id: str,
-    vector: List[float],
+    vector: VectorLike,
     model: str,
     embedding_model: Optional[str] = None,
+) -> None:
+    row = {
+        "response_id": response_id,
+        "run_id": run_id,
+        "model": model,
+        "embedding_model": embedding_model,
+        "created_at": datetime.datetime.utcnow().isoformat(),
+    }
+    row.update(_vector_columns("embedding", vector))
+    submit_write(_insert_row, "response_embeddings", row, pk="response_id", replace=True)
+
+
+def get_embeddings_for_run(run_id: str) -> np.ndarray:
+    """All stored embeddings for a run as one (n, dim) float32 matrix."""
+    flush_writes()
+    db = DatabaseConnection.get_connection()
+
+    rows = db.conn.execute(
+        "SELECT embedding FROM response_embeddings WHERE run_id = ? AND embedding IS NOT NULL "
+        "ORDER BY created_at, response_id",
+        [run_id],
+    ).fetchall()
+    return stack_vectors(row[0] for row in rows)
+
+
+def get_embedding_records_for_run(run_id: str) -> List[Dict[str, Any]]:
+    """Embedding rows for a run joined to their member and arbiter rows.
+
+    Each record's `embedding` is a read-only float32 view over the stored blob.
+    """
+    flush_writes()
+    db = DatabaseConnection.get_connection()
+
+    records = []
+    for row in db.query(
+        "SELECT re.response_id, re.run_id, re.model, re.embedding, re.embedding_dim, re.embedding_dtype, "
+        "re.embedding_model, re.created_at, cm.iteration, cm.member_index, ad.geometric_confidence "
+        "FROM response_embeddings re "
+        "LEFT JOIN consortium_members cm ON cm.response_id = re.response_id AND cm.run_id = re.run_id "
+        "LEFT JOIN arbiter_decisions ad ON ad.run_id = re.run_id AND ad.iteration = cm.iteration AND ad.escalated = 0 "
+        "WHERE re.run_id = ? AND re.embedding IS NOT NULL ORDER BY cm.iteration, cm.member_index, re.response_id",
+        [run_id],
+    ):
+        record = dict(row)
+        record["embedding"] = unpack_vector(record["embedding"], record.pop("embedding_dtype"))
+        records.append(record)
+    return records
+
+
+def get_embedding_matrix_for_run(run_id: str) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+    """`get_embedding_records_for_run` plus its embeddings stacked into one (n, dim) matrix."""
+    records = get_embedding_records_for_run(run_id)
+    matrix = stack_vectors(record["embedding"].tobytes() for record in records)
+    return records, matrix
+
+
+def save_semantic_cache_entry(
+    run_id: str,
+    config_hash: str,
+    prompt: str,
+    vector: VectorLike,
+    synthesis: Dict[str, Any],
+    embedding_model: Optional[str] = None,
 ) -> None:
     try:
         db = DatabaseConnection.get_connection()
-        db["response_embeddings"].insert({
-            "response_id": response_id,
+        row = {
             "run_id": run_id,
-            "model": model,
-            "embedding_json": json.dumps(vector),
+            "config_hash": config_hash,
+            "prompt": prompt,
             "embedding_model": embedding_model,
+            "synthesis_json": json.dumps(synthesis, default=str),
             "created_at": datetime.datetime.utcnow().isoformat(),
-        }, pk="response_id", replace=True, alter=True)
+        }
+        row.update(_vector_columns("embedding", vector))
+        db["semantic_answer_cache"].insert(row, pk="run_id", replace=True)
         db.conn.commit()
     except Exception as e:
-        logger.error(f"Error saving response embedding: {e}")
+        logger.error(f"Error saving semantic cache entry: {e}")
 
 
-def get_embeddings_for_run(run_id: str) -> List[np.ndarray]:
+def get_semantic_cache_candidates(config_hash: str, since: Optional[str] = None, limit: int = 2000) -> List[Dict[str, Any]]:
+    """Most recent semantic cache entries for a config, newest first."""
     db = DatabaseConnection.get_connection()
-    if "response_embeddings" not in db.table_names():
-        return []
 
-    rows = list(db.query(
-        "SELECT embedding_json FROM response_embeddings WHERE run_id = ? ORDER BY created_at, response_id",
-        [run_id],
-    ))
-    return [np.array(json.loads(row["embedding_json"]), dtype=float) for row in rows]
-
-
-def get_embedding_records_for_run(run_id: str) -> List[Dict[str, Any]]:
-    db = DatabaseConnection.get_connection()
-    if "response_embeddings" not in db.table_names():
-        return []
-
-    return [
-        dict(row)
-        for row in db.query(
-            "SELECT re.response_id, re.run_id, re.model, re.embedding_json, re.embedding_model, re.created_at, "
-            "cm.iteration, cm.member_index, ad.geometric_confidence "
-            "FROM response_embeddings re "
-            "LEFT JOIN consortium_members cm ON cm.response_id = re.response_id AND cm.run_id = re.run_id "
-            "LEFT JOIN arbiter_decisions ad ON ad.run_id = re.run_id AND ad.iteration = cm.iteration "
-            "WHERE re.run_id = ? ORDER BY cm.iteration, cm.member_index, re.response_id",
-            [run_id],
-        )
-    ]
+    sql = (
+        "SELECT run_id, prompt, embedding, embedding_dim, synthesis_json, created_at FROM semantic_answer_cache "
+        "WHERE config_hash = ? AND embedding IS NOT NULL"
+    )
+    params: List[Any] = [config_hash]
+    if since:
+        sql += " AND created_at >= ?"
+        params.append(since)
+    sql += " ORDER BY created_at DESC LIMIT ?"
+    params.append(limit)
+    return [dict(row) for row in db.query(sql, params)]
 
 
 def save_cluster_metadata(run_id: str, iteration: int, clusters: List[Dict[str, Any]]) -> None:
     try:
         db = DatabaseConnection.get_connection()
         for cluster in clusters:
-            db["consensus_clusters"].insert({
+            row = {
                 "run_id": run_id,
                 "iteration": iteration,
                 "cluster_id": cluster.get("cluster_id", -1),
-                "centroid_json": json.dumps(cluster.get("centroid", [])),
                 "radius": cluster.get("radius", 0.0),
                 "density": cluster.get("density", 0.0),
-            }, alter=True)
+            }
+            row.update(_vector_columns("centroid", cluster.get("centroid")))
+            db["consensus_clusters"].insert(row)
         db.conn.commit()
     except Exception as e:
         logger.error(f"Error saving cluster metadata: {e}")
@@ -312,10 +570,6 @@ def save_cluster_metadata(run_id: str, iteration: int, clusters: List[Dict[str,
 def save_run_visualization(run_id: str, visualization_json: str) -> None:
     try:
         db = DatabaseConnection.get_connection()
-        run_columns = {column.name for column in db["consortium_runs"].columns}
-        if "visualization_json" not in run_columns:
-            db["consortium_runs"].add_column("visualization_json", str)
-
         existing = db.conn.execute(
             "SELECT 1 FROM consortium_runs WHERE id = ?",
             [run_id],
@@ -330,7 +584,7 @@ def save_run_visualization(run_id: str, visualization_json: str) -> None:
                 "id": run_id,
                 "created_at": datetime.datetime.utcnow().isoformat(),
                 "visualization_json": visualization_json,
-            }, pk="id", alter=True)
+            }, pk="id")
         db.conn.commit()
     except Exception as e:
         logger.error(f"Error saving run visualization: {e}")
@@ -1,16 +1,27 @@
 from .backends import (
     BaseEmbeddingBackend,
     ChutesBackend,
+    HashingBackend,
     OpenAIBackend,
     SentenceTransformerBackend,
 )
-from .service import EmbeddingService, create_embedding_service
+from .background import BackgroundEmbedder
+from .cache import PersistentEmbeddingCache
+from .registry import get_embedding_backend, get_embedding_service, warm_up
+from .service import EmbeddingService, create_embedding_backend, create_embedding_service
 
 __all__ = [
+    "BackgroundEmbedder",
     "BaseEmbeddingBackend",
     "ChutesBackend",
     "EmbeddingService",
+    "HashingBackend",
     "OpenAIBackend",
+    "PersistentEmbeddingCache",
     "SentenceTransformerBackend",
+    "create_embedding_backend",
     "create_embedding_service",
+    "get_embedding_backend",
+    "get_embedding_service",
+    "warm_up",
 ]
\ No newline at end of file
@@ -1,6 +1,8 @@
 import abc
 import os
-from typing import Optional, Protocol
+import re
+import zlib
+from typing import Dict, Iterator, List, Optional, Protocol, Sequence
 
 import httpx
 import numpy as np
@@ -11,66 +13,165 @@ class EmbeddingBackend(Protocol):
     def embed(self, text: str) -> np.ndarray:
         ...
 
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        ...
+
     def dimension(self) -> int:
         ...
 
 
+def _utf8_size(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    """Cut text to at most max_bytes of UTF-8 without splitting a character."""
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", errors="ignore")
+
+
+def _chunks(texts: Sequence[str], max_items: int, max_bytes: Optional[int] = None) -> Iterator[List[str]]:
+    """Split texts into request-sized chunks by item count and UTF-8 size."""
+    chunk: List[str] = []
+    size = 0
+    for text in texts:
+        length = _utf8_size(text) if max_bytes is not None else 0
+        if chunk and (len(chunk) >= max_items or (max_bytes is not None and size + length > max_bytes)):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(text)
+        size += length
+    if chunk:
+        yield chunk
+
+
 class BaseEmbeddingBackend(abc.ABC):
+    name: str = ""
+    # Per-input limit in UTF-8 bytes; byte-level BPE tokens span at least one byte,
+    # so this bounds the token count too. None leaves inputs whole.
+    max_input_bytes: Optional[int] = None
+
+    def _fit_input(self, text: str) -> str:
+        """Truncate one input so it cannot exceed the model's context."""
+        if self.max_input_bytes is None:
+            return text
+        return _truncate_utf8(text, self.max_input_bytes)
+
+    def cache_namespace(self) -> str:
+        """Identifies the vector space for persistent caching: backend plus embedding model."""
+        model = getattr(self, "model_name", None) or getattr(self, "model", None)
+        return f"{self.name or type(self).__name__}:{model if isinstance(model, str) else ''}"
+
     @abc.abstractmethod
     def embed(self, text: str) -> np.ndarray:
         raise NotImplementedError
 
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        """Embed several texts, in order. Backends override this to use one request per chunk."""
+        return [self.embed(text) for text in texts]
+
+    def warm_up(self) -> None:
+        """Do any one-off work that would otherwise land on the first real embed (no-op by default)."""
+
     @abc.abstractmethod
     def dimension(self) -> int:
         raise NotImplementedError
 
 
 class OpenAIBackend(BaseEmbeddingBackend):
-    def __init__(self, model: str = "text-embedding-3-small"):
+    name = "openai"
+    # Provider limits: 8191 tokens per input, 2048 inputs and 300k tokens per request.
+    # Counting UTF-8 bytes never undercounts tokens, so these limits hold for any text.
+    max_input_bytes = 8191
+    max_batch_size = 2048
+    max_batch_bytes = 300_000
+
+    def __init__(self, model: str = "text-embedding-3-small", client: Optional["openai.OpenAI"] = None):
         self.model = model
+        self.client = client
         self._dimension = 1536
 
-    def embed(self, text: str) -> np.ndarray:
+    def _create(self, input):
+        if self.client is not None:
+            return self.client.embeddings.create(input=input, model=self.model)
         if hasattr(openai, "embeddings") and hasattr(openai.embeddings, "create"):
-            response = openai.embeddings.create(input=text, model=self.model)
-        else:
-            client = openai.OpenAI()
-            response = client.embeddings.create(input=text, model=self.model)
+            return openai.embeddings.create(input=input, model=self.model)
+        return openai.OpenAI().embeddings.create(input=input, model=self.model)
+
+    def embed(self, text: str) -> np.ndarray:
+        response = self._create(self._fit_input(text))
         return np.array(response.data[0].embedding, dtype=float)
 
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        vectors: List[np.ndarray] = []
+        for chunk in _chunks([self._fit_input(text) for text in texts], self.max_batch_size, self.max_batch_bytes):
+            response = self._create(chunk)
+            data = sorted(response.data, key=lambda item: item.index)
+            if len(data) != len(chunk):
+                raise RuntimeError(f"OpenAI returned {len(data)} embeddings for {len(chunk)} inputs")
+            vectors.extend(np.array(item.embedding, dtype=float) for item in data)
+        if vectors:
+            self._dimension = int(vectors[0].shape[0])
+        return vectors
+
     def dimension(self) -> int:
         return self._dimension
 
 
 class SentenceTransformerBackend(BaseEmbeddingBackend):
-    def __init__(self, model: str = "all-MiniLM-L6-v2"):
+    name = "sentence-transformers"
+
+    def __init__(self, model: str = "all-MiniLM-L6-v2", batch_size: int = 32):
         from sentence_transformers import SentenceTransformer
 
         self.model_name = model
+        self.batch_size = batch_size
         self._model = SentenceTransformer(model)
         self._dimension = int(self._model.get_sentence_embedding_dimension() or 384)
 
     def embed(self, text: str) -> np.ndarray:
         return np.array(self._model.encode(text), dtype=float)
 
+    def warm_up(self) -> None:
+        # The first encode initialises the tokenizer and inference runtime
+        self._model.encode(["warm-up"], batch_size=1)
+
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        if not texts:
+            return []
+        matrix = np.asarray(self._model.encode(list(texts), batch_size=self.batch_size), dtype=float)
+        return list(matrix.reshape(len(texts), -1))
+
     def dimension(self) -> int:
         return self._dimension
 
 
 class ChutesBackend(BaseEmbeddingBackend):
+    name = "chutes"
+
     def __init__(
         self,
         client: Optional[httpx.Client] = None,
         endpoint: str = "https://chutes-qwen-qwen3-embedding-8b.chutes.ai/v1/embeddings",
         model: Optional[str] = None,
         default_dimension: int = 1024,
+        max_batch_size: int = 64,
+        max_input_bytes: Optional[int] = 32_768,  # Qwen3-Embedding's 32k-token context
     ):
         self.client = client or httpx.Client()
         self.endpoint = endpoint
         self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_input_bytes = max_input_bytes
         self._dimension = default_dimension
 
-    def embed(self, text: str) -> np.ndarray:
+    def cache_namespace(self) -> str:
+        # The endpoint picks the model when none is named
+        return f"{self.name}:{self.model or self.endpoint}"
+
+    def _post(self, input) -> List[dict]:
         token = os.environ.get("CHUTES_API_TOKEN")
         if not token:
             raise RuntimeError("CHUTES_API_TOKEN is required for the chutes embedding backend")
@@ -81,13 +182,132 @@ class ChutesBackend(BaseEmbeddingBackend):
                 "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json",
             },
-            json={"input": text, "model": self.model},
+            json={"input": input, "model": self.model},
             timeout=30,
         )
         response.raise_for_status()
-        vector = np.array(response.json()["data"][0]["embedding"], dtype=float)
+        return response.json()["data"]
+
+    def embed(self, text: str) -> np.ndarray:
+        vector = np.array(self._post(self._fit_input(text))[0]["embedding"], dtype=float)
         self._dimension = int(vector.shape[0])
         return vector
 
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        vectors: List[np.ndarray] = []
+        for chunk in _chunks([self._fit_input(text) for text in texts], self.max_batch_size):
+            data = sorted(self._post(chunk), key=lambda item: item.get("index", 0))
+            if len(data) != len(chunk):
+                raise RuntimeError(f"Chutes returned {len(data)} embeddings for {len(chunk)} inputs")
+            vectors.extend(np.array(item["embedding"], dtype=float) for item in data)
+        if vectors:
+            self._dimension = int(vectors[0].shape[0])
+        return vectors
+
+    def dimension(self) -> int:
+        return self._dimension
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class HashingBackend(BaseEmbeddingBackend):
+    """Offline, deterministic embeddings from hashed word and character n-grams.
+
+    Word unigrams and bigrams plus character n-grams of each word are hashed (crc32,
+    so stable across processes and platforms) into `n_features` signed buckets. If
+    `dimension` is set, the result is multiplied by a seeded Gaussian random
+    projection. Vectors are L2-normalised, so cosine and Euclidean distances agree
+    with the other backends' conventions. Needs only NumPy.
+
+    `model` may be a spec such as "features=16384,dim=256,seed=0,char=3-5"; any
+    missing key keeps its default.
+    """
+
+    name = "hashing"
+    DEFAULTS = {"features": 2 ** 14, "dim": 256, "seed": 0, "char": "3-5"}
+
+    def __init__(self, model: Optional[str] = None, n_features: Optional[int] = None,
+                 dimension: Optional[int] = None, seed: Optional[int] = None):
+        spec = self._parse_spec(model)
+        self.model = model or "default"
+        self.n_features = int(n_features or spec["features"])
+        projected = spec["dim"] if dimension is None else dimension
+        self._dimension = int(projected) if projected else self.n_features
+        self.seed = int(spec["seed"] if seed is None else seed)
+        low, _, high = str(spec["char"]).partition("-")
+        self.char_ngrams = range(int(low), int(high or low) + 1) if low and low != "0" else range(0)
+        self._projection: Optional[np.ndarray] = None
+        if self.n_features < 1 or self._dimension < 1:
+            raise ValueError("hashing backend features and dim must be positive")
+
+    @classmethod
+    def _parse_spec(cls, model: Optional[str]) -> Dict[str, object]:
+        spec: Dict[str, object] = dict(cls.DEFAULTS)
+        if model and model != "default":
+            for part in model.split(","):
+                key, sep, value = part.partition("=")
+                key = key.strip()
+                if not sep or key not in cls.DEFAULTS:
+                    raise ValueError(f"Invalid hashing embedding spec '{part}'; expected one of {', '.join(cls.DEFAULTS)}=VALUE")
+                spec[key] = value.strip() if key == "char" else int(value)
+        return spec
+
+    def _features(self, text: str) -> List[str]:
+        words = _WORD_RE.findall(text.lower())
+        features = [f"w:{word}" for word in words]
+        features.extend(f"b:{first} {second}" for first, second in zip(words, words[1:]))
+        for word in words:
+            padded = f"<{word}>"
+            for n in self.char_ngrams:
+                features.extend(f"c:{padded[i:i + n]}" for i in range(max(1, len(padded) - n + 1)))
+        return features
+
+    def _projection_matrix(self) -> Optional[np.ndarray]:
+        if self._dimension == self.n_features:
+            return None
+        if self._projection is None:
+            rng = np.random.default_rng(self.seed)
+            self._projection = (rng.standard_normal((self.n_features, self._dimension), dtype=np.float32)
+                                / np.float32(np.sqrt(self._dimension)))
+        return self._projection
+
+    def warm_up(self) -> None:
+        self._projection_matrix()
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: Sequence[str]) -> List[np.ndarray]:
+        if not texts:
+            return []
+        rows: List[int] = []
+        hashes: List[int] = []
+        for row, text in enumerate(texts):
+            features = self._features(text)
+            rows.extend([row] * len(features))
+            hashes.extend(zlib.crc32(feature.encode("utf-8")) for feature in features)
+        hashed = np.asarray(hashes, dtype=np.uint64)
+        # Low bits pick the bucket, the top bit the sign, so collisions cancel out on average
+        columns = (hashed % self.n_features).astype(np.intp)
+        signs = np.where(hashed >> 31, -1.0, 1.0).astype(np.float32)
+        rows_array = np.asarray(rows, dtype=np.intp)
+
+        projection = self._projection_matrix()
+        if projection is None:
+            flat = np.bincount(rows_array * self.n_features + columns, weights=signs,
+                               minlength=len(texts) * self.n_features)
+            matrix = flat.reshape(len(texts), self.n_features)
+        else:
+            # Only the buckets this batch touches take part in the product, so the
+            # matmul is (texts x active) @ (active x dim) rather than over all features
+            active, local = np.unique(columns, return_inverse=True)
+            counts = np.bincount(rows_array * len(active) + local, weights=signs,
+                                 minlength=len(texts) * len(active)).astype(np.float32)
+            matrix = counts.reshape(len(texts), len(active)) @ projection[active]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1.0, norms)
+        return list(matrix.astype(float))
+
     def dimension(self) -> int:
-        return self._dimension
\ No newline at end of file
+        return self._dimension
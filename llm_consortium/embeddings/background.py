@@ -0,0 +1,73 @@
+"""Embedding texts in the background while the rest of a fan-out is still running.
+
+The semantic strategy hands each member response to a BackgroundEmbedder the moment
+it arrives, so embedding overlaps with the slower members instead of starting after
+the last one. Texts that arrive while a backend call is in flight are sent together in
+the next call, so a burst of fast responses still goes out as one batch.
+"""
+import concurrent.futures
+import logging
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from .service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_WORKERS = 4
+
+_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _embedding_pool() -> concurrent.futures.ThreadPoolExecutor:
+    # Separate from the member executor so embeddings never wait behind member calls
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=EMBEDDING_WORKERS, thread_name_prefix="consortium-embed"
+            )
+        return _pool
+
+
+class BackgroundEmbedder:
+    """Queues texts and embeds them off the caller's thread, one batch at a time.
+
+    `get_service` is called on the background thread, so a backend that is slow to
+    load never blocks the thread (or event loop) collecting member responses.
+    """
+
+    def __init__(self, get_service: Callable[[], EmbeddingService]):
+        self._get_service = get_service
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[str, concurrent.futures.Future]] = []
+        self._draining = False
+
+    def submit(self, text: str) -> concurrent.futures.Future:
+        """Queue a text; the future resolves to its vector or the backend's exception."""
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._lock:
+            self._queue.append((text, future))
+            start = not self._draining
+            self._draining = True
+        if start:
+            _embedding_pool().submit(self._drain)
+        return future
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                items, self._queue = self._queue, []
+                if not items:
+                    self._draining = False
+                    return
+            try:
+                vectors = self._get_service().embed_batch([text for text, _ in items])
+            except Exception as e:
+                logger.error(f"Background embedding of {len(items)} text(s) failed: {e}")
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            for (_, future), vector in zip(items, vectors):
+                future.set_result(vector)
@@ -0,0 +1,97 @@
+"""Persistent, cross-process second tier for the embedding cache.
+
+Vectors live in the `embedding_cache` table of the consortium logs database, keyed by
+(backend, embedding model, sha256 of the text), as float32 BLOBs. SQLite's WAL locking
+makes the table safe to share between concurrent `llm` invocations and worker
+processes. Writes and last-used touches go through the background DB writer; the
+table is trimmed back to `max_entries` (least recently used first) every
+`evict_every` stores.
+"""
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from ..db import DatabaseConnection, submit_write
+from ..vectors import VECTOR_DTYPE, pack_vector, unpack_vector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES = 50000
+
+
+class PersistentEmbeddingCache:
+    def __init__(self, namespace: str, max_entries: int = DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES, evict_every: int = 256):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self._stores = 0
+        self._lock = threading.Lock()
+
+    def get_many(self, text_hashes: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Stored vectors for the given text hashes (missing ones are left out)."""
+        text_hashes = list(dict.fromkeys(text_hashes))
+        if not text_hashes:
+            return {}
+        found: Dict[str, np.ndarray] = {}
+        try:
+            db = DatabaseConnection.get_connection()
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(text_hashes), 500):
+                chunk = text_hashes[start:start + 500]
+                rows = db.conn.execute(
+                    f"SELECT text_hash, embedding, embedding_dtype FROM embedding_cache "
+                    f"WHERE namespace = ? AND text_hash IN ({', '.join('?' for _ in chunk)})",
+                    [self.namespace, *chunk],
+                ).fetchall()
+                for text_hash, blob, dtype in rows:
+                    found[text_hash] = unpack_vector(blob, dtype).astype(float)
+        except Exception as e:
+            logger.error(f"Error reading persistent embedding cache: {e}")
+            return {}
+        if found:
+            submit_write(_touch_entries, self.namespace, list(found), time.time())
+        return found
+
+    def get(self, text_hash: str) -> Optional[np.ndarray]:
+        return self.get_many([text_hash]).get(text_hash)
+
+    def put(self, text_hash: str, vector: np.ndarray) -> None:
+        blob, dim = pack_vector(vector)
+        submit_write(_put_entry, self.namespace, text_hash, blob, dim, time.time())
+        with self._lock:
+            self._stores += 1
+            evict = self._stores % self.evict_every == 0
+        if evict:
+            submit_write(_evict_entries, self.max_entries)
+
+
+def _touch_entries(db, namespace: str, text_hashes: list, now: float) -> None:
+    db.conn.executemany(
+        "UPDATE embedding_cache SET last_used_at = ?, hits = hits + 1 WHERE namespace = ? AND text_hash = ?",
+        [(now, namespace, text_hash) for text_hash in text_hashes],
+    )
+
+
+def _put_entry(db, namespace: str, text_hash: str, blob: bytes, dim: int, now: float) -> None:
+    db.conn.execute(
+        """
+        INSERT OR REPLACE INTO embedding_cache
+            (namespace, text_hash, embedding, embedding_dim, embedding_dtype, created_at, last_used_at, hits)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+        """,
+        [namespace, text_hash, blob, dim, VECTOR_DTYPE, now, now],
+    )
+
+
+def _evict_entries(db, max_entries: int) -> None:
+    db.conn.execute(
+        """
+        DELETE FROM embedding_cache WHERE rowid IN (
+            SELECT rowid FROM embedding_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+        )
+        """,
+        [max_entries],
+    )
@@ -0,0 +1,103 @@
+"""Process-wide registry of embedding backends and services.
+
+Loading a backend can be expensive (sentence-transformers reads model weights from
+disk), so every orchestrator in the process shares one backend per (backend, model)
+pair and one EmbeddingService, with its in-memory cache, per backend and cache
+settings. Orchestrators get a `view()` of the shared service, so their per-run hit
+and miss counts stay their own.
+
+`warm_up()` loads the backends for a set of configs ahead of the first semantic run,
+optionally on a background thread; the plugin calls it when it is loaded if
+LLM_CONSORTIUM_WARMUP=1 is set.
+"""
+import logging
+import os
+import threading
+from typing import Dict, Hashable, Iterable, Optional, Tuple
+
+from .backends import BaseEmbeddingBackend
+from .cache import DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+from .service import EmbeddingService, create_embedding_backend, create_embedding_service
+
+logger = logging.getLogger(__name__)
+
+_backends: Dict[Tuple[Optional[str], Optional[str]], BaseEmbeddingBackend] = {}
+_services: Dict[Tuple, EmbeddingService] = {}
+_key_locks: Dict[Hashable, threading.Lock] = {}
+_lock = threading.Lock()
+
+
+def warmup_enabled_by_env() -> bool:
+    return os.environ.get("LLM_CONSORTIUM_WARMUP", "").lower() in ("1", "true", "yes")
+
+
+def _get_or_create(registry: Dict, key: Hashable, factory):
+    with _lock:
+        value = registry.get(key)
+        if value is not None:
+            return value
+        key_lock = _key_locks.setdefault((id(registry), key), threading.Lock())
+    # Build outside the registry lock so one slow model load doesn't block other keys,
+    # while concurrent callers for the same key wait for the first load instead of repeating it
+    with key_lock:
+        with _lock:
+            value = registry.get(key)
+        if value is None:
+            value = factory()
+            with _lock:
+                registry[key] = value
+    return value
+
+
+def get_embedding_backend(backend_name: Optional[str], model_name: Optional[str] = None) -> BaseEmbeddingBackend:
+    """The process-wide backend instance for (backend, model), loaded on first use."""
+    return _get_or_create(_backends, (backend_name, model_name),
+                          lambda: create_embedding_backend(backend_name, model_name))
+
+
+def get_embedding_service(config) -> EmbeddingService:
+    """A view of the shared EmbeddingService for config's backend, model and cache settings."""
+    backend_name = getattr(config, "embedding_backend", None)
+    model_name = getattr(config, "embedding_model", None)
+    key = (
+        backend_name,
+        model_name,
+        getattr(config, "embedding_cache_enabled", True),
+        getattr(config, "embedding_cache_max_entries", DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES),
+    )
+    service = _get_or_create(_services, key, lambda: create_embedding_service(
+        config, backend=get_embedding_backend(backend_name, model_name)))
+    return service.view()
+
+
+def warm_up(configs: Iterable, background: bool = True) -> Optional[threading.Thread]:
+    """Load the embedding backends used by configs (those with an embedding_backend)."""
+    pairs = list(dict.fromkeys(
+        (config.embedding_backend, getattr(config, "embedding_model", None))
+        for config in configs if getattr(config, "embedding_backend", None)
+    ))
+    if not pairs:
+        return None
+
+    def run():
+        for backend_name, model_name in pairs:
+            try:
+                get_embedding_backend(backend_name, model_name).warm_up()
+                logger.debug(f"Warmed up embedding backend {backend_name}:{model_name}")
+            except Exception as e:
+                logger.warning(f"Embedding warm-up failed for {backend_name}:{model_name}: {e}")
+
+    if not background:
+        run()
+        return None
+    thread = threading.Thread(target=run, name="consortium-embedding-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def reset_embedding_registry() -> None:
+    """Drop all shared backends and services (mainly for tests)."""
+    with _lock:
+        _backends.clear()
+        _services.clear()
+        _key_locks.clear()
@@ -2,65 +2,151 @@ import hashlib
 import logging
 import threading
 from collections import OrderedDict
-from typing import Optional, Sequence
+from typing import Dict, Optional, Sequence
 
 import numpy as np
 
-from .backends import BaseEmbeddingBackend, ChutesBackend, OpenAIBackend, SentenceTransformerBackend
+from .backends import BaseEmbeddingBackend, ChutesBackend, HashingBackend, OpenAIBackend, SentenceTransformerBackend
+from .cache import DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES, PersistentEmbeddingCache
 
 logger = logging.getLogger(__name__)
 
 
 class EmbeddingService:
-    def __init__(self, backend: BaseEmbeddingBackend, cache_enabled: bool = True, cache_size: int = 256):
+    """Embeds text through a backend with a two-tier cache.
+
+    The first tier is an in-process LRU of `cache_size` vectors; the optional second
+    tier is a PersistentEmbeddingCache shared by every process using the same logs DB.
+    """
+
+    def __init__(self, backend: BaseEmbeddingBackend, cache_enabled: bool = True, cache_size: int = 256,
+                 persistent_cache: Optional[PersistentEmbeddingCache] = None):
         self.backend = backend
         self.cache_enabled = cache_enabled
         self.cache_size = cache_size
+        self.persistent_cache = persistent_cache if cache_enabled else None
         self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
         self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "persistent_hits": 0, "misses": 0}
 
     def _cache_key(self, text: str) -> str:
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
-    def embed(self, text: str) -> np.ndarray:
-        cache_key = self._cache_key(text)
-        if self.cache_enabled:
-            with self._lock:
-                cached = self._cache.get(cache_key)
-                if cached is not None:
-                    self._cache.move_to_end(cache_key)
-                    return cached.copy()
+    def view(self) -> "EmbeddingService":
+        """A service sharing this one's backend and caches but keeping its own hit/miss stats."""
+        view = EmbeddingService.__new__(EmbeddingService)
+        view.__dict__.update(self.__dict__)
+        view._stats = {key: 0 for key in self._stats}
+        return view
 
+    def cache_stats(self) -> Dict[str, int]:
+        """Cumulative lookups served by each cache tier and by the backend (misses)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, outcome: str, n: int = 1) -> None:
+        with self._lock:
+            self._stats[outcome] += n
+
+    def _from_memory(self, cache_key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is None:
+                return None
+            self._cache.move_to_end(cache_key)
+            self._stats["memory_hits"] += 1
+            return cached.copy()
+
+    def _remember(self, cache_key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._cache[cache_key] = vector.copy()
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _from_backend(self, texts: Sequence[str], cache_keys: Sequence[str]) -> list[np.ndarray]:
         try:
-            vector = self.backend.embed(text)
+            if len(texts) == 1:
+                vectors = [self.backend.embed(texts[0])]
+            else:
+                vectors = self.backend.embed_batch(texts)
         except Exception as exc:
-            logger.error("Embedding backend failed for text hash %s: %s", cache_key, exc)
+            logger.error("Embedding backend failed for %d text(s), first hash %s: %s", len(texts), cache_keys[0], exc)
             raise RuntimeError(f"Embedding backend {self.backend.__class__.__name__} failed") from exc
+        self._count("misses", len(texts))
+        if self.cache_enabled:
+            for cache_key, vector in zip(cache_keys, vectors):
+                self._remember(cache_key, vector)
+                if self.persistent_cache is not None:
+                    self.persistent_cache.put(cache_key, vector)
+        return vectors
 
+    def embed(self, text: str) -> np.ndarray:
+        cache_key = self._cache_key(text)
         if self.cache_enabled:
-            with self._lock:
-                self._cache[cache_key] = vector.copy()
-                self._cache.move_to_end(cache_key)
-                while len(self._cache) > self.cache_size:
-                    self._cache.popitem(last=False)
-        return vector
+            cached = self._from_memory(cache_key)
+            if cached is not None:
+                return cached
+            if self.persistent_cache is not None:
+                stored = self.persistent_cache.get(cache_key)
+                if stored is not None:
+                    self._count("persistent_hits")
+                    self._remember(cache_key, stored)
+                    return stored
+
+        return self._from_backend([text], [cache_key])[0]
 
     def embed_batch(self, texts: Sequence[str]) -> list[np.ndarray]:
-        return [self.embed(text) for text in texts]
+        keys = [self._cache_key(text) for text in texts]
+        vectors: list[Optional[np.ndarray]] = [None] * len(texts)
+        if self.cache_enabled:
+            for i, key in enumerate(keys):
+                vectors[i] = self._from_memory(key)
+            if self.persistent_cache is not None:
+                pending = [key for key, vector in zip(keys, vectors) if vector is None]
+                stored = self.persistent_cache.get_many(pending)
+                for i, key in enumerate(keys):
+                    if vectors[i] is None and key in stored:
+                        vectors[i] = stored[key].copy()
+                        self._count("persistent_hits")
+                        self._remember(key, stored[key])
 
+        # Only the misses go to the backend, in one batch, with repeated texts sent once
+        misses: Dict[str, str] = {}
+        for text, key, vector in zip(texts, keys, vectors):
+            if vector is None:
+                misses.setdefault(key, text)
+        if misses:
+            computed = dict(zip(misses, self._from_backend(list(misses.values()), list(misses))))
+            repeats = sum(1 for vector in vectors if vector is None) - len(misses)
+            if repeats:
+                self._count("memory_hits", repeats)
+            for i, key in enumerate(keys):
+                if vectors[i] is None:
+                    vectors[i] = computed[key].copy()
+        return vectors
 
-def create_embedding_service(config) -> EmbeddingService:
-    backend_name = getattr(config, "embedding_backend", None)
-    model_name = getattr(config, "embedding_model", None)
-    cache_enabled = getattr(config, "embedding_cache_enabled", True)
 
+def create_embedding_backend(backend_name: Optional[str], model_name: Optional[str] = None) -> BaseEmbeddingBackend:
     if backend_name == "openai":
-        backend = OpenAIBackend(model=model_name or "text-embedding-3-small")
-    elif backend_name == "sentence-transformers":
-        backend = SentenceTransformerBackend(model=model_name or "all-MiniLM-L6-v2")
-    elif backend_name == "chutes":
-        backend = ChutesBackend(model=model_name)
-    else:
-        raise ValueError(f"No valid embedding_backend configured. Found: {backend_name}")
-
-    return EmbeddingService(backend=backend, cache_enabled=cache_enabled)
\ No newline at end of file
+        return OpenAIBackend(model=model_name or "text-embedding-3-small")
+    if backend_name == "sentence-transformers":
+        return SentenceTransformerBackend(model=model_name or "all-MiniLM-L6-v2")
+    if backend_name == "chutes":
+        return ChutesBackend(model=model_name)
+    if backend_name == "hashing":
+        return HashingBackend(model=model_name)
+    raise ValueError(f"No valid embedding_backend configured. Found: {backend_name}")
+
+
+def create_embedding_service(config, backend: Optional[BaseEmbeddingBackend] = None) -> EmbeddingService:
+    """Build a new service for config; pass `backend` to reuse an already loaded one."""
+    cache_enabled = getattr(config, "embedding_cache_enabled", True)
+    persistent_entries = getattr(config, "embedding_cache_max_entries", DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES)
+    if backend is None:
+        backend = create_embedding_backend(getattr(config, "embedding_backend", None), getattr(config, "embedding_model", None))
+
+    persistent_cache = None
+    if cache_enabled and persistent_entries:
+        persistent_cache = PersistentEmbeddingCache(backend.cache_namespace(), max_entries=persistent_entries)
+    return EmbeddingService(backend=backend, cache_enabled=cache_enabled, persistent_cache=persistent_cache)
@@ -0,0 +1,204 @@
+"""Process-wide bounded scheduler for consortium member calls.
+
+Every orchestrator in the process submits its fan-out to one shared thread pool, so
+the number of threads is capped globally instead of growing with the number of
+concurrent runs. Each fan-out is a `MemberBatch` with its own optional per-run cap,
+and may also count against a `SharedCap` held by every run of one consortium; work
+beyond any cap waits in the batch's queue rather than in the pool. The pool size
+itself is process configuration (`LLM_CONSORTIUM_MAX_WORKERS` or
+`set_global_concurrency`), never a consortium setting.
+
+Nested consortiums (a saved consortium used as a member model) fan out from inside a
+pool thread: `ConsortiumModel.execute` runs the nested orchestration on the member's
+own thread rather than a new one. Instead of parking that thread while its
+sub-members wait for capacity, `MemberBatch.wait` runs the batch's queued calls
+inline, so nesting never needs more threads than the global cap and cannot deadlock
+the pool. An inline call cannot be interrupted, so a wait timeout (e.g.
+`member_deadline_s`) is only checked between inline calls and may be overrun by the
+one in progress.
+
+The cap covers sync member calls only. Async runs bound their members with a per-run
+semaphore and run sync-only models on the event loop's default executor.
+"""
+import collections
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 64
+
+_worker_state = threading.local()
+
+
+def _default_max_workers() -> int:
+    try:
+        return max(1, int(os.environ.get("LLM_CONSORTIUM_MAX_WORKERS", DEFAULT_MAX_WORKERS)))
+    except ValueError:
+        return DEFAULT_MAX_WORKERS
+
+
+def in_worker_thread() -> bool:
+    """True when called from a shared-executor thread (e.g. inside a nested consortium)."""
+    return getattr(_worker_state, "active", False)
+
+
+class SharedCap:
+    """A limit on member calls in flight across every batch that holds it."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.running = 0
+
+
+class MemberBatch:
+    """One fan-out's queue of calls, dispatched to the shared executor within its caps."""
+
+    def __init__(self, executor: "ConsortiumExecutor", max_concurrency: Optional[int] = None,
+                 shared_cap: Optional[SharedCap] = None):
+        self._executor = executor
+        self.max_concurrency = max_concurrency if max_concurrency and max_concurrency > 0 else None
+        self.shared_cap = shared_cap
+        self.running = 0
+        self.queue: Deque[Tuple[concurrent.futures.Future, Callable[..., Any], tuple, dict]] = collections.deque()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._executor._lock:
+            self.queue.append((future, fn, args, kwargs))
+        self._executor._pump(self)
+        return future
+
+    def has_capacity(self) -> bool:
+        if self.shared_cap is not None and self.shared_cap.running >= self.shared_cap.limit:
+            return False
+        return self.max_concurrency is None or self.running < self.max_concurrency
+
+    def _take_queued(self):
+        with self._executor._lock:
+            return self.queue.popleft() if self.queue else None
+
+    def wait(self, pending: Iterable[concurrent.futures.Future], timeout: Optional[float] = None) -> Tuple[Set, Set]:
+        """concurrent.futures.wait(FIRST_COMPLETED), helping with queued calls when nested."""
+        pending = set(pending)
+        if in_worker_thread():
+            end = time.monotonic() + timeout if timeout is not None else None
+            while True:
+                done = {future for future in pending if future.done()}
+                if done:
+                    return done, pending - done
+                if end is not None and time.monotonic() >= end:
+                    return set(), pending
+                item = self._take_queued()
+                if item is None:
+                    break
+                _run_item(*item)
+            if end is not None:
+                timeout = max(0.0, end - time.monotonic())
+        return concurrent.futures.wait(pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+
+
+def _run_item(future: concurrent.futures.Future, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+
+
+class ConsortiumExecutor:
+    """Shared thread pool with a global in-flight cap and per-batch caps."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or _default_max_workers()
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="consortium-member"
+        )
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self._waiting: Deque[MemberBatch] = collections.deque()
+        self._shared_caps: Dict[Tuple[str, int], SharedCap] = {}
+
+    def batch(self, max_concurrency: Optional[int] = None, shared_cap: Optional[SharedCap] = None) -> MemberBatch:
+        return MemberBatch(self, max_concurrency, shared_cap)
+
+    def shared_cap(self, key: str, limit: int) -> SharedCap:
+        """The cap shared by every batch created with this key and limit."""
+        with self._lock:
+            cap = self._shared_caps.get((key, limit))
+            if cap is None:
+                cap = self._shared_caps[(key, limit)] = SharedCap(limit)
+                logger.debug(f"Capping '{key}' at {limit} member calls in flight")
+            return cap
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """Change the global cap. Growing replaces the pool; in-flight calls finish on the old one."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        with self._lock:
+            if max_workers == self.max_workers:
+                return
+            if max_workers > self.max_workers:
+                old_pool = self._pool
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="consortium-member"
+                )
+                old_pool.shutdown(wait=False)
+            self.max_workers = max_workers
+        logger.debug(f"Shared consortium executor cap set to {max_workers}")
+        self._pump()
+
+    def _pump(self, batch: Optional[MemberBatch] = None) -> None:
+        """Move queued calls into the pool while both the global and per-batch caps allow."""
+        with self._lock:
+            if batch is not None and batch.queue and batch not in self._waiting:
+                self._waiting.append(batch)
+            for candidate in list(self._waiting):
+                while candidate.queue and candidate.has_capacity() and self.in_flight < self.max_workers:
+                    item = candidate.queue.popleft()
+                    candidate.running += 1
+                    if candidate.shared_cap is not None:
+                        candidate.shared_cap.running += 1
+                    self.in_flight += 1
+                    self._pool.submit(self._run, candidate, item)
+                if not candidate.queue:
+                    self._waiting.remove(candidate)
+
+    def _run(self, batch: MemberBatch, item) -> None:
+        _worker_state.active = True
+        try:
+            _run_item(*item)
+        finally:
+            _worker_state.active = False
+            with self._lock:
+                batch.running -= 1
+                if batch.shared_cap is not None:
+                    batch.shared_cap.running -= 1
+                self.in_flight -= 1
+            self._pump()
+
+
+_shared_executor: Optional[ConsortiumExecutor] = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_executor() -> ConsortiumExecutor:
+    """Return the process-wide executor, creating it on first use."""
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = ConsortiumExecutor()
+        return _shared_executor
+
+
+def set_global_concurrency(max_workers: int) -> None:
+    """Set the process-wide cap on concurrent member calls."""
+    get_shared_executor().set_max_workers(max_workers)
+
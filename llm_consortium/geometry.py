@@ -1,4 +1,4 @@
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -13,6 +13,125 @@ def _cosine_distance(vector: np.ndarray, centroid: np.ndarray) -> float:
     return (1.0 - similarity) / 2.0
 
 
+class GeometryContext:
+    """One iteration's response embeddings, with their pairwise cosine similarities.
+
+    The vectors are stacked into a float32 matrix and L2-normalised once, and the
+    whole (n, n) cosine-similarity matrix comes from a single GEMM. Clustering reads
+    `cosine_distances()`. Distances to a centroid (the mean of the raw vectors, as
+    before) are derived from that matrix and the vector norms, without another pass
+    over the embedding dimensions: cos(x_i, c) = (S[i, idx] @ w) / sqrt(w @ S[idx, idx] @ w)
+    where w are the norms of the rows averaged into c.
+
+    Centroid distances use the repo's (1 - cos) / 2 scale in [0, 1]. Zero vectors
+    are at distance 1 from everything.
+    """
+
+    def __init__(self, vectors: Union[Sequence[np.ndarray], np.ndarray], responses: Optional[Sequence[Dict[str, Any]]] = None):
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(len(matrix), -1) if len(matrix) else np.empty((0, 0), dtype=np.float32)
+        self.matrix = matrix
+        self.norms = np.linalg.norm(matrix, axis=1)
+        self.unit = matrix / np.where(self.norms == 0, 1.0, self.norms)[:, None]
+        self.similarity = self.unit @ self.unit.T
+        # Kept only so the orchestrator can reuse the strategy's context for the same responses
+        self.responses = list(responses) if responses is not None else None
+
+    @classmethod
+    def of(cls, vectors: Union["GeometryContext", Sequence[np.ndarray], np.ndarray]) -> "GeometryContext":
+        return vectors if isinstance(vectors, GeometryContext) else cls(vectors)
+
+    @classmethod
+    def for_responses(cls, responses: Sequence[Dict[str, Any]]) -> "GeometryContext":
+        """Context over responses' "embedding" entries, one row per response."""
+        return cls([response["embedding"] for response in responses], responses=responses)
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def subset(self, indices: Sequence[int]) -> "GeometryContext":
+        """Context over some of the rows, sliced from this one rather than recomputed."""
+        indices = np.asarray(indices, dtype=np.intp)
+        sub = GeometryContext.__new__(GeometryContext)
+        sub.matrix = self.matrix[indices]
+        sub.norms = self.norms[indices]
+        sub.unit = self.unit[indices]
+        sub.similarity = self.similarity[np.ix_(indices, indices)]
+        sub.responses = [self.responses[i] for i in indices] if self.responses is not None else None
+        return sub
+
+    def select(self, responses: Sequence[Dict[str, Any]]) -> Optional["GeometryContext"]:
+        """Subset for these exact response dicts, or None if any is not in this context."""
+        if self.responses is None:
+            return None
+        positions = {id(response): i for i, response in enumerate(self.responses)}
+        indices = []
+        for response in responses:
+            i = positions.get(id(response))
+            if i is None or self.responses[i] is not response:
+                return None
+            indices.append(i)
+        return self.subset(indices)
+
+    def cosine_distances(self) -> np.ndarray:
+        """Pairwise 1 - cos matrix in [0, 2] (sklearn's "cosine" metric), for clustering."""
+        distances = np.clip(1.0 - self.similarity, 0.0, 2.0)
+        zero = self.norms == 0
+        distances[zero, :] = 1.0
+        distances[:, zero] = 1.0
+        np.fill_diagonal(distances, 0.0)
+        return distances
+
+    def _indices(self, indices: Optional[Sequence[int]]) -> np.ndarray:
+        return np.arange(len(self)) if indices is None else np.asarray(indices, dtype=np.intp)
+
+    def centroid(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Mean of the (raw) vectors in indices, default all."""
+        if not len(self):
+            return np.array([], dtype=float)
+        return self.matrix[self._indices(indices)].astype(float).mean(axis=0)
+
+    def centroid_distances(self, indices: Optional[Sequence[int]] = None, rows: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Cosine distance, (1 - cos) / 2, from each of `rows` to the centroid of `indices`."""
+        indices = self._indices(indices)
+        rows = self._indices(rows)
+        weights = self.norms[indices].astype(float)
+        block = self.similarity[np.ix_(indices, indices)].astype(float)
+        centroid_norm = float(np.sqrt(max(weights @ block @ weights, 0.0)))
+        if centroid_norm == 0.0:
+            return np.ones(len(rows), dtype=float)
+        cosines = np.clip(self.similarity[np.ix_(rows, indices)].astype(float) @ weights / centroid_norm, -1.0, 1.0)
+        distances = (1.0 - cosines) / 2.0
+        distances[self.norms[rows] == 0] = 1.0
+        return distances
+
+    def confidence(self, indices: Optional[Sequence[int]] = None) -> float:
+        """1 - mean distance of the vectors in indices to their centroid, clipped to [0, 1]."""
+        if not len(self):
+            return 0.0
+        distances = self.centroid_distances(indices, indices)
+        return max(0.0, min(1.0, 1.0 - float(np.mean(distances))))
+
+    def density(self, indices: Optional[Sequence[int]] = None) -> Tuple[float, float]:
+        """(1 - mean distance, max distance) of a cluster's members to its centroid."""
+        distances = self.centroid_distances(indices, indices)
+        if not distances.size:
+            return 0.0, 0.0
+        return 1.0 - float(np.mean(distances)), float(np.max(distances))
+
+    def outliers(self, threshold_std: float = 2.0) -> List[int]:
+        """Rows further than mean + threshold_std * std from the overall centroid."""
+        if len(self) < 3:
+            return []
+        distances = self.centroid_distances()
+        std_distance = float(np.std(distances))
+        if std_distance == 0.0:
+            return []
+        cutoff = float(np.mean(distances)) + (threshold_std * std_distance)
+        return [index for index, distance in enumerate(distances.tolist()) if distance > cutoff]
+
+
 class TropicalConsensus:
     @staticmethod
     def compute_tropical_centroid(vectors: List[np.ndarray]) -> np.ndarray:
@@ -25,29 +144,25 @@ class TropicalConsensus:
 class GeometricConfidenceCalculator:
     @staticmethod
     def compute_confidence(response_vectors: List[np.ndarray], centroid: np.ndarray) -> float:
-        if not response_vectors or centroid.size == 0:
+        if not len(response_vectors) or centroid.size == 0:
             return 0.0
-        distances = [_cosine_distance(vector, centroid) for vector in response_vectors]
-        mean_distance = float(np.mean(distances)) if distances else 1.0
-        return max(0.0, min(1.0, 1.0 - mean_distance))
+        context = GeometryContext.of(response_vectors)
+        centroid_norm = float(np.linalg.norm(centroid))
+        if centroid_norm == 0.0:
+            return 0.0
+        cosines = np.clip(context.unit.astype(float) @ (centroid / centroid_norm), -1.0, 1.0)
+        distances = np.where(context.norms == 0, 1.0, (1.0 - cosines) / 2.0)
+        return max(0.0, min(1.0, 1.0 - float(np.mean(distances))))
 
     @staticmethod
-    def detect_outliers(vectors: List[np.ndarray], threshold_std: float = 2.0) -> List[int]:
+    def detect_outliers(vectors: Union[GeometryContext, List[np.ndarray]], threshold_std: float = 2.0) -> List[int]:
         if len(vectors) < 3:
             return []
-        centroid = np.mean(np.vstack(vectors), axis=0)
-        distances = np.array([_cosine_distance(vector, centroid) for vector in vectors], dtype=float)
-        mean_distance = float(np.mean(distances))
-        std_distance = float(np.std(distances))
-        if std_distance == 0.0:
-            return []
-        cutoff = mean_distance + (threshold_std * std_distance)
-        return [index for index, distance in enumerate(distances.tolist()) if distance > cutoff]
+        return GeometryContext.of(vectors).outliers(threshold_std)
 
     @staticmethod
-    def compute(response_embeddings: List[np.ndarray]) -> Tuple[float, np.ndarray]:
-        if not response_embeddings:
+    def compute(response_embeddings: Union[GeometryContext, List[np.ndarray]]) -> Tuple[float, np.ndarray]:
+        if not len(response_embeddings):
             return 0.0, np.array([], dtype=float)
-        centroid = np.mean(np.vstack(response_embeddings), axis=0)
-        confidence = GeometricConfidenceCalculator.compute_confidence(response_embeddings, centroid)
-        return confidence, centroid
\ No newline at end of file
+        context = GeometryContext.of(response_embeddings)
+        return context.confidence(), context.centroid()
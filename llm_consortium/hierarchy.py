@@ -0,0 +1,66 @@
+"""Partitioning for hierarchical synthesis.
+
+With many members, one arbiter prompt holding every response outgrows context
+windows, and arbiter latency grows with prompt length. Hierarchical synthesis
+splits the responses into groups of at most `fan_in`, has a sub-arbiter
+synthesise each group in parallel, and repeats on the sub-syntheses until a
+single arbiter can merge what is left.
+
+- `partition_round_robin` deals responses into balanced groups in turn, so every
+  group sees a spread of the members.
+- `partition_by_embedding` puts nearby responses together: each group is the
+  first unassigned response plus its nearest unassigned neighbours, so each
+  sub-arbiter condenses one line of argument.
+- `expand_ranking` turns a ranking of sub-syntheses back into a ranking of the
+  member responses they came from.
+"""
+import math
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .geometry import GeometryContext
+
+HIERARCHICAL_PARTITIONS = ("round_robin", "embedding")
+
+
+def _group_count(n: int, fan_in: int) -> int:
+    return math.ceil(n / max(2, fan_in))
+
+
+def partition_round_robin(n: int, fan_in: int) -> List[List[int]]:
+    """Indices 0..n-1 dealt into ceil(n / fan_in) groups of near-equal size."""
+    groups = _group_count(n, fan_in)
+    return [list(range(start, n, groups)) for start in range(groups)]
+
+
+def partition_by_embedding(context: GeometryContext, fan_in: int) -> List[List[int]]:
+    """Groups of mutually near responses, balanced to the same sizes as round-robin."""
+    n = len(context)
+    sizes = [len(group) for group in partition_round_robin(n, fan_in)]
+    distances = context.cosine_distances()
+    unassigned = np.ones(n, dtype=bool)
+    partition = []
+    for size in sizes:
+        candidates = np.flatnonzero(unassigned)
+        seed = int(candidates[0])
+        nearest = candidates[np.argsort(distances[seed, candidates], kind="stable")[:size]]
+        unassigned[nearest] = False
+        partition.append(sorted(int(index) for index in nearest))
+    return partition
+
+
+def expand_ranking(ranking: Sequence[Any], inputs: Sequence[Dict[str, Any]]) -> List[Any]:
+    """Member ids in the order of the ranked inputs, each input contributing its own ranking.
+
+    Inputs that are member responses contribute their id; sub-syntheses contribute
+    the member ranking they carry. Unranked inputs follow in their original order.
+    """
+    by_id = {item.get("id", index): item for index, item in enumerate(inputs)}
+    order = [rank for rank in ranking if rank in by_id] + list(by_id)
+    expanded: List[Any] = []
+    for key in dict.fromkeys(order):
+        for member_id in by_id[key].get("member_ranking", [key]):
+            if member_id not in expanded:
+                expanded.append(member_id)
+    return expanded
@@ -0,0 +1,325 @@
+"""Versioned schema migrations for the consortium logs database.
+
+Migrations are applied in order, once per database file, the first time a process
+connects to it (see `DatabaseConnection`). Each one runs in its own IMMEDIATE
+transaction together with its `_consortium_migrations` record, so concurrent
+processes never apply the same migration twice. Add new migrations at the end with
+the `@migration` decorator; never edit or reorder one that has shipped.
+
+Tables are created here rather than on insert, so writers never need `alter=True`
+schema introspection.
+"""
+import datetime
+import json
+from typing import Callable, Dict, List, Optional
+
+import sqlite_utils
+
+from .vectors import VECTOR_DTYPE, pack_vector
+
+MIGRATIONS_TABLE = "_consortium_migrations"
+
+MIGRATIONS: List[Callable[[sqlite_utils.Database], None]] = []
+
+
+def migration(fn: Callable[[sqlite_utils.Database], None]) -> Callable[[sqlite_utils.Database], None]:
+    MIGRATIONS.append(fn)
+    return fn
+
+
+def applied_migrations(db: sqlite_utils.Database) -> List[str]:
+    if MIGRATIONS_TABLE not in db.table_names():
+        return []
+    return [row[0] for row in db.conn.execute(f"SELECT name FROM {MIGRATIONS_TABLE} ORDER BY version")]
+
+
+def migrate(db: sqlite_utils.Database, until: Optional[str] = None) -> List[str]:
+    """Apply pending migrations (optionally stopping after `until`); return the names applied."""
+    conn = db.conn
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} (version INTEGER PRIMARY KEY, name TEXT NOT NULL, applied_at TEXT)"
+    )
+    conn.commit()
+    applied = []
+    for version, fn in enumerate(MIGRATIONS, start=1):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute(f"SELECT 1 FROM {MIGRATIONS_TABLE} WHERE version = ?", [version]).fetchone() is None:
+                fn(db)
+                conn.execute(
+                    f"INSERT INTO {MIGRATIONS_TABLE} (version, name, applied_at) VALUES (?, ?, ?)",
+                    [version, fn.__name__, datetime.datetime.utcnow().isoformat()],
+                )
+                applied.append(fn.__name__)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if fn.__name__ == until:
+            break
+    return applied
+
+
+def _ensure_columns(db: sqlite_utils.Database, table: str, columns: Dict[str, str]) -> None:
+    existing = {row[1] for row in db.conn.execute(f"PRAGMA table_info([{table}])")}
+    for name, column_type in columns.items():
+        if name not in existing:
+            db.conn.execute(f"ALTER TABLE [{table}] ADD COLUMN [{name}] {column_type}")
+
+
+@migration
+def m001_initial_schema(db: sqlite_utils.Database) -> None:
+    for statement in (
+        """
+        CREATE TABLE IF NOT EXISTS consortium_runs (
+            id TEXT PRIMARY KEY,
+            created_at TEXT,
+            config_name TEXT,
+            strategy TEXT,
+            judging_method TEXT,
+            confidence_threshold REAL,
+            max_iterations INTEGER,
+            iteration_count INTEGER,
+            final_confidence REAL,
+            user_prompt TEXT,
+            category TEXT,
+            expected_agreement REAL,
+            status TEXT,
+            FOREIGN KEY (config_name) REFERENCES consortium_configs(name)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS consortium_members (
+            run_id TEXT,
+            response_id TEXT,
+            role TEXT,
+            iteration INTEGER,
+            member_index INTEGER,
+            status TEXT,
+            PRIMARY KEY (run_id, response_id),
+            FOREIGN KEY (run_id) REFERENCES consortium_runs(id),
+            FOREIGN KEY (response_id) REFERENCES responses(id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS arbiter_decisions (
+            run_id TEXT,
+            iteration INTEGER,
+            response_id TEXT,
+            chosen_response_id TEXT,
+            confidence REAL,
+            synthesis TEXT,
+            decision_json TEXT,
+            ranking_json TEXT,
+            refinement_areas TEXT,
+            geometric_confidence REAL,
+            centroid_vector TEXT,
+            PRIMARY KEY (run_id, iteration),
+            FOREIGN KEY (run_id) REFERENCES consortium_runs(id),
+            FOREIGN KEY (response_id) REFERENCES responses(id),
+            FOREIGN KEY (chosen_response_id) REFERENCES responses(id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS circuit_breaker_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            model TEXT,
+            previous_state TEXT,
+            state TEXT,
+            reason TEXT,
+            created_at TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS member_response_cache (
+            key TEXT PRIMARY KEY,
+            model TEXT,
+            response_text TEXT,
+            response_id TEXT,
+            response_json TEXT,
+            created_at REAL,
+            last_used_at REAL,
+            hits INTEGER DEFAULT 0
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_member_response_cache_last_used
+        ON member_response_cache (last_used_at)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS consortium_configs (
+            name TEXT PRIMARY KEY,
+            config TEXT NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ):
+        db.conn.execute(statement)
+
+
+@migration
+def m002_columns_added_since_release(db: sqlite_utils.Database) -> None:
+    # Logs DBs created by older releases predate these columns; they used to be added
+    # lazily by `alter=True` inserts
+    _ensure_columns(db, "consortium_runs", {
+        "category": "TEXT", "expected_agreement": "REAL", "status": "TEXT", "visualization_json": "TEXT",
+    })
+    _ensure_columns(db, "consortium_members", {"status": "TEXT"})
+    _ensure_columns(db, "arbiter_decisions", {"geometric_confidence": "REAL", "centroid_vector": "TEXT"})
+
+
+@migration
+def m003_embedding_tables(db: sqlite_utils.Database) -> None:
+    db.conn.execute("""
+        CREATE TABLE IF NOT EXISTS response_embeddings (
+            response_id TEXT PRIMARY KEY,
+            run_id TEXT,
+            model TEXT,
+            embedding_json TEXT,
+            embedding_model TEXT,
+            created_at TEXT
+        )
+    """)
+    _ensure_columns(db, "response_embeddings", {"embedding_model": "TEXT", "created_at": "TEXT"})
+    db.conn.execute("""
+        CREATE TABLE IF NOT EXISTS consensus_clusters (
+            run_id TEXT,
+            iteration INTEGER,
+            cluster_id INTEGER,
+            centroid_json TEXT,
+            radius REAL,
+            density REAL
+        )
+    """)
+    db.conn.execute("""
+        CREATE TABLE IF NOT EXISTS semantic_answer_cache (
+            run_id TEXT PRIMARY KEY,
+            config_hash TEXT,
+            prompt TEXT,
+            embedding_json TEXT,
+            embedding_model TEXT,
+            synthesis_json TEXT,
+            created_at TEXT
+        )
+    """)
+
+
+@migration
+def m004_indexes(db: sqlite_utils.Database) -> None:
+    for statement in (
+        # `runs` / `runs --since`: ORDER BY created_at DESC with an optional lower bound
+        "CREATE INDEX IF NOT EXISTS idx_consortium_runs_created_at ON consortium_runs (created_at)",
+        # run-info and trace reads: members of a run in iteration / member order
+        "CREATE INDEX IF NOT EXISTS idx_consortium_members_run_iteration "
+        "ON consortium_members (run_id, iteration, member_index)",
+        "CREATE INDEX IF NOT EXISTS idx_response_embeddings_run_id ON response_embeddings (run_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_consensus_clusters_run_iteration ON consensus_clusters (run_id, iteration)",
+        "CREATE INDEX IF NOT EXISTS idx_semantic_answer_cache_config_created "
+        "ON semantic_answer_cache (config_hash, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_circuit_breaker_events_model ON circuit_breaker_events (model, created_at)",
+    ):
+        db.conn.execute(statement)
+    db.conn.execute("ANALYZE")
+
+
+# (table, JSON text column, blob column prefix) for vectors moved to float32 BLOBs
+_VECTOR_COLUMNS = (
+    ("response_embeddings", "embedding_json", "embedding"),
+    ("semantic_answer_cache", "embedding_json", "embedding"),
+    ("arbiter_decisions", "centroid_vector", "centroid"),
+    ("consensus_clusters", "centroid_json", "centroid"),
+)
+
+
+@migration
+def m005_binary_vectors(db: sqlite_utils.Database) -> None:
+    # Vectors were stored as JSON text; convert them to float32 LE blobs with dim/dtype
+    # columns and clear the JSON copies
+    for table, json_column, prefix in _VECTOR_COLUMNS:
+        _ensure_columns(db, table, {prefix: "BLOB", f"{prefix}_dim": "INTEGER", f"{prefix}_dtype": "TEXT"})
+        last_rowid = -1
+        while True:
+            rows = db.conn.execute(
+                f"SELECT rowid, [{json_column}] FROM [{table}] "
+                f"WHERE rowid > ? AND [{json_column}] IS NOT NULL AND [{prefix}] IS NULL ORDER BY rowid LIMIT 5000",
+                [last_rowid],
+            ).fetchall()
+            if not rows:
+                break
+            last_rowid = rows[-1][0]
+            updates = []
+            for rowid, text in rows:
+                try:
+                    values = json.loads(text)
+                except (TypeError, ValueError):
+                    continue
+                blob, dim = pack_vector(values) if values else (None, None)
+                updates.append((blob, dim, VECTOR_DTYPE if blob else None, rowid))
+            db.conn.executemany(
+                f"UPDATE [{table}] SET [{prefix}] = ?, [{prefix}_dim] = ?, [{prefix}_dtype] = ?, [{json_column}] = NULL "
+                "WHERE rowid = ?",
+                updates,
+            )
+
+
+@migration
+def m006_embedding_cache(db: sqlite_utils.Database) -> None:
+    db.conn.execute("""
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            namespace TEXT,
+            text_hash TEXT,
+            embedding BLOB,
+            embedding_dim INTEGER,
+            embedding_dtype TEXT,
+            created_at REAL,
+            last_used_at REAL,
+            hits INTEGER DEFAULT 0,
+            PRIMARY KEY (namespace, text_hash)
+        )
+    """)
+    db.conn.execute("CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache (last_used_at)")
+
+
+@migration
+def m007_arbiter_decision_attempts(db: sqlite_utils.Database) -> None:
+    # An arbiter cascade records one decision per attempt, so the key gains `attempt`.
+    # SQLite cannot change a primary key in place; rebuild the table and copy the rows.
+    columns = [row[1] for row in db.conn.execute("PRAGMA table_info([arbiter_decisions])")]
+    db.conn.execute("ALTER TABLE arbiter_decisions RENAME TO _arbiter_decisions_m007")
+    db.conn.execute("""
+        CREATE TABLE arbiter_decisions (
+            run_id TEXT,
+            iteration INTEGER,
+            attempt INTEGER NOT NULL DEFAULT 0,
+            arbiter_model TEXT,
+            escalated INTEGER NOT NULL DEFAULT 0,
+            escalation_reason TEXT,
+            response_id TEXT,
+            chosen_response_id TEXT,
+            confidence REAL,
+            synthesis TEXT,
+            decision_json TEXT,
+            ranking_json TEXT,
+            refinement_areas TEXT,
+            geometric_confidence REAL,
+            centroid_vector TEXT,
+            centroid BLOB,
+            centroid_dim INTEGER,
+            centroid_dtype TEXT,
+            PRIMARY KEY (run_id, iteration, attempt),
+            FOREIGN KEY (run_id) REFERENCES consortium_runs(id),
+            FOREIGN KEY (response_id) REFERENCES responses(id),
+            FOREIGN KEY (chosen_response_id) REFERENCES responses(id)
+        )
+    """)
+    copied = ", ".join(f"[{column}]" for column in columns)
+    db.conn.execute(f"INSERT INTO arbiter_decisions ({copied}) SELECT {copied} FROM _arbiter_decisions_m007")
+    db.conn.execute("DROP TABLE _arbiter_decisions_m007")
+
+
+@migration
+def m008_member_cache_created_at(db: sqlite_utils.Database) -> None:
+    # The cache's TTL sweep deletes by created_at
+    db.conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_member_response_cache_created_at ON member_response_cache (created_at)"
+    )
@@ -1,11 +1,20 @@
 import llm
+import asyncio
 import json
 import logging
+import queue
+import threading
 import uuid
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 from datetime import datetime
+from .agreement import ARBITER_SKIP_METHODS
+from .cache import CACHE_POLICIES, DEFAULT_CACHE_MAX_ENTRIES, DEFAULT_CACHE_TTL_S
 from .db import DatabaseConnection
+from .embeddings.cache import DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES
+from .executor import in_worker_thread
+from .hierarchy import HIERARCHICAL_PARTITIONS
+from .ratelimit import validate_rate_limit_spec
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +36,40 @@ class ConsortiumConfig(BaseModel):
     max_iterations: int = 3
     minimum_iterations: int = 1
     arbiter: Optional[str] = None
+    arbiter_escalation: Optional[List[str]] = Field(default=None, description="Stronger arbiters tried in order when the previous arbiter's output cannot be parsed or its confidence is below arbiter_escalation_threshold")
+    arbiter_escalation_threshold: Optional[float] = Field(default=None, description="Confidence below which the next arbiter in arbiter_escalation is asked (defaults to confidence_threshold)")
     judging_method: str = "default"
     strategy: Optional[str] = None
     strategy_params: Optional[Dict[str, Any]] = None
     embedding_backend: Optional[str] = None
     embedding_model: Optional[str] = None
     embedding_cache_enabled: bool = True
+    embedding_cache_max_entries: int = Field(default=DEFAULT_EMBEDDING_CACHE_MAX_ENTRIES, description="Embeddings kept in the persistent cross-process cache, least recently used evicted first (0 keeps only the in-memory cache)")
     manual_context: bool = Field(default=False, description="Use manual context management instead of automatic conversation objects")
     category: Optional[str] = None
     expected_agreement: Optional[float] = None
     status: Optional[str] = None
+    min_quorum: Optional[float] = Field(default=None, description="Valid member responses needed before synthesis may start early: a count (>= 1) or a fraction of the fan-out (< 1)")
+    member_deadline_s: Optional[float] = Field(default=None, description="Seconds to wait for stragglers once the quorum is met")
+    max_concurrency: Optional[int] = Field(default=None, description="Per-run cap on concurrent member calls")
+    global_max_concurrency: Optional[int] = Field(default=None, description="Cap on sync member calls in flight across all concurrent runs of this consortium; the process-wide pool size is LLM_CONSORTIUM_MAX_WORKERS")
+    max_retries: int = Field(default=2, description="Retries for transient member errors (rate limits, timeouts, 5xx)")
+    retry_base_delay_s: float = Field(default=0.5, description="Base delay for full-jitter exponential backoff between retries")
+    retry_max_delay_s: float = Field(default=8.0, description="Upper bound on a single backoff delay")
+    breaker_failure_threshold: int = Field(default=5, description="Consecutive failed calls that open a model's circuit breaker (0 disables)")
+    breaker_reset_s: float = Field(default=60.0, description="Seconds an open breaker waits before letting a probe call through")
+    cache_policy: str = Field(default="off", description="Member response cache: off, read_write, read_only or refresh")
+    cache_ttl_s: Optional[float] = Field(default=DEFAULT_CACHE_TTL_S, description="Seconds a cached member response stays valid (None for no expiry)")
+    cache_max_entries: int = Field(default=DEFAULT_CACHE_MAX_ENTRIES, description="Cached member responses kept before least-recently-used eviction")
+    semantic_cache_enabled: bool = Field(default=False, description="Answer near-duplicate prompts from a past run's final synthesis (needs embedding_backend)")
+    semantic_cache_max_distance: float = Field(default=0.05, description="Largest cosine distance between prompt embeddings that counts as a semantic cache hit")
+    semantic_cache_max_age_s: Optional[float] = Field(default=24 * 3600.0, description="Ignore semantic cache entries older than this many seconds (None for no limit)")
+    hierarchical_fan_in: Optional[int] = Field(default=None, description="Most responses in one arbiter prompt; larger fan-outs are synthesised in groups by sub-arbiters first")
+    hierarchical_max_depth: int = Field(default=2, description="Levels of sub-synthesis at most before the final merge")
+    hierarchical_partition: str = Field(default="round_robin", description="How responses are grouped for sub-arbiters: round_robin or embedding")
+    arbiter_skip: str = Field(default="off", description="Skip the arbiter when members already agree: off, exact, similarity or geometric")
+    arbiter_skip_threshold: float = Field(default=0.9, description="Agreement score (0-1) the similarity and geometric checks must reach to skip the arbiter")
+    rate_limits: Optional[Dict[str, Dict[str, float]]] = Field(default=None, description="Client-side limits per model id or provider prefix, e.g. {'openrouter/': {'rps': 2, 'burst': 4, 'max_in_flight': 3}}")
 
     def model_post_init(self, __context: Any) -> None:
         self.strategy = _normalize_mode_name(self.strategy, "default")
@@ -46,6 +79,58 @@ class ConsortiumConfig(BaseModel):
         if self.embedding_model is not None:
             self.embedding_model = self.embedding_model.strip() or None
 
+        if self.min_quorum is not None and self.min_quorum <= 0:
+            raise ValueError("min_quorum must be positive")
+        if self.member_deadline_s is not None and self.member_deadline_s < 0:
+            raise ValueError("member_deadline_s must be non-negative")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if self.global_max_concurrency is not None and self.global_max_concurrency < 1:
+            raise ValueError("global_max_concurrency must be at least 1")
+        self.cache_policy = _normalize_mode_name(self.cache_policy, "off")
+        if self.cache_policy not in CACHE_POLICIES:
+            raise ValueError(f"cache_policy must be one of {', '.join(CACHE_POLICIES)}")
+        if self.cache_ttl_s is not None and self.cache_ttl_s <= 0:
+            raise ValueError("cache_ttl_s must be positive")
+        if self.embedding_cache_max_entries < 0:
+            raise ValueError("embedding_cache_max_entries must be non-negative")
+        if self.cache_max_entries < 1:
+            raise ValueError("cache_max_entries must be at least 1")
+        if not 0 <= self.semantic_cache_max_distance <= 2:
+            raise ValueError("semantic_cache_max_distance must be between 0 and 2")
+        if self.semantic_cache_max_age_s is not None and self.semantic_cache_max_age_s <= 0:
+            raise ValueError("semantic_cache_max_age_s must be positive")
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        if self.retry_base_delay_s < 0 or self.retry_max_delay_s < 0:
+            raise ValueError("retry delays must be non-negative")
+        if self.breaker_failure_threshold < 0:
+            raise ValueError("breaker_failure_threshold must be non-negative")
+        if self.breaker_reset_s < 0:
+            raise ValueError("breaker_reset_s must be non-negative")
+        self.arbiter_escalation = [model.strip() for model in self.arbiter_escalation or [] if model and model.strip()] or None
+        if self.arbiter_escalation and not self.arbiter:
+            raise ValueError("arbiter_escalation needs an arbiter to escalate from")
+        if self.arbiter_escalation_threshold is not None and not 0 <= self.arbiter_escalation_threshold <= 1:
+            raise ValueError("arbiter_escalation_threshold must be between 0 and 1")
+        if self.hierarchical_fan_in is not None and self.hierarchical_fan_in < 2:
+            raise ValueError("hierarchical_fan_in must be at least 2")
+        if self.hierarchical_max_depth < 1:
+            raise ValueError("hierarchical_max_depth must be at least 1")
+        self.hierarchical_partition = _normalize_mode_name(self.hierarchical_partition, "round_robin")
+        if self.hierarchical_partition not in HIERARCHICAL_PARTITIONS:
+            raise ValueError(f"hierarchical_partition must be one of {', '.join(HIERARCHICAL_PARTITIONS)}")
+        self.arbiter_skip = _normalize_mode_name(self.arbiter_skip, "off")
+        if self.arbiter_skip not in ARBITER_SKIP_METHODS:
+            raise ValueError(f"arbiter_skip must be one of {', '.join(ARBITER_SKIP_METHODS)}")
+        if not 0 <= self.arbiter_skip_threshold <= 1:
+            raise ValueError("arbiter_skip_threshold must be between 0 and 1")
+        for pattern, limits in (self.rate_limits or {}).items():
+            try:
+                validate_rate_limit_spec(limits)
+            except ValueError as e:
+                raise ValueError(f"Invalid rate limit for '{pattern}': {e}") from e
+
         # Elimination strategy requires ranking output, so force rank judging
         if self.strategy == "elimination" and self.judging_method != "rank":
             self.judging_method = "rank"
@@ -110,10 +195,17 @@ class DummyModel(llm.Model):
         else:
             return message
 
+def _synthesis_text(result: Dict[str, Any]) -> str:
+    synthesis_text = result.get("synthesis", {}).get("synthesis", "")
+    return synthesis_text or str(result)
+
 class ConsortiumModel(llm.Model):
+    can_stream = True
+
     class Options(llm.Options):
         max_iterations: Optional[int] = None
         system_prompt: Optional[str] = None
+        no_cache: Optional[bool] = None
 
     def __init__(self, model_id: str, config: ConsortiumConfig):
         super().__init__()
@@ -151,13 +243,119 @@ class ConsortiumModel(llm.Model):
             except:
                 pass
 
-        result = orchestator.orchestrate(prompt.prompt, conversation_history=history, consortium_id=consortium_id)
-        
-        synthesis_text = result.get("synthesis", {}).get("synthesis", "")
-        if synthesis_text:
-            yield synthesis_text
-        else:
-            yield str(result)
+        use_cache = not getattr(prompt.options, "no_cache", None)
+        # A nested consortium called from a member thread runs on that thread, so its
+        # member batch helps with its own queue instead of waiting on the shared pool
+        if not stream or in_worker_thread():
+            result = orchestator.orchestrate(prompt.prompt, conversation_history=history, consortium_id=consortium_id,
+                                             use_cache=use_cache)
+            yield _synthesis_text(result)
+            return
+
+        # Run the consortium in the background and forward synthesis tokens as they arrive
+        chunks: "queue.Queue[Any]" = queue.Queue()
+        done = object()
+        outcome: Dict[str, Any] = {}
+
+        def run():
+            try:
+                outcome["result"] = orchestator.orchestrate(
+                    prompt.prompt,
+                    conversation_history=history,
+                    consortium_id=consortium_id,
+                    on_synthesis_chunk=chunks.put,
+                    use_cache=use_cache,
+                )
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                chunks.put(done)
+
+        worker = threading.Thread(target=run, name=f"consortium-{consortium_id}", daemon=True)
+        worker.start()
+        streamed = False
+        while True:
+            chunk = chunks.get()
+            if chunk is done:
+                break
+            streamed = True
+            yield chunk
+        worker.join()
+
+        if "error" in outcome:
+            raise outcome["error"]
+        if not streamed:
+            yield _synthesis_text(outcome["result"])
+
+
+class AsyncConsortiumModel(llm.AsyncModel):
+    """Async variant of ConsortiumModel, driven by ConsortiumOrchestrator.orchestrate_async."""
+
+    can_stream = True
+    Options = ConsortiumModel.Options
+
+    def __init__(self, model_id: str, config: ConsortiumConfig):
+        super().__init__()
+        self.model_id = str(model_id)
+        self.config = config
+
+    def __str__(self):
+        return f"Async Consortium Model: {self.model_id}"
+
+    async def execute(self, prompt, stream, response, conversation):
+        # Orchestrators keep per-run state, so concurrent async runs each get their own
+        from .orchestrator import ConsortiumOrchestrator
+        try:
+            orchestrator = ConsortiumOrchestrator(self.config, config_name=self.model_id)
+        except Exception as e:
+            raise llm.ModelError(f"Failed to initialize consortium: {e}")
+
+        history = None
+        if conversation:
+            try:
+                history_text = []
+                for entry in conversation.responses:
+                    history_text.append(f"Human: {entry.prompt.prompt}")
+                    history_text.append(f"Assistant: {entry.text_or_raise()}")
+                if history_text:
+                    history = "\n".join(history_text)
+            except:
+                pass
+
+        consortium_id = str(uuid.uuid4())
+        use_cache = not getattr(prompt.options, "no_cache", None)
+        # A nested consortium called from a member thread runs on that thread, so its
+        # member batch helps with its own queue instead of waiting on the shared pool
+        if not stream or in_worker_thread():
+            result = await orchestrator.orchestrate_async(prompt.prompt, conversation_history=history, consortium_id=consortium_id,
+                                                          use_cache=use_cache)
+            yield _synthesis_text(result)
+            return
+
+        chunks: "asyncio.Queue[str]" = asyncio.Queue()
+        run = asyncio.ensure_future(orchestrator.orchestrate_async(
+            prompt.prompt,
+            conversation_history=history,
+            consortium_id=consortium_id,
+            on_synthesis_chunk=chunks.put_nowait,
+            use_cache=use_cache,
+        ))
+        streamed = False
+        while True:
+            getter = asyncio.ensure_future(chunks.get())
+            await asyncio.wait({getter, run}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                break
+            streamed = True
+            yield getter.result()
+        while not chunks.empty():
+            streamed = True
+            yield chunks.get_nowait()
+
+        result = run.result()
+        if not streamed:
+            yield _synthesis_text(result)
 
 # Register models function for the plugin system
 def register_models(register):
@@ -176,8 +374,8 @@ def register_models(register):
                 try:
                     config_data = json.loads(row.get("config", "{}"))
                     # Use the existing ConsortiumModel class
-                    model = ConsortiumModel(name, ConsortiumConfig.from_dict(config_data))
-                    register(model)
+                    config = ConsortiumConfig.from_dict(config_data)
+                    register(ConsortiumModel(name, config), AsyncConsortiumModel(name, config))
                     logger.debug(f"Registered consortium model: {name}")
                 except Exception as e:
                     logger.error(f"Failed to register consortium model '{name}': {e}")
@@ -1,25 +1,39 @@
+import asyncio
 import concurrent.futures
+import contextvars
 import logging
 import re
 import uuid
 import json
+import math
 import time
 import pathlib
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 import llm
 
+from .agreement import check_agreement
 from .strategies.factory import create_strategy
+from .cache import MemberResponseCache, cache_disabled_by_env, member_cache_key
 from .db import (
     log_response,
     save_consortium_run,
     save_consortium_member,
     save_arbiter_decision,
+    mark_consortium_member_late,
+    flush_writes,
     update_consortium_run,
 )
-from .embeddings.service import EmbeddingService, create_embedding_service
-from .geometry import GeometricConfidenceCalculator
+from .embeddings.registry import get_embedding_service
+from .embeddings.service import EmbeddingService
+from .executor import MemberBatch, SharedCap, get_shared_executor
+from .geometry import GeometricConfidenceCalculator, GeometryContext
+from .hierarchy import expand_ranking, partition_by_embedding, partition_round_robin
 from .models import ConsortiumConfig
+from .ratelimit import member_rate_limit, member_rate_limit_async
+from .resilience import call_with_retries, call_with_retries_async, get_circuit_breaker
+from .semantic_cache import SemanticAnswerCache
+from .streaming import SynthesisStreamExtractor
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +55,25 @@ def _read_arbiter_prompt() -> str:
 def _read_iteration_prompt() -> str:
     return _read_prompt_file("iteration_prompt.xml")
 
+def _member_options(model_id: str) -> Dict[str, Any]:
+    """Default options saved with `llm models options set`, applied to member calls as `llm prompt` does."""
+    try:
+        from llm.cli import get_model_options
+    except ImportError:
+        return {}
+    try:
+        return dict(get_model_options(model_id))
+    except Exception as e:
+        logger.debug(f"Could not read saved options for {model_id}: {e}")
+        return {}
+
+def _get_async_model(model_id: str) -> Optional[llm.AsyncModel]:
+    """Return the async variant of a model, or None when only a sync model is registered."""
+    try:
+        return llm.get_async_model(model_id)
+    except llm.UnknownModelError:
+        return None
+
 class IterationContext:
     def __init__(self, synthesis: Dict[str, Any], model_responses: List[Dict[str, Any]]):
         self.synthesis = synthesis
@@ -63,27 +96,129 @@ class ConsortiumOrchestrator:
         self._conversation_history = ""
         self.consortium_id = None
         self._embedding_service: Optional[EmbeddingService] = None
+        self._on_synthesis_chunk: Optional[Callable[[str], None]] = None
+        self._use_cache = True
+        self._member_cache: Optional[MemberResponseCache] = None
+        self._semantic_answer_cache: Optional[SemanticAnswerCache] = None
+        self._prompt_vector = None
+        self._embedding_stats_baseline: Dict[str, int] = {}
+        # Smoothed member latencies, used to estimate the time an early stop saved
+        self._member_latency: Dict[str, float] = {}
+        self._early_stops: List[Dict[str, Any]] = []
+        if config.cache_policy != "off":
+            self._member_cache = MemberResponseCache(config.cache_ttl_s, config.cache_max_entries)
+        # Shared by every concurrent run of this consortium; the process-wide pool is left alone
+        self._member_cap: Optional[SharedCap] = None
+        if config.global_max_concurrency:
+            self._member_cap = get_shared_executor().shared_cap(config_name or f"orchestrator-{id(self)}",
+                                                                config.global_max_concurrency)
 
     def get_embedding_service(self) -> EmbeddingService:
         if self._embedding_service is None:
-            self._embedding_service = create_embedding_service(self.config)
+            self._embedding_service = get_embedding_service(self.config)
         return self._embedding_service
 
-    def orchestrate(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None) -> Dict[str, Any]:
-        """Main entry point for orchestration - chooses method based on config."""
+    def orchestrate(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None,
+                    on_synthesis_chunk: Optional[Callable[[str], None]] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """Main entry point for orchestration - chooses method based on config.
+
+        If on_synthesis_chunk is given, the final iteration's <synthesis> text is passed
+        to it piece by piece while the arbiter is still generating. use_cache=False
+        bypasses the member response cache for this run whatever cache_policy says.
+        """
         self.consortium_id = consortium_id or str(uuid.uuid4())
-        
+        self._on_synthesis_chunk = on_synthesis_chunk
+        self._use_cache = use_cache
+        self._embedding_stats_baseline = self._embedding_service_stats()
+        self._early_stops = []
+
+        cached = self._check_semantic_cache(prompt, conversation_history)
+        if cached is not None:
+            return cached
+
         if self.manual_context:
-            return self._orchestrate_manual(prompt, conversation_history, self.consortium_id)
+            result = self._orchestrate_manual(prompt, conversation_history, self.consortium_id)
         else:
-            return self._orchestrate_automatic(prompt, conversation_history, self.consortium_id)
+            result = self._orchestrate_automatic(prompt, conversation_history, self.consortium_id)
+        self._store_semantic_cache(prompt, result)
+        return result
 
-    def _orchestrate_manual(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None) -> Dict[str, Any]:
+    async def orchestrate_async(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None,
+                                on_synthesis_chunk: Optional[Callable[[str], None]] = None, use_cache: bool = True) -> Dict[str, Any]:
+        """Asyncio entry point: member calls, arbiter call, embeddings and DB logging share one event loop.
+
+        Models with an async variant are awaited directly; sync-only models (for example
+        nested consortiums) are run in a worker thread so they never block the loop.
+        on_synthesis_chunk behaves as in orchestrate() and is called from the loop thread.
+        """
+        self.consortium_id = consortium_id or str(uuid.uuid4())
+        self._on_synthesis_chunk = on_synthesis_chunk
+        self._use_cache = use_cache
+        self._embedding_stats_baseline = self._embedding_service_stats()
+        self._early_stops = []
+
+        cached = await asyncio.to_thread(self._check_semantic_cache, prompt, conversation_history)
+        if cached is not None:
+            return cached
+
+        result = await self._orchestrate_async(prompt, conversation_history, self.consortium_id)
+        await asyncio.to_thread(self._store_semantic_cache, prompt, result)
+        return result
+
+    def _semantic_cache(self) -> Optional[SemanticAnswerCache]:
+        if not self.config.semantic_cache_enabled or not self._use_cache or cache_disabled_by_env():
+            return None
+        if not self.config.embedding_backend:
+            logger.warning("semantic_cache_enabled needs an embedding_backend; skipping the semantic cache")
+            return None
+        if self._semantic_answer_cache is None:
+            self._semantic_answer_cache = SemanticAnswerCache(self.get_embedding_service(), self.config, label=self.config_name)
+        return self._semantic_answer_cache
+
+    def _check_semantic_cache(self, prompt: str, conversation_history: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a finished result from a near-duplicate past run, or None to run normally."""
+        self._prompt_vector = None
+        cache = self._semantic_cache()
+        # A prompt inside a conversation depends on its history, so it is never answered from the cache
+        if cache is None or conversation_history:
+            return None
+        try:
+            vector = cache.embed(prompt)
+            match = cache.lookup(vector)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed, running the consortium: {e}")
+            return None
+        self._prompt_vector = vector
+        if match is None:
+            return None
+
+        entry, distance = match
+        logger.info(f"Semantic cache hit from run {entry['run_id']} (cosine distance {distance:.4f})")
+        synthesis = json.loads(entry["synthesis_json"])
         self.iteration_history = []
-        self._conversation_history = conversation_history or ""
-        
-        self.strategy.initialize_state()
-        
+        self._save_run_start(prompt, self.consortium_id, status="semantic_cache_hit",
+                             final_confidence=float(synthesis.get("confidence", 0.0) or 0.0))
+        result = self._build_final_result(prompt, self.consortium_id)
+        result["synthesis"] = synthesis
+        result["metadata"]["semantic_cache"] = {
+            "source_run_id": entry["run_id"],
+            "distance": distance,
+            "matched_prompt": entry["prompt"],
+        }
+        return result
+
+    def _store_semantic_cache(self, prompt: str, result: Dict[str, Any]) -> None:
+        if self._prompt_vector is None or self._semantic_answer_cache is None:
+            return
+        synthesis = result.get("synthesis") or {}
+        if not synthesis.get("synthesis") or synthesis.get("error"):
+            return
+        if self.config.status in ("model_failure", "embedding_failure"):
+            return
+        self._semantic_answer_cache.store(str(result["metadata"]["consortium_id"]), prompt, self._prompt_vector, synthesis)
+
+    def _save_run_start(self, prompt: str, consortium_id: Optional[str], status: str = "running",
+                        final_confidence: float = 0.0) -> None:
         save_consortium_run(
             run_id=str(consortium_id),
             strategy=getattr(self.config, 'strategy', None) or "default",
@@ -91,22 +226,82 @@ class ConsortiumOrchestrator:
             confidence_threshold=self.confidence_threshold,
             max_iterations=self.max_iterations,
             iteration_count=0,
-            final_confidence=0.0,
+            final_confidence=final_confidence,
             user_prompt=prompt,
             config_name=self.config_name,
             category=self.config.category,
             expected_agreement=self.config.expected_agreement,
-            status="running"
+            status=status
         )
+
+    def _embedding_service_stats(self) -> Dict[str, int]:
+        stats = getattr(self._embedding_service, "cache_stats", None)
+        return stats() if stats is not None else {}
+
+    def _embedding_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Embedding cache hits and misses during the current run, or None if nothing was embedded."""
+        current = self._embedding_service_stats()
+        stats = {key: value - self._embedding_stats_baseline.get(key, 0) for key, value in current.items()}
+        lookups = sum(stats.values())
+        if not lookups:
+            return None
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["persistent_hits"]) / lookups, 4)
+        return stats
+
+    def _build_final_result(self, prompt: str, consortium_id: Optional[str]) -> Dict[str, Any]:
+        synthesis_dict = self.iteration_history[-1].get("synthesis", {}) if self.iteration_history else {}
+        result = {
+            "synthesis": synthesis_dict,
+            "iterations": self.iteration_history,
+            "metadata": {
+                "total_iterations": len(self.iteration_history),
+                "consortium_id": consortium_id,
+                "config": self.config.to_dict()
+            },
+            "original_prompt": prompt
+        }
+        embedding_cache = self._embedding_cache_stats()
+        if embedding_cache is not None:
+            result["metadata"]["embedding_cache"] = embedding_cache
+        skipped = [item["iteration"] for item in self.iteration_history if item.get("synthesis", {}).get("arbiter_skipped")]
+        if skipped:
+            result["metadata"]["arbiter_skipped_iterations"] = skipped
+        if self._early_stops:
+            result["metadata"]["early_stop"] = {
+                "cancelled_calls": sum(stop["cancelled_calls"] for stop in self._early_stops),
+                "abandoned_calls": sum(stop["abandoned_calls"] for stop in self._early_stops),
+                "time_saved_s": round(sum(stop["time_saved_s"] or 0.0 for stop in self._early_stops), 3),
+                "iterations": self._early_stops,
+            }
+        return result
+
+    def _save_run_end(self, final_result: Dict[str, Any]) -> None:
+        # Member and arbiter rows are written behind; make the run's trace complete before it ends
+        flush_writes()
+        synthesis_dict = final_result["synthesis"]
+        update_consortium_run(
+            run_id=str(final_result["metadata"]["consortium_id"]),
+            iteration_count=len(self.iteration_history),
+            final_confidence=float(synthesis_dict.get("confidence", 0.0) or 0.0),
+            status=self.config.status if self.config.status != "running" else ("empty_synthesis" if not synthesis_dict.get("synthesis") else "success")
+        )
+
+    def _orchestrate_manual(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None) -> Dict[str, Any]:
+        self.iteration_history = []
+        self._conversation_history = conversation_history or ""
+        
+        self.strategy.initialize_state()
+        
+        self._save_run_start(prompt, consortium_id)
         
         for iteration in range(1, self.max_iterations + 1):
             logger.info(f"Starting iteration {iteration}")
             
-            available_models = self.models
+            available_models = self._available_models(self.models)
             selected_models = self.strategy.select_models(available_models, prompt, iteration)
             
             model_responses = self._get_model_responses_manual(prompt, selected_models, iteration)
-            model_responses = self.strategy.process_responses(model_responses, iteration)
+            model_responses = self._process_responses(model_responses, iteration)
             
             valid_responses = [r for r in model_responses if r.get('error') is None]
             if not valid_responses:
@@ -127,30 +322,12 @@ class ConsortiumOrchestrator:
             context = IterationContext(synthesis=synthesis_result, model_responses=model_responses)
             self.strategy.update_state(context)
             
-            if not synthesis_result.get('needs_iteration', False) and iteration >= self.minimum_iterations:
-                if synthesis_result.get('confidence', 0) >= self.confidence_threshold:
-                    logger.info(f"Conversation converged at iteration {iteration} with confidence {synthesis_result.get('confidence')}")
-                    break
-        
-        synthesis_dict = self.iteration_history[-1].get("synthesis", {}) if self.iteration_history else {}
-        final_result = {
-            "synthesis": synthesis_dict,
-            "iterations": self.iteration_history,
-            "metadata": {
-                "total_iterations": len(self.iteration_history),
-                "consortium_id": consortium_id,
-                "config": self.config.to_dict()
-            },
-            "original_prompt": prompt
-        }
-
-        update_consortium_run(
-            run_id=str(consortium_id),
-            iteration_count=len(self.iteration_history),
-            final_confidence=float(synthesis_dict.get("confidence", 0.0) or 0.0),
-            status=self.config.status if self.config.status != "running" else ("empty_synthesis" if not synthesis_dict.get("synthesis") else "success")
-        )
+            if self._has_converged(synthesis_result, iteration):
+                logger.info(f"Conversation converged at iteration {iteration} with confidence {synthesis_result.get('confidence')}")
+                break
         
+        final_result = self._build_final_result(prompt, consortium_id)
+        self._save_run_end(final_result)
         return final_result
 
     def _get_model_responses_manual(self, prompt: str, models: Dict[str, int], iteration: int) -> List[Dict[str, Any]]:
@@ -159,89 +336,398 @@ class ConsortiumOrchestrator:
             for i in range(count):
                 tasks.append((model_id, prompt, i, iteration))
         
+        batch = self._member_batch()
+        future_to_member = {
+            batch.submit(self._get_single_model_response_manual, *task): (task[0], task[2])
+            for task in tasks
+        }
+        return self._collect_responses(batch, future_to_member, iteration)
+
+    def _member_batch(self) -> MemberBatch:
+        return get_shared_executor().batch(self.config.max_concurrency, self._member_cap)
+
+    def _quorum_size(self, expected: int) -> Optional[int]:
+        """Number of valid responses needed before a fan-out may stop early, or None to wait for all."""
+        min_quorum = self.config.min_quorum
+        if min_quorum is None and self.config.member_deadline_s is None:
+            return None
+        if min_quorum is None:
+            quorum = 1
+        elif min_quorum < 1:
+            quorum = math.ceil(min_quorum * expected)
+        else:
+            quorum = int(min_quorum)
+        return max(1, min(expected, quorum))
+
+    def _quorum_wait_timeout(self, valid_count: int, quorum: Optional[int], deadline: Optional[float]) -> Optional[float]:
+        """How long to keep waiting for members: None waits for the next one, 0 means stop now."""
+        if quorum is None or valid_count < quorum:
+            return None
+        if deadline is None:
+            return 0.0
+        return max(0.0, deadline - time.monotonic())
+
+    def _collect_responses(self, batch: MemberBatch, future_to_member: Dict[concurrent.futures.Future, tuple], iteration: int) -> List[Dict[str, Any]]:
+        """Gather member futures in completion order, honouring min_quorum / member_deadline_s."""
         responses = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(tasks) or 1, 10)) as executor:
-            future_to_task = {executor.submit(self._get_single_model_response_manual, *task): task for task in tasks}
-            for future in concurrent.futures.as_completed(future_to_task):
+        pending = set(future_to_member)
+        quorum = self._quorum_size(len(pending))
+        started = time.monotonic()
+        deadline = started + self.config.member_deadline_s if self.config.member_deadline_s is not None else None
+        valid_count = 0
+        decided = False
+
+        while pending:
+            timeout = self._quorum_wait_timeout(valid_count, quorum, deadline)
+            if timeout == 0.0:
+                break
+            done, pending = batch.wait(pending, timeout=timeout)
+            for future in done:
+                model_id, instance = future_to_member[future]
                 try:
-                    responses.append(future.result())
+                    result = future.result()
                 except Exception as e:
-                    task = future_to_task[future]
-                    responses.append({
-                        "model": task[0],
-                        "instance": task[2],
-                        "error": str(e)
-                    })
+                    result = {"model": model_id, "instance": instance, "error": str(e)}
+                if result.get("error") is None:
+                    valid_count += 1
+                self._observe_member_latency(model_id, started, result)
+                self._notify_member_response(result, iteration)
+                responses.append(result)
+            if pending and self._collection_decided(responses, len(pending), iteration):
+                decided = True
+                break
+
+        if pending:
+            run_id = self.consortium_id
+            cancelled_models, abandoned_models = [], []
+            for future in pending:
+                model_id, instance = future_to_member[future]
+                cancelled = future.cancel()
+                if cancelled:
+                    cancelled_models.append(model_id)
+                else:
+                    abandoned_models.append(model_id)
+                    future.add_done_callback(lambda f, run_id=run_id: self._record_late_member(run_id, f))
+                    future.add_done_callback(lambda f, model_id=model_id: self._observe_straggler_latency(model_id, started, f))
+                responses.append(self._late_member_entry(model_id, instance, cancelled, decided))
+            if decided:
+                self._record_early_stop(iteration, cancelled_models, abandoned_models, started)
+                logger.info(f"Iteration {iteration}: vote decided, cancelled {len(cancelled_models)} and abandoned {len(abandoned_models)} member(s)")
+            else:
+                logger.info(f"Iteration {iteration}: quorum of {quorum} met, proceeding without {len(pending)} straggler(s)")
         return responses
 
+    def _process_responses(self, responses: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
+        """Run the strategy over the successful responses only; failed and late entries are kept for the record."""
+        successful = [r for r in responses if r.get("error") is None]
+        failed = [r for r in responses if r.get("error") is not None]
+        return self.strategy.process_responses(successful, iteration) + failed
+
+    def _collection_decided(self, responses: List[Dict[str, Any]], outstanding: int, iteration: int) -> bool:
+        """Ask the strategy whether the outstanding members can still change the outcome."""
+        try:
+            return bool(self.strategy.collection_decided(responses, outstanding, iteration))
+        except Exception as e:
+            logger.warning(f"Strategy collection_decided hook failed, waiting for all members: {e}")
+            return False
+
+    def _observe_member_latency(self, model_id: str, started: float, result: Dict[str, Any]) -> None:
+        if result.get("error") is not None or result.get("cached"):
+            return
+        latency = time.monotonic() - started
+        previous = self._member_latency.get(model_id)
+        self._member_latency[model_id] = latency if previous is None else 0.7 * previous + 0.3 * latency
+
+    def _observe_straggler_latency(self, model_id: str, started: float, future: concurrent.futures.Future) -> None:
+        """Done-callback: a member we stopped waiting for still tells us how slow it is."""
+        if not future.cancelled() and future.exception() is None:
+            self._observe_member_latency(model_id, started, future.result())
+
+    def _record_early_stop(self, iteration: int, cancelled_models: List[str], abandoned_models: List[str], started: float) -> None:
+        """Note an early stop; time saved is estimated from the cancelled models' usual latency.
+
+        Abandoned calls were already running and finish (and are billed) anyway, so
+        they save no time.
+        """
+        decided_after = time.monotonic() - started
+        estimates = [self._member_latency[m] for m in cancelled_models if m in self._member_latency]
+        self._early_stops.append({
+            "iteration": iteration,
+            "cancelled_calls": len(cancelled_models),
+            "abandoned_calls": len(abandoned_models),
+            "decided_after_s": round(decided_after, 3),
+            "time_saved_s": round(max(0.0, max(estimates) - decided_after), 3) if estimates else None,
+        })
+
+    def _notify_member_response(self, result: Dict[str, Any], iteration: int) -> None:
+        """Hand a just-arrived member response to the strategy; its failures must not lose the response."""
+        try:
+            self.strategy.on_member_response(result, iteration)
+        except Exception as e:
+            logger.warning(f"Strategy on_member_response hook failed for {result.get('model')}: {e}")
+
+    def _late_member_entry(self, model_id: str, instance: int, cancelled: bool, decided: bool = False) -> Dict[str, Any]:
+        if decided:
+            error = "Cancelled after the vote was decided" if cancelled else "Abandoned after the vote was decided"
+        elif cancelled:
+            error = "Cancelled after quorum was reached"
+        elif self.config.member_deadline_s is not None:
+            error = "Missed the member deadline"
+        else:
+            error = "Still running when quorum was reached"
+        return {"model": model_id, "instance": instance, "error": error, "late": True}
+
+    def _record_late_member(self, run_id: Optional[str], future: concurrent.futures.Future) -> None:
+        """Done-callback for stragglers that finished after synthesis had already started."""
+        if future.cancelled() or not run_id:
+            return
+        try:
+            result = future.result()
+        except Exception:
+            return
+        if result.get("error") is None and result.get("response_id"):
+            mark_consortium_member_late(str(run_id), str(result["response_id"]))
+
+    def _circuit_breaker(self, model_id: str):
+        if not self.config.breaker_failure_threshold:
+            return None
+        return get_circuit_breaker(model_id, self.config.breaker_failure_threshold, self.config.breaker_reset_s)
+
+    def _available_models(self, models: Dict[str, int]) -> Dict[str, int]:
+        """Drop models whose circuit breaker is open; if none would remain, keep them all to fast-fail."""
+        healthy = {}
+        for model_id, count in models.items():
+            breaker = self._circuit_breaker(model_id)
+            if breaker is None or breaker.is_available():
+                healthy[model_id] = count
+        if len(healthy) < len(models):
+            skipped = sorted(set(models) - set(healthy))
+            logger.warning(f"Skipping models with open circuit breakers: {', '.join(skipped)}")
+        return healthy or models
+
+    def _call_member(self, model_id: str, call: Callable[[], Any]) -> Any:
+        """Run one member call under its circuit breaker, rate limit and retry policy."""
+        breaker = self._circuit_breaker(model_id)
+        if breaker is not None:
+            breaker.before_call()
+
+        def attempt():
+            with member_rate_limit(model_id, self.config.rate_limits):
+                return call()
+
+        try:
+            result = call_with_retries(attempt, self.config.max_retries, self.config.retry_base_delay_s,
+                                       self.config.retry_max_delay_s, label=model_id)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure(e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+    async def _call_member_async(self, model_id: str, call: Callable[[], Any]) -> Any:
+        breaker = self._circuit_breaker(model_id)
+        if breaker is not None:
+            breaker.before_call()
+
+        async def attempt():
+            async with member_rate_limit_async(model_id, self.config.rate_limits):
+                return await call()
+
+        try:
+            result = await call_with_retries_async(attempt, self.config.max_retries, self.config.retry_base_delay_s,
+                                                   self.config.retry_max_delay_s, label=model_id)
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.record_cancelled()
+            raise
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure(e)
+            raise
+        if breaker is not None:
+            breaker.record_success()
+        return result
+
+    def _cache_allows(self, *policies: str) -> bool:
+        return (
+            self._member_cache is not None
+            and self._use_cache
+            and self.config.cache_policy in policies
+            and not cache_disabled_by_env()
+        )
+
+    def _read_member_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self._cache_allows("read_write", "read_only"):
+            return None
+        return self._member_cache.get(key)
+
+    def _write_member_cache(self, key: str, model_id: str, text: str, response: Any) -> None:
+        if not self._cache_allows("read_write", "refresh"):
+            return
+        response_json = None
+        if hasattr(response, "to_dict"):
+            try:
+                response_json = json.dumps(response.to_dict())
+            except Exception as e:
+                logger.debug(f"Member response for {model_id} is not serializable for the cache: {e}")
+        response_id = getattr(response, "id", None)
+        self._member_cache.put(key, model_id, text, str(response_id) if response_id else None, response_json)
+
+    def _record_cached_member(self, result: Dict[str, Any], cached: Dict[str, Any], iteration: int) -> Dict[str, Any]:
+        """Finish a cache hit: keep the original response id and still record the member row."""
+        if cached.get("response_id"):
+            result["response_id"] = cached["response_id"]
+        result["cached"] = True
+        if self.consortium_id:
+            save_consortium_member(str(self.consortium_id), result["response_id"], result["model"],
+                                   iteration, result["instance"], status="cached")
+        return result
+
+    @staticmethod
+    def _automatic_cache_key(task: Dict[str, Any], prompt: str) -> str:
+        # Chaining the previous turn's key makes a hit imply an identical conversation so far
+        return member_cache_key(task["model_id"], task["instance"], task.get("system_prompt"), prompt,
+                                task.get("options"), previous_key=task.get("cache_key"))
+
+    @staticmethod
+    def _replay_cached_turn(task: Dict[str, Any], cached: Dict[str, Any]) -> bool:
+        """Append a cached turn to the member's conversation so later iterations see it."""
+        response_cls = llm.AsyncResponse if task.get("is_async") else llm.Response
+        if not cached.get("response_json") or not hasattr(response_cls, "from_dict"):
+            return False
+        conversation = task["conversation"]
+        try:
+            response = response_cls.from_dict(json.loads(cached["response_json"]), model=conversation.model)
+        except Exception as e:
+            logger.debug(f"Cached turn for {task['model_id']} could not be replayed: {e}")
+            return False
+        conversation.responses.append(response)
+        return True
+
     def _get_single_model_response_manual(self, model_id: str, prompt: str, instance: int, iteration: int) -> Dict[str, Any]:
         try:
+            full_prompt, instance_system_prompt = self._build_manual_prompt(model_id, prompt, instance, iteration)
+            options = _member_options(model_id)
+            cache_key = member_cache_key(model_id, instance, instance_system_prompt, full_prompt, options)
+            cached = self._read_member_cache(cache_key)
+            if cached is not None:
+                result = self._build_manual_result(model_id, instance, cached["text"], None)
+                return self._record_cached_member(result, cached, iteration)
+
             model = llm.get_model(model_id)
-            
-            # Get the strategy-modified system prompt for this specific model instance
-            instance_system_prompt = self.strategy.get_instance_system_prompt(
-                model_id, instance, self.system_prompt
-            )
-            
-            full_prompt = ""
-            if instance_system_prompt:
-                full_prompt += f"System: {instance_system_prompt}\n\n"
-            if self._conversation_history:
-                full_prompt += f"{self._conversation_history}\n\n"
-            
-            # Delegate prompt formulation entirely to strategy to maximize cache hits
-            strategy_prompt = self.strategy.prepare_iteration_prompt(model_id, instance, prompt, iteration)
-            full_prompt += strategy_prompt
-            response = model.prompt(full_prompt, system=instance_system_prompt)
-            text = response.text()
-            
-            confidence = 0.5
-            conf_match = re.search(r"<confidence>([\d.]+)</confidence>", text)
-            if conf_match:
-                try:
-                    val = float(conf_match.group(1))
-                    confidence = val / 100 if val > 1 else val
-                except:
-                    pass
-            
-            result = {
-                "model": model_id,
-                "instance": instance,
-                "response": text,
-                "confidence": confidence,
-                "id": uuid.uuid4().int % 1000000,
-                "response_id": str(getattr(response, 'id', uuid.uuid4())),
-            }
-            
+
+            def call():
+                response = model.prompt(full_prompt, system=instance_system_prompt, **options)
+                return response, response.text()
+
+            response, text = self._call_member(model_id, call)
+            self._write_member_cache(cache_key, model_id, text, response)
+
+            result = self._build_manual_result(model_id, instance, text, response)
             if hasattr(response, 'id') and self.consortium_id:
-                log_response(response, model_id, str(self.consortium_id))
-                save_consortium_member(str(self.consortium_id), str(response.id), model_id, iteration, instance)
+                self._log_member_response(response, model_id, iteration, instance)
             
             return result
         except Exception as e:
             logger.error(f"Error calling model {model_id}: {e}")
             return {"model": model_id, "instance": instance, "error": str(e)}
 
+    def _build_manual_prompt(self, model_id: str, prompt: str, instance: int, iteration: int) -> tuple:
+        """Return (full_prompt, instance_system_prompt) for a manual-context member call."""
+        # Get the strategy-modified system prompt for this specific model instance
+        instance_system_prompt = self.strategy.get_instance_system_prompt(
+            model_id, instance, self.system_prompt
+        )
+        
+        full_prompt = ""
+        if instance_system_prompt:
+            full_prompt += f"System: {instance_system_prompt}\n\n"
+        if self._conversation_history:
+            full_prompt += f"{self._conversation_history}\n\n"
+        
+        # Delegate prompt formulation entirely to strategy to maximize cache hits
+        full_prompt += self.strategy.prepare_iteration_prompt(model_id, instance, prompt, iteration)
+        return full_prompt, instance_system_prompt
+
+    def _build_manual_result(self, model_id: str, instance: int, text: str, response: Any) -> Dict[str, Any]:
+        confidence = 0.5
+        conf_match = re.search(r"<confidence>([\d.]+)</confidence>", text)
+        if conf_match:
+            try:
+                val = float(conf_match.group(1))
+                confidence = val / 100 if val > 1 else val
+            except:
+                pass
+        
+        return {
+            "model": model_id,
+            "instance": instance,
+            "response": text,
+            "confidence": confidence,
+            "id": uuid.uuid4().int % 1000000,
+            "response_id": str(getattr(response, 'id', uuid.uuid4())),
+        }
+
+    def _log_member_response(self, response: Any, model_id: str, iteration: int, instance: int) -> None:
+        log_response(response, model_id, str(self.consortium_id))
+        save_consortium_member(str(self.consortium_id), str(response.id), model_id, iteration, instance)
+
     def _orchestrate_automatic(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None) -> Dict[str, Any]:
         self.iteration_history = []
         
         self.strategy.initialize_state()
         
-        save_consortium_run(
-            run_id=str(consortium_id),
-            strategy=getattr(self.config, 'strategy', None) or "default",
-            judging_method=self.judging_method,
-            confidence_threshold=self.confidence_threshold,
-            max_iterations=self.max_iterations,
-            iteration_count=0,
-            final_confidence=0.0,
-            user_prompt=prompt,
-            config_name=self.config_name,
-            category=self.config.category,
-            expected_agreement=self.config.expected_agreement,
-            status="running"
-        )
+        self._save_run_start(prompt, consortium_id)
+        
+        model_tasks = self._create_model_tasks()
         
+        if conversation_history:
+             pass
+
+        for iteration in range(1, self.max_iterations + 1):
+            logger.info(f"Starting iteration {iteration}")
+            
+            available_models = self._available_models({task["model_id"]: 1 for task in model_tasks})
+            selected_models = self.strategy.select_models(available_models, prompt, iteration)
+            
+            responses = self._get_model_responses_automatic(prompt, model_tasks, selected_models, iteration)
+            responses = self._process_responses(responses, iteration)
+            
+            valid_responses = [r for r in responses if r.get('error') is None]
+            if not valid_responses:
+                logger.error("No valid responses from models in this iteration.")
+                self.config.status = "embedding_failure" if getattr(self.config, 'embedding_backend', None) else "model_failure"
+                break
+            
+            synthesis_result = self._synthesize_responses_automatic(prompt, valid_responses, self.iteration_history, iteration)
+            
+            iteration_data = {
+                "iteration": iteration,
+                "selected_models": selected_models,
+                "model_responses": responses,
+                "synthesis": synthesis_result
+            }
+            self.iteration_history.append(iteration_data)
+            
+            context = IterationContext(synthesis=synthesis_result, model_responses=responses)
+            self.strategy.update_state(context)
+            
+            if self._has_converged(synthesis_result, iteration):
+                logger.info(f"Conversation converged at iteration {iteration} with confidence {synthesis_result.get('confidence')}")
+                break
+
+        final_result = self._build_final_result(prompt, consortium_id)
+        self._save_run_end(final_result)
+        return final_result
+
+    def _create_model_tasks(self, use_async: bool = False) -> List[Dict[str, Any]]:
+        """Create one conversation per member instance for automatic context mode.
+
+        With use_async=True the conversation comes from the model's async variant when
+        one exists; tasks flagged "is_async": False fall back to a sync conversation.
+        """
         model_tasks = []
         for model_id, count in self.models.items():
             for i in range(count):
@@ -249,26 +735,111 @@ class ConsortiumOrchestrator:
                 instance_system_prompt = self.strategy.get_instance_system_prompt(
                     model_id, i, self.system_prompt
                 )
-                model_obj = llm.get_model(model_id)
-                conversation = model_obj.conversation()
+                model_obj = _get_async_model(model_id) if use_async else None
+                is_async = model_obj is not None
+                if model_obj is None:
+                    model_obj = llm.get_model(model_id)
                 model_tasks.append({
                     "model_id": model_id,
                     "instance": i,
-                    "conversation": conversation,
-                    "system_prompt": instance_system_prompt
+                    "conversation": model_obj.conversation(),
+                    "system_prompt": instance_system_prompt,
+                    "options": _member_options(model_id),
+                    "is_async": is_async,
                 })
+        return model_tasks
+
+    def _get_model_responses_automatic(self, prompt: str, tasks: List[Dict[str, Any]], 
+                                     selected_models: Dict[str, int], iteration_idx: int) -> List[Dict[str, Any]]:
+        active_tasks = self._idle_tasks([t for t in tasks if t["model_id"] in selected_models])
         
-        if conversation_history:
-             pass
+        batch = self._member_batch()
+        future_to_member = {}
+        for task in active_tasks:
+             # Always delegate so iteration 1 and >1 share the same cached prefix
+             iter_prompt = self.strategy.prepare_iteration_prompt(
+                 task["model_id"], task["instance"], prompt, iteration_idx
+             )
+
+             future = batch.submit(self._get_single_response_automatic, task, iter_prompt, iteration_idx)
+             task["future"] = future
+             future_to_member[future] = (task["model_id"], task["instance"])
+
+        return self._collect_responses(batch, future_to_member, iteration_idx)
+
+    @staticmethod
+    def _idle_tasks(active_tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # A straggler from an earlier iteration still owns its conversation; don't interleave prompts
+        busy_tasks = [t for t in active_tasks if t.get("future") is not None and not t["future"].done()]
+        if busy_tasks:
+            logger.info(f"Skipping {len(busy_tasks)} member(s) whose previous call is still in flight")
+        return [t for t in active_tasks if t not in busy_tasks]
+
+    def _get_single_response_automatic(self, task: Dict[str, Any], prompt: str, iteration: int) -> Dict[str, Any]:
+        try:
+            model_id = task["model_id"]
+            conversation = task["conversation"]
+            instance_system_prompt = task.get("system_prompt")
+            cache_key = self._automatic_cache_key(task, prompt)
+            cached = self._read_member_cache(cache_key)
+            if cached is not None and self._replay_cached_turn(task, cached):
+                task["cache_key"] = cache_key
+                result = self._build_automatic_result(task, cached["text"], None, iteration)
+                return self._record_cached_member(result, cached, iteration)
+
+            def call():
+                response = conversation.prompt(prompt, system=instance_system_prompt, **task.get("options", {}))
+                return response, response.text()
+
+            response, text = self._call_member(model_id, call)
+            task["cache_key"] = cache_key
+            self._write_member_cache(cache_key, model_id, text, response)
+
+            result = self._build_automatic_result(task, text, response, iteration)
+            if hasattr(response, 'id') and self.consortium_id:
+                self._log_member_response(response, model_id, iteration, task["instance"])
+
+            return result
+        except Exception as e:
+            logger.error(f"Automatic response error for {task['model_id']}: {e}")
+            raise
+
+    def _build_automatic_result(self, task: Dict[str, Any], text: str, response: Any, iteration: int) -> Dict[str, Any]:
+        rid = hash(f"{task['model_id']}_{task['instance']}_{iteration}") % 1000
+        return {
+            "model": task["model_id"],
+            "instance": task["instance"],
+            "response": text,
+            "confidence": 0.5,
+            "id": rid,
+            "response_id": str(getattr(response, 'id', rid)),
+        }
+
+    async def _orchestrate_async(self, prompt: str, conversation_history: Optional[str] = None, consortium_id: Optional[str] = None) -> Dict[str, Any]:
+        self.iteration_history = []
+        self._conversation_history = conversation_history or ""
+        
+        self.strategy.initialize_state()
+        
+        await asyncio.to_thread(self._save_run_start, prompt, consortium_id)
+        
+        model_tasks = [] if self.manual_context else self._create_model_tasks(use_async=True)
 
         for iteration in range(1, self.max_iterations + 1):
             logger.info(f"Starting iteration {iteration}")
             
-            available_models = {task["model_id"]: 1 for task in model_tasks}
+            if self.manual_context:
+                available_models = self._available_models(self.models)
+            else:
+                available_models = self._available_models({task["model_id"]: 1 for task in model_tasks})
             selected_models = self.strategy.select_models(available_models, prompt, iteration)
             
-            responses = self._get_model_responses_automatic(prompt, model_tasks, selected_models, iteration)
-            responses = self.strategy.process_responses(responses, iteration)
+            if self.manual_context:
+                responses = await self._get_model_responses_manual_async(prompt, selected_models, iteration)
+            else:
+                responses = await self._get_model_responses_automatic_async(prompt, model_tasks, selected_models, iteration)
+            # Strategies may embed responses synchronously; keep that off the event loop
+            responses = await asyncio.to_thread(self._process_responses, responses, iteration)
             
             valid_responses = [r for r in responses if r.get('error') is None]
             if not valid_responses:
@@ -276,7 +847,7 @@ class ConsortiumOrchestrator:
                 self.config.status = "embedding_failure" if getattr(self.config, 'embedding_backend', None) else "model_failure"
                 break
             
-            synthesis_result = self._synthesize_responses_automatic(prompt, valid_responses, self.iteration_history, iteration)
+            synthesis_result = await self._synthesize_responses_async(prompt, valid_responses, self.iteration_history, iteration)
             
             iteration_data = {
                 "iteration": iteration,
@@ -289,89 +860,230 @@ class ConsortiumOrchestrator:
             context = IterationContext(synthesis=synthesis_result, model_responses=responses)
             self.strategy.update_state(context)
             
-            if not synthesis_result.get('needs_iteration', False) and iteration >= self.minimum_iterations:
-                if synthesis_result.get('confidence', 0) >= self.confidence_threshold:
-                    logger.info(f"Conversation converged at iteration {iteration} with confidence {synthesis_result.get('confidence')}")
-                    break
+            if self._has_converged(synthesis_result, iteration):
+                logger.info(f"Conversation converged at iteration {iteration} with confidence {synthesis_result.get('confidence')}")
+                break
 
-        synthesis_dict = self.iteration_history[-1].get("synthesis", {}) if self.iteration_history else {}
-        final_result = {
-            "synthesis": synthesis_dict,
-            "iterations": self.iteration_history,
-            "metadata": {
-                "total_iterations": len(self.iteration_history),
-                "consortium_id": consortium_id,
-                "config": self.config.to_dict()
-            },
-            "original_prompt": prompt
+        final_result = self._build_final_result(prompt, consortium_id)
+        await asyncio.to_thread(self._save_run_end, final_result)
+        return final_result
+
+    async def _get_model_responses_manual_async(self, prompt: str, models: Dict[str, int], iteration: int) -> List[Dict[str, Any]]:
+        tasks = []
+        for model_id, count in models.items():
+            for i in range(count):
+                tasks.append((model_id, prompt, i, iteration))
+
+        limiter = asyncio.Semaphore(self.config.max_concurrency) if self.config.max_concurrency else None
+        task_to_member = {
+            asyncio.ensure_future(self._run_limited(limiter, self._get_single_model_response_manual_async(*task))): (task[0], task[2])
+            for task in tasks
         }
+        return await self._collect_responses_async(task_to_member, iteration)
 
-        update_consortium_run(
-            run_id=str(consortium_id),
-            iteration_count=len(self.iteration_history),
-            final_confidence=float(synthesis_dict.get("confidence", 0.0) or 0.0),
-            status=self.config.status if self.config.status != "running" else ("empty_synthesis" if not synthesis_dict.get("synthesis") else "success")
-        )
-        
-        return final_result
+    @staticmethod
+    async def _run_limited(limiter: Optional[asyncio.Semaphore], call: Any) -> Dict[str, Any]:
+        if limiter is None:
+            return await call
+        async with limiter:
+            return await call
 
-    def _get_model_responses_automatic(self, prompt: str, tasks: List[Dict[str, Any]], 
-                                     selected_models: Dict[str, int], iteration_idx: int) -> List[Dict[str, Any]]:
+    async def _collect_responses_async(self, task_to_member: Dict["asyncio.Future", tuple], iteration: int) -> List[Dict[str, Any]]:
+        """Async counterpart of _collect_responses; stragglers are cancelled outright."""
         responses = []
-        active_tasks = [t for t in tasks if t["model_id"] in selected_models]
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(active_tasks) or 1, 10)) as executor:
-            future_to_task = {}
-            for task in active_tasks:
-                 # Always delegate so iteration 1 and >1 share the same cached prefix
-                 iter_prompt = self.strategy.prepare_iteration_prompt(
-                     task["model_id"], task["instance"], prompt, iteration_idx
-                 )
-
-                 future = executor.submit(self._get_single_response_automatic, task, iter_prompt, iteration_idx)
-                 future_to_task[future] = task
-
-            for future in concurrent.futures.as_completed(future_to_task):
+        pending = set(task_to_member)
+        quorum = self._quorum_size(len(pending))
+        started = time.monotonic()
+        deadline = started + self.config.member_deadline_s if self.config.member_deadline_s is not None else None
+        valid_count = 0
+        decided = False
+
+        while pending:
+            timeout = self._quorum_wait_timeout(valid_count, quorum, deadline)
+            if timeout == 0.0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                model_id, instance = task_to_member[task]
                 try:
-                    responses.append(future.result())
+                    result = task.result()
                 except Exception as e:
-                    task = future_to_task[future]
-                    responses.append({
-                        "model": task["model_id"],
-                        "instance": task["instance"],
-                        "error": str(e)
-                    })
+                    result = {"model": model_id, "instance": instance, "error": str(e)}
+                if result.get("error") is None:
+                    valid_count += 1
+                self._observe_member_latency(model_id, started, result)
+                self._notify_member_response(result, iteration)
+                responses.append(result)
+            if pending and self._collection_decided(responses, len(pending), iteration):
+                decided = True
+                break
+
+        for task in pending:
+            model_id, instance = task_to_member[task]
+            task.cancel()
+            responses.append(self._late_member_entry(model_id, instance, cancelled=True, decided=decided))
+        if pending and decided:
+            self._record_early_stop(iteration, [task_to_member[task][0] for task in pending], [], started)
+            logger.info(f"Iteration {iteration}: vote decided, cancelled {len(pending)} member(s)")
+        elif pending:
+            logger.info(f"Iteration {iteration}: quorum of {quorum} met, cancelled {len(pending)} straggler(s)")
         return responses
 
-    def _get_single_response_automatic(self, task: Dict[str, Any], prompt: str, iteration: int) -> Dict[str, Any]:
+    async def _get_single_model_response_manual_async(self, model_id: str, prompt: str, instance: int, iteration: int) -> Dict[str, Any]:
+        model = _get_async_model(model_id)
+        if model is None:
+            return await asyncio.to_thread(self._get_single_model_response_manual, model_id, prompt, instance, iteration)
         try:
-            model_id = task["model_id"]
-            conversation = task["conversation"]
-            instance_system_prompt = task.get("system_prompt")
-            
-            response = conversation.prompt(prompt, system=instance_system_prompt)
-            text = response.text()
-            
-            rid = hash(f"{model_id}_{task['instance']}_{iteration}") % 1000
-
-            result = {
-                "model": model_id,
-                "instance": task["instance"],
-                "response": text,
-                "confidence": 0.5,
-                "id": rid,
-                "response_id": str(getattr(response, 'id', rid)),
-            }
-            
+            full_prompt, instance_system_prompt = self._build_manual_prompt(model_id, prompt, instance, iteration)
+            options = _member_options(model_id)
+            cache_key = member_cache_key(model_id, instance, instance_system_prompt, full_prompt, options)
+            cached = await asyncio.to_thread(self._read_member_cache, cache_key)
+            if cached is not None:
+                result = self._build_manual_result(model_id, instance, cached["text"], None)
+                return await asyncio.to_thread(self._record_cached_member, result, cached, iteration)
+
+            async def call():
+                response = model.prompt(full_prompt, system=instance_system_prompt, **options)
+                return response, await response.text()
+
+            response, text = await self._call_member_async(model_id, call)
+            await asyncio.to_thread(self._write_member_cache, cache_key, model_id, text, response)
+
+            result = self._build_manual_result(model_id, instance, text, response)
             if hasattr(response, 'id') and self.consortium_id:
-                log_response(response, model_id, str(self.consortium_id))
-                save_consortium_member(str(self.consortium_id), str(response.id), model_id, iteration, task["instance"])
+                await asyncio.to_thread(self._log_member_response, response, model_id, iteration, instance)
+            return result
+        except Exception as e:
+            logger.error(f"Error calling model {model_id}: {e}")
+            return {"model": model_id, "instance": instance, "error": str(e)}
+
+    async def _get_model_responses_automatic_async(self, prompt: str, tasks: List[Dict[str, Any]],
+                                                   selected_models: Dict[str, int], iteration_idx: int) -> List[Dict[str, Any]]:
+        active_tasks = self._idle_tasks([t for t in tasks if t["model_id"] in selected_models])
+        limiter = asyncio.Semaphore(self.config.max_concurrency) if self.config.max_concurrency else None
+        task_to_member = {}
+        for task in active_tasks:
+            iter_prompt = self.strategy.prepare_iteration_prompt(
+                task["model_id"], task["instance"], prompt, iteration_idx
+            )
+            call = asyncio.ensure_future(self._run_limited(limiter, self._get_single_response_automatic_async(task, iter_prompt, iteration_idx)))
+            task_to_member[call] = (task["model_id"], task["instance"])
+
+        return await self._collect_responses_async(task_to_member, iteration_idx)
 
+    async def _get_single_response_automatic_async(self, task: Dict[str, Any], prompt: str, iteration: int) -> Dict[str, Any]:
+        if not task.get("is_async"):
+            return await self._get_single_response_automatic_in_thread(task, prompt, iteration)
+        try:
+            cache_key = self._automatic_cache_key(task, prompt)
+            cached = await asyncio.to_thread(self._read_member_cache, cache_key)
+            if cached is not None and self._replay_cached_turn(task, cached):
+                task["cache_key"] = cache_key
+                result = self._build_automatic_result(task, cached["text"], None, iteration)
+                return await asyncio.to_thread(self._record_cached_member, result, cached, iteration)
+
+            async def call():
+                response = task["conversation"].prompt(prompt, system=task.get("system_prompt"), **task.get("options", {}))
+                return response, await response.text()
+
+            response, text = await self._call_member_async(task["model_id"], call)
+            task["cache_key"] = cache_key
+            await asyncio.to_thread(self._write_member_cache, cache_key, task["model_id"], text, response)
+
+            result = self._build_automatic_result(task, text, response, iteration)
+            if hasattr(response, 'id') and self.consortium_id:
+                await asyncio.to_thread(self._log_member_response, response, task["model_id"], iteration, task["instance"])
             return result
         except Exception as e:
             logger.error(f"Automatic response error for {task['model_id']}: {e}")
             raise
 
+    async def _get_single_response_automatic_in_thread(self, task: Dict[str, Any], prompt: str, iteration: int) -> Dict[str, Any]:
+        """Run a sync member's turn in a worker thread, keeping `task["future"]` busy until the thread ends.
+
+        Cancelling the await (a straggler) cannot stop a running thread, which goes on
+        using the task's conversation; the next iteration skips the task until it is done.
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        task["future"] = future
+        context = contextvars.copy_context()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(context.run(self._get_single_response_automatic, task, prompt, iteration))
+            except BaseException as e:
+                future.set_exception(e)
+
+        asyncio.get_running_loop().run_in_executor(None, run)
+        return await asyncio.wrap_future(future)
+
+    async def _synthesize_responses_async(self, prompt: str, responses: List[Dict[str, Any]],
+                                          history: List[Dict[str, Any]], iteration: int) -> Dict[str, Any]:
+        sync_synthesize = self._synthesize_responses_manual if self.manual_context else self._synthesize_responses_automatic
+        if not self.arbiter:
+            return sync_synthesize(prompt, responses, history, iteration)
+        agreed = self._agreement_synthesis(responses, iteration)
+        if agreed is not None:
+            return agreed
+
+        inputs, levels = await self._hierarchical_inputs_async(prompt, responses, iteration)
+        arbiter_prompt = self._prepare_arbiter_prompt(prompt, inputs, history)
+        members = responses if levels else None
+        cascade = self._arbiter_cascade()
+        escalations: List[Dict[str, Any]] = []
+        for attempt, arbiter_id in enumerate(cascade):
+            final_attempt = attempt == len(cascade) - 1
+            response, raw_arbiter_text = await self._call_arbiter_async(arbiter_id, arbiter_prompt, iteration, final_attempt)
+            await asyncio.to_thread(self._log_arbiter_response, response, iteration, arbiter_id, attempt)
+            parsed_result, parsed_ok, reason = self._judge_arbiter_output(raw_arbiter_text, inputs, final_attempt, members)
+            if parsed_ok or reason:
+                await asyncio.to_thread(self._save_arbiter_decision, response, iteration, parsed_result, arbiter_id, attempt, reason)
+            if reason is None:
+                return self._finish_arbitration(parsed_result, arbiter_id, escalations, levels)
+            escalations.append(self._escalation(arbiter_id, cascade[attempt + 1], reason, parsed_result, iteration))
+
+    async def _hierarchical_inputs_async(self, prompt: str, responses: List[Dict[str, Any]],
+                                         iteration: int) -> Tuple[List[Dict[str, Any]], List[int]]:
+        inputs: List[Dict[str, Any]] = responses
+        levels: List[int] = []
+        limiter = asyncio.Semaphore(self.config.max_concurrency) if self.config.max_concurrency else None
+        while self._needs_sub_synthesis(inputs, levels):
+            groups = self._partition_for_synthesis(inputs)
+            inputs = list(await asyncio.gather(*(
+                self._run_limited(limiter, self._sub_synthesize_async(prompt, [inputs[i] for i in group], iteration, len(levels) + 1, index))
+                for index, group in enumerate(groups)
+            )))
+            levels.append(len(groups))
+        return inputs, levels
+
+    async def _sub_synthesize_async(self, prompt: str, group: List[Dict[str, Any]], iteration: int,
+                                    level: int, index: int) -> Dict[str, Any]:
+        sub_prompt = self._prepare_arbiter_prompt(prompt, group, [])
+        response, raw_arbiter_text = await self._call_arbiter_async(self.arbiter, sub_prompt, iteration, True, allow_stream=False)
+        await asyncio.to_thread(self._log_arbiter_response, response, iteration, self.arbiter, index, "sub_arbiter")
+        return self._sub_synthesis(raw_arbiter_text, group, level, index)
+
+    async def _call_arbiter_async(self, arbiter_id: str, arbiter_prompt: str, iteration: int,
+                                  final_attempt: bool, allow_stream: bool = True) -> Tuple[Any, str]:
+        arbiter_model = _get_async_model(arbiter_id)
+        if arbiter_model is None:
+            return await asyncio.to_thread(self._call_arbiter, arbiter_id, arbiter_prompt, iteration, final_attempt, allow_stream)
+
+        stream = allow_stream and self._should_stream_synthesis()
+        if self.manual_context:
+            response = arbiter_model.prompt(arbiter_prompt, stream=stream)
+        else:
+            response = arbiter_model.conversation().prompt(arbiter_prompt, stream=stream)
+        if stream:
+            extractor = self._synthesis_extractor(iteration, final_attempt)
+            async for chunk in response:
+                text = extractor.feed(chunk)
+                if text:
+                    self._on_synthesis_chunk(text)
+        return response, await response.text()
+
     def _synthesize_responses_manual(self, prompt: str, responses: List[Dict[str, Any]], 
                                    history: List[Dict[str, Any]], iteration: int) -> Dict[str, Any]:
         if not self.arbiter:
@@ -387,50 +1099,11 @@ class ConsortiumOrchestrator:
                   "centroid_vector": None,
              }
 
-        arbiter_prompt = self._prepare_arbiter_prompt(prompt, responses, history)
-        arbiter_model = llm.get_model(self.arbiter)
-        
-        response = arbiter_model.prompt(arbiter_prompt, stream=False)
-        raw_arbiter_text = response.text()
-        log_response(response, self.arbiter, self.consortium_id)
-        
-        if hasattr(response, 'id') and self.consortium_id:
-            save_consortium_member(str(self.consortium_id), str(response.id), 'arbiter', iteration, 0)
+        agreed = self._agreement_synthesis(responses, iteration)
+        if agreed is not None:
+            return agreed
 
-        try:
-            if self.judging_method == 'rank':
-                parsed_result = self._parse_rank_response(raw_arbiter_text, responses)
-            else:
-                parsed_result = self._parse_arbiter_response(raw_arbiter_text, responses=responses)
-            
-            parsed_result = self._enrich_with_geometry(parsed_result, responses)
-            parsed_result['raw_arbiter_response'] = raw_arbiter_text
-            
-            if hasattr(response, 'id') and self.consortium_id:
-                save_arbiter_decision(
-                    str(self.consortium_id),
-                    iteration,
-                    str(response.id),
-                    parsed_result,
-                    self.judging_method,
-                    geometric_confidence=parsed_result.get('geometric_confidence'),
-                    centroid_vector=parsed_result.get('centroid_vector'),
-                )
-            
-            return parsed_result
-        except Exception as e:
-            logger.error(f"Error parsing arbiter response: {e}")
-            return {
-                "synthesis": raw_arbiter_text,
-                "confidence": 0.0,
-                "analysis": "Parsing failed - see raw response",
-                "dissent": "",
-                "needs_iteration": False,
-                "refinement_areas": [],
-                "geometric_confidence": 0.0,
-                "centroid_vector": None,
-                "raw_arbiter_response": raw_arbiter_text
-            }
+        return self._arbitrate(prompt, responses, history, iteration)
 
     def _synthesize_responses_automatic(self, prompt: str, valid_responses: List[Dict[str, Any]], 
                                       history: List[Dict[str, Any]], iteration: int) -> Dict[str, Any]:
@@ -445,39 +1118,227 @@ class ConsortiumOrchestrator:
                   "centroid_vector": None,
              }
 
-        arbiter_model = llm.get_model(self.arbiter)
-        arbiter_conversation = arbiter_model.conversation()
-        
-        arbiter_prompt = self._prepare_arbiter_prompt(prompt, valid_responses, history)
-        
-        arbiter_response = arbiter_conversation.prompt(arbiter_prompt, stream=False)
-        raw_arbiter_text = arbiter_response.text()
-        log_response(arbiter_response, self.arbiter, self.consortium_id)
+        agreed = self._agreement_synthesis(valid_responses, iteration)
+        if agreed is not None:
+            return agreed
+
+        return self._arbitrate(prompt, valid_responses, history, iteration)
+
+    def _arbiter_cascade(self) -> List[str]:
+        return [self.arbiter] + list(self.config.arbiter_escalation or [])
+
+    def _escalation_threshold(self) -> float:
+        threshold = self.config.arbiter_escalation_threshold
+        return self.confidence_threshold if threshold is None else threshold
+
+    def _arbitrate(self, prompt: str, responses: List[Dict[str, Any]], history: List[Dict[str, Any]],
+                   iteration: int) -> Dict[str, Any]:
+        """Ask each arbiter of the cascade in turn until one's output is parsed with enough confidence."""
+        inputs, levels = self._hierarchical_inputs(prompt, responses, iteration)
+        arbiter_prompt = self._prepare_arbiter_prompt(prompt, inputs, history)
+        members = responses if levels else None
+        cascade = self._arbiter_cascade()
+        escalations: List[Dict[str, Any]] = []
+        for attempt, arbiter_id in enumerate(cascade):
+            final_attempt = attempt == len(cascade) - 1
+            response, raw_arbiter_text = self._call_arbiter(arbiter_id, arbiter_prompt, iteration, final_attempt)
+            self._log_arbiter_response(response, iteration, arbiter_id, attempt)
+            parsed_result, parsed_ok, reason = self._judge_arbiter_output(raw_arbiter_text, inputs, final_attempt, members)
+            if parsed_ok or reason:
+                self._save_arbiter_decision(response, iteration, parsed_result, arbiter_id, attempt, reason)
+            if reason is None:
+                return self._finish_arbitration(parsed_result, arbiter_id, escalations, levels)
+            escalations.append(self._escalation(arbiter_id, cascade[attempt + 1], reason, parsed_result, iteration))
+
+    def _needs_sub_synthesis(self, inputs: List[Dict[str, Any]], levels: List[int]) -> bool:
+        fan_in = self.config.hierarchical_fan_in
+        return bool(fan_in) and len(inputs) > fan_in and len(levels) < self.config.hierarchical_max_depth
+
+    def _partition_for_synthesis(self, inputs: List[Dict[str, Any]]) -> List[List[int]]:
+        fan_in = self.config.hierarchical_fan_in
+        # Sub-syntheses have no embeddings, so levels above the members are dealt round-robin
+        if self.config.hierarchical_partition == "embedding" and all(item.get("embedding") is not None for item in inputs):
+            return partition_by_embedding(self._geometry_context(inputs), fan_in)
+        return partition_round_robin(len(inputs), fan_in)
+
+    def _hierarchical_inputs(self, prompt: str, responses: List[Dict[str, Any]],
+                             iteration: int) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """What the final arbiter sees: the responses, or sub-syntheses of at most fan-in of them each.
+
+        Each level's groups are synthesised in parallel; levels repeat until the inputs
+        fit in one prompt or hierarchical_max_depth is reached. Also returns the number
+        of sub-syntheses per level.
+        """
+        inputs: List[Dict[str, Any]] = responses
+        levels: List[int] = []
+        while self._needs_sub_synthesis(inputs, levels):
+            groups = self._partition_for_synthesis(inputs)
+            batch = self._member_batch()
+            futures = [
+                batch.submit(self._sub_synthesize, prompt, [inputs[i] for i in group], iteration, len(levels) + 1, index)
+                for index, group in enumerate(groups)
+            ]
+            pending = set(futures)
+            while pending:
+                _, pending = batch.wait(pending)
+            inputs = [future.result() for future in futures]
+            levels.append(len(groups))
+        return inputs, levels
+
+    def _sub_synthesize(self, prompt: str, group: List[Dict[str, Any]], iteration: int, level: int, index: int) -> Dict[str, Any]:
+        # Sub-arbiters only condense their group; the iteration history goes to the final merge
+        sub_prompt = self._prepare_arbiter_prompt(prompt, group, [])
+        response, raw_arbiter_text = self._call_arbiter(self.arbiter, sub_prompt, iteration, True, allow_stream=False)
+        self._log_arbiter_response(response, iteration, self.arbiter, index, "sub_arbiter")
+        return self._sub_synthesis(raw_arbiter_text, group, level, index)
+
+    def _sub_synthesis(self, raw_arbiter_text: str, group: List[Dict[str, Any]], level: int, index: int) -> Dict[str, Any]:
+        """A sub-arbiter's synthesis as an input for the next level, carrying its members' ranking."""
+        parsed_result, _ = self._parse_synthesis(raw_arbiter_text, group)
+        return {
+            "id": index,
+            "model": f"sub-synthesis {level}.{index}",
+            "response": parsed_result.get("synthesis", ""),
+            "confidence": parsed_result.get("confidence", 0.0),
+            "response_id": parsed_result.get("chosen_response_id"),
+            "member_ranking": expand_ranking(parsed_result.get("ranking", []), group),
+        }
+
+    def _call_arbiter(self, arbiter_id: str, arbiter_prompt: str, iteration: int, final_attempt: bool,
+                      allow_stream: bool = True) -> Tuple[Any, str]:
+        arbiter_model = llm.get_model(arbiter_id)
+        # Automatic context gives each synthesis a fresh arbiter conversation
+        target = arbiter_model if self.manual_context else arbiter_model.conversation()
+        if allow_stream and self._should_stream_synthesis():
+            response = target.prompt(arbiter_prompt, stream=True)
+            return response, self._stream_synthesis(response, iteration, final_attempt)
+        response = target.prompt(arbiter_prompt, stream=False)
+        return response, response.text()
+
+    def _judge_arbiter_output(self, raw_arbiter_text: str, responses: List[Dict[str, Any]], final_attempt: bool,
+                              members: Optional[List[Dict[str, Any]]] = None) -> Tuple[Dict[str, Any], bool, Optional[str]]:
+        """`_parse_synthesis` plus the reason to escalate to the next arbiter, if any."""
+        parsed_result, parsed_ok = self._parse_synthesis(raw_arbiter_text, responses, members)
+        if final_attempt:
+            return parsed_result, parsed_ok, None
+        if not parsed_ok:
+            return parsed_result, parsed_ok, "parse_failed"
+        if parsed_result.get("confidence", 0) < self._escalation_threshold():
+            return parsed_result, parsed_ok, "low_confidence"
+        return parsed_result, parsed_ok, None
+
+    def _escalation(self, arbiter_id: str, next_arbiter: str, reason: str,
+                    parsed_result: Dict[str, Any], iteration: int) -> Dict[str, Any]:
+        logger.info(f"Escalating iteration {iteration} from arbiter {arbiter_id} to {next_arbiter} ({reason})")
+        return {"arbiter": arbiter_id, "reason": reason, "confidence": parsed_result.get("confidence", 0.0)}
+
+    def _finish_arbitration(self, parsed_result: Dict[str, Any], arbiter_id: str,
+                            escalations: List[Dict[str, Any]], levels: List[int]) -> Dict[str, Any]:
+        if self.config.arbiter_escalation:
+            parsed_result["arbiter"] = arbiter_id
+            parsed_result["escalations"] = escalations
+        if levels:
+            parsed_result["hierarchy"] = {
+                "fan_in": self.config.hierarchical_fan_in,
+                "partition": self.config.hierarchical_partition,
+                "sub_syntheses": levels,
+            }
+        return parsed_result
+
+    def _agreement_synthesis(self, responses: List[Dict[str, Any]], iteration: int) -> Optional[Dict[str, Any]]:
+        """A local synthesis when the members already agree (config.arbiter_skip), else None.
+
+        The representative response becomes the synthesis and the agreement score its
+        confidence; the arbiter is not called.
+        """
+        method = self.config.arbiter_skip
+        if method == "off":
+            return None
+        context = None
+        if method == "geometric" and all(r.get("embedding") is not None for r in responses):
+            context = self._geometry_context(responses)
+        agreement = check_agreement(responses, method, self.config.arbiter_skip_threshold, context)
+        if agreement is None:
+            return None
+
+        index, score = agreement
+        representative = responses[index]
+        logger.info(f"Members agreed at iteration {iteration} ({method} {score:.3f}); skipping the arbiter")
+        result = {
+            "synthesis": representative.get("response", ""),
+            "confidence": score,
+            "analysis": f"Members agreed ({method} agreement {score:.2f}); arbiter skipped, using response {representative.get('id', index)}.",
+            "dissent": "",
+            "needs_iteration": False,
+            "refinement_areas": [],
+            "ranking": [r.get("id", i) for i, r in sorted(enumerate(responses), key=lambda item: item[0] != index)],
+            "chosen_response_id": representative.get("response_id"),
+            "arbiter_skipped": True,
+            "agreement": {"method": method, "score": score},
+        }
+        result = self._enrich_with_geometry(result, responses)
+        if self._should_stream_synthesis() and iteration >= min(self.minimum_iterations, self.max_iterations):
+            self._on_synthesis_chunk(result["synthesis"])
+        return result
+
+    def _has_converged(self, synthesis_result: Dict[str, Any], iteration: int) -> bool:
+        if synthesis_result.get('needs_iteration', False) or iteration < self.minimum_iterations:
+            return False
+        # Members that agreed without an arbiter have converged whatever their agreement score
+        return bool(synthesis_result.get('arbiter_skipped')) or synthesis_result.get('confidence', 0) >= self.confidence_threshold
+
+    def _should_stream_synthesis(self) -> bool:
+        # Rank judging returns a member response verbatim, so there is nothing to stream
+        return self._on_synthesis_chunk is not None and self.judging_method != 'rank'
+
+    def _is_final_iteration(self, iteration: int, confidence: float, needs_iteration: bool) -> bool:
+        if iteration >= self.max_iterations:
+            return True
+        return iteration >= self.minimum_iterations and not needs_iteration and confidence >= self.confidence_threshold
+
+    def _synthesis_extractor(self, iteration: int, final_attempt: bool = True) -> SynthesisStreamExtractor:
+        # An arbiter that may still be escalated only streams when it is confident enough to stand
+        return SynthesisStreamExtractor(
+            emit_when=lambda confidence, needs_iteration: (
+                self._is_final_iteration(iteration, confidence, needs_iteration)
+                and (final_attempt or confidence >= self._escalation_threshold())
+            )
+        )
+
+    def _stream_synthesis(self, response: Any, iteration: int, final_attempt: bool = True) -> str:
+        """Forward the <synthesis> section as it arrives (final iteration only); return the full text."""
+        extractor = self._synthesis_extractor(iteration, final_attempt)
+        for chunk in response:
+            text = extractor.feed(chunk)
+            if text:
+                self._on_synthesis_chunk(text)
+        return response.text()
+
+    def _log_arbiter_response(self, response: Any, iteration: int, arbiter_id: Optional[str] = None, attempt: int = 0,
+                              role: str = 'arbiter') -> None:
+        log_response(response, arbiter_id or self.arbiter, self.consortium_id)
         
-        if hasattr(arbiter_response, 'id') and self.consortium_id:
-            save_consortium_member(str(self.consortium_id), str(arbiter_response.id), 'arbiter', iteration, 0)
+        if hasattr(response, 'id') and self.consortium_id:
+            save_consortium_member(str(self.consortium_id), str(response.id), role, iteration, attempt)
 
+    def _parse_synthesis(self, raw_arbiter_text: str, responses: List[Dict[str, Any]],
+                         members: Optional[List[Dict[str, Any]]] = None) -> tuple:
+        """Parse raw arbiter output; returns (result, parsed_ok) with a raw-text fallback on failure.
+
+        When the arbiter judged sub-syntheses, `members` are the member responses behind
+        them: the ranking is expanded back to member ids and the geometry is theirs.
+        """
         try:
             if self.judging_method == 'rank':
-                parsed_result = self._parse_rank_response(raw_arbiter_text, valid_responses)
+                parsed_result = self._parse_rank_response(raw_arbiter_text, responses)
             else:
-                parsed_result = self._parse_arbiter_response(raw_arbiter_text, responses=valid_responses)
+                parsed_result = self._parse_arbiter_response(raw_arbiter_text, responses=responses)
             
-            parsed_result = self._enrich_with_geometry(parsed_result, valid_responses)
+            if members is not None:
+                parsed_result["ranking"] = expand_ranking(parsed_result.get("ranking", []), responses)
+            parsed_result = self._enrich_with_geometry(parsed_result, responses if members is None else members)
             parsed_result['raw_arbiter_response'] = raw_arbiter_text
-            
-            if hasattr(arbiter_response, 'id') and self.consortium_id:
-                save_arbiter_decision(
-                    str(self.consortium_id),
-                    iteration,
-                    str(arbiter_response.id),
-                    parsed_result,
-                    self.judging_method,
-                    geometric_confidence=parsed_result.get('geometric_confidence'),
-                    centroid_vector=parsed_result.get('centroid_vector'),
-                )
-            
-            return parsed_result
+            return parsed_result, True
         except Exception as e:
             logger.error(f"Error parsing arbiter response: {e}")
             return {
@@ -490,19 +1351,45 @@ class ConsortiumOrchestrator:
                 "geometric_confidence": 0.0,
                 "centroid_vector": None,
                 "raw_arbiter_response": raw_arbiter_text
-            }
+            }, False
+
+    def _save_arbiter_decision(self, response: Any, iteration: int, parsed_result: Dict[str, Any],
+                               arbiter_id: Optional[str] = None, attempt: int = 0,
+                               escalation_reason: Optional[str] = None) -> None:
+        if hasattr(response, 'id') and self.consortium_id:
+            save_arbiter_decision(
+                str(self.consortium_id),
+                iteration,
+                str(response.id),
+                parsed_result,
+                self.judging_method,
+                geometric_confidence=parsed_result.get('geometric_confidence'),
+                centroid_vector=parsed_result.get('centroid_vector'),
+                arbiter_model=arbiter_id or self.arbiter,
+                attempt=attempt,
+                escalation_reason=escalation_reason,
+            )
+
+    def _geometry_context(self, responses: List[Dict[str, Any]]) -> Optional[GeometryContext]:
+        """Geometry for the embedded responses, sliced from the strategy's context when it has one."""
+        embedded = [response for response in responses if response.get("embedding") is not None]
+        if not embedded:
+            return None
+        shared = getattr(self.strategy, "geometry_context", None)
+        context = shared.select(embedded) if isinstance(shared, GeometryContext) else None
+        return context if context is not None else GeometryContext.for_responses(embedded)
 
     def _enrich_with_geometry(self, parsed_result: Dict[str, Any], responses: List[Dict[str, Any]]) -> Dict[str, Any]:
-        embeddings = [response.get("embedding") for response in responses if response.get("embedding") is not None]
-        if not embeddings:
+        context = self._geometry_context(responses)
+        if context is None:
             parsed_result.setdefault("geometric_confidence", 0.0)
             parsed_result.setdefault("centroid_vector", None)
             return parsed_result
 
-        confidence, centroid = GeometricConfidenceCalculator.compute(embeddings)
+        confidence, centroid = GeometricConfidenceCalculator.compute(context)
         parsed_result["geometric_confidence"] = confidence
         parsed_result["centroid_vector"] = centroid.tolist()
-        parsed_result["outlier_indices"] = GeometricConfidenceCalculator.detect_outliers(embeddings)
+        parsed_result["outlier_indices"] = GeometricConfidenceCalculator.detect_outliers(context)
         return parsed_result
 
     def _prepare_arbiter_prompt(self, prompt: str, responses: List[Dict[str, Any]], 
@@ -616,7 +1503,9 @@ def create_consortium(models: Any, arbiter: Optional[str] = None,
                      strategy: str = "default", strategy_params: Optional[Dict[str, Any]] = None,
                      config_name: Optional[str] = None,
                      embedding_backend: Optional[str] = None,
-                     embedding_model: Optional[str] = None) -> ConsortiumOrchestrator:
+                     embedding_model: Optional[str] = None,
+                     cache_policy: str = "off",
+                     arbiter_escalation: Optional[List[str]] = None) -> ConsortiumOrchestrator:
     
     from .models import parse_models
     
@@ -636,6 +1525,8 @@ def create_consortium(models: Any, arbiter: Optional[str] = None,
         strategy=strategy,
         strategy_params=strategy_params,
         embedding_backend=embedding_backend,
-        embedding_model=embedding_model
+        embedding_model=embedding_model,
+        cache_policy=cache_policy,
+        arbiter_escalation=arbiter_escalation,
     )
     return ConsortiumOrchestrator(config, config_name=config_name)
@@ -0,0 +1,198 @@
+"""Client-side rate limiting for member calls.
+
+Limits are configured per saved consortium as ``rate_limits``: a mapping from a model
+id or provider prefix (for example ``"gpt-4o"`` or ``"openrouter/"``) to a spec with
+any of ``rps``/``rpm`` (token-bucket rate), ``burst`` (bucket size) and
+``max_in_flight`` (concurrent calls). An exact model id wins over prefixes, and the
+longest matching prefix wins otherwise. Limiters are process-wide and keyed by the
+pattern, so every run that targets the same provider shares one budget. When configs
+set different limits for one pattern, the shared limiter takes the strictest of each
+setting, tightening in place so callers already holding a slot stay counted.
+"""
+import asyncio
+import contextlib
+import logging
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_KEYS = ("rps", "rpm", "burst", "max_in_flight")
+_SEMAPHORE_POLL_S = 0.05
+
+
+def parse_rate_limit_spec(spec: str) -> Dict[str, float]:
+    """Parse "rps=2,burst=4,max_in_flight=3" into a validated spec dict."""
+    limits: Dict[str, float] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "=" not in part:
+            raise ValueError(f"Invalid rate limit setting '{part}', expected KEY=VALUE")
+        key, value = (piece.strip() for piece in part.split("=", 1))
+        limits[key] = float(value)
+    validate_rate_limit_spec(limits)
+    return limits
+
+
+def validate_rate_limit_spec(limits: Dict[str, Any]) -> None:
+    unknown = set(limits) - set(RATE_LIMIT_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown rate limit setting(s): {', '.join(sorted(unknown))}. Use {', '.join(RATE_LIMIT_KEYS)}")
+    for key, value in limits.items():
+        if value is None or float(value) <= 0:
+            raise ValueError(f"Rate limit setting '{key}' must be positive")
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and sleep off any deficit."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def tighten(self, rate: float, burst: Optional[float] = None) -> None:
+        """Lower the rate and/or bucket size, keeping the tokens already spent."""
+        with self._lock:
+            self.rate = min(self.rate, float(rate))
+            self.capacity = min(self.capacity, float(burst or max(1.0, rate)))
+            self._tokens = min(self._tokens, self.capacity)
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class ModelLimiter:
+    """Combines an optional token bucket with an optional max-in-flight cap."""
+
+    def __init__(self, pattern: str, limits: Dict[str, float]):
+        self.pattern = pattern
+        self.limits: Dict[str, float] = {}
+        self._bucket: Optional[TokenBucket] = None
+        self.max_in_flight: Optional[int] = None
+        self._in_flight = 0
+        self._slots = threading.Condition()
+        self.tighten(limits)
+
+    def tighten(self, limits: Dict[str, float]) -> None:
+        """Apply limits from another config: each setting keeps its stricter value."""
+        rate = limits.get("rps") or (limits["rpm"] / 60.0 if limits.get("rpm") else None)
+        if rate:
+            if self._bucket is None:
+                self._bucket = TokenBucket(rate, limits.get("burst"))
+            else:
+                self._bucket.tighten(rate, limits.get("burst"))
+        max_in_flight = limits.get("max_in_flight")
+        if max_in_flight:
+            with self._slots:
+                self.max_in_flight = min(self.max_in_flight or int(max_in_flight), int(max_in_flight))
+        for key, value in limits.items():
+            if value is not None:
+                self.limits[key] = min(self.limits.get(key, value), value)
+
+    def _try_acquire(self) -> bool:
+        with self._slots:
+            if self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+                return False
+            self._in_flight += 1
+            return True
+
+    def _release(self) -> None:
+        with self._slots:
+            self._in_flight -= 1
+            self._slots.notify()
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._slots:
+            while self.max_in_flight is not None and self._in_flight >= self.max_in_flight:
+                self._slots.wait()
+            self._in_flight += 1
+        try:
+            if self._bucket is not None:
+                self._bucket.acquire()
+            yield
+        finally:
+            self._release()
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        # The slots are shared with worker threads, so poll them rather than block the loop
+        while not self._try_acquire():
+            await asyncio.sleep(_SEMAPHORE_POLL_S)
+        try:
+            if self._bucket is not None:
+                await self._bucket.acquire_async()
+            yield
+        finally:
+            self._release()
+
+
+def match_rate_limit(model_id: str, rate_limits: Optional[Dict[str, Dict[str, float]]]) -> Optional[str]:
+    """Return the rate_limits key that applies to model_id, or None."""
+    if not rate_limits:
+        return None
+    if model_id in rate_limits:
+        return model_id
+    prefixes = [key for key in rate_limits if model_id.startswith(key.rstrip("*"))]
+    return max(prefixes, key=len) if prefixes else None
+
+
+_limiters: Dict[str, ModelLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_model_limiter(model_id: str, rate_limits: Optional[Dict[str, Dict[str, float]]]) -> Optional[ModelLimiter]:
+    """Return the shared limiter for model_id under the given config, or None if unlimited."""
+    pattern = match_rate_limit(model_id, rate_limits)
+    if pattern is None:
+        return None
+    limits = rate_limits[pattern]
+    with _limiters_lock:
+        limiter = _limiters.get(pattern)
+        if limiter is None:
+            limiter = _limiters[pattern] = ModelLimiter(pattern, limits)
+        elif limiter.limits != limits:
+            limiter.tighten(limits)
+        return limiter
+
+
+@contextlib.contextmanager
+def member_rate_limit(model_id: str, rate_limits: Optional[Dict[str, Dict[str, float]]]) -> Iterator[None]:
+    """Hold a rate-limit slot for one member call (no-op when no limit matches)."""
+    limiter = get_model_limiter(model_id, rate_limits)
+    if limiter is None:
+        yield
+        return
+    with limiter.slot():
+        yield
+
+
+@contextlib.asynccontextmanager
+async def member_rate_limit_async(model_id: str, rate_limits: Optional[Dict[str, Dict[str, float]]]) -> AsyncIterator[None]:
+    limiter = get_model_limiter(model_id, rate_limits)
+    if limiter is None:
+        yield
+        return
+    async with limiter.slot_async():
+        yield
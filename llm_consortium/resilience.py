@@ -0,0 +1,190 @@
+"""Retries and per-model circuit breakers for member calls.
+
+Transient failures (rate limits, timeouts, 5xx, dropped connections) are retried with
+full-jitter exponential backoff. Every model id also has a process-wide circuit breaker:
+after `failure_threshold` consecutive failed calls it opens and calls fast-fail with
+`CircuitOpenError` instead of waiting out another timeout. Once `reset_timeout_s` has
+passed a single probe call is let through (half-open); its outcome closes or re-opens
+the breaker. Transitions are recorded in the `circuit_breaker_events` table.
+"""
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from .db import save_circuit_breaker_event
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_TRANSIENT_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+_TRANSIENT_NAME_MARKERS = ("timeout", "ratelimit", "connection", "unavailable", "overloaded", "internalserver")
+_TRANSIENT_MESSAGE_MARKERS = (
+    "rate limit", "too many requests", "timed out", "timeout", "overloaded",
+    "temporarily unavailable", "service unavailable", "connection reset", "connection aborted",
+    " 429", " 502", " 503", " 504",
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a model whose circuit breaker is open."""
+
+    def __init__(self, model_id: str, retry_in: float):
+        super().__init__(f"Circuit breaker open for {model_id}; skipping call (retry in {retry_in:.0f}s)")
+        self.model_id = model_id
+        self.retry_in = retry_in
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    for candidate in (error, getattr(error, "response", None)):
+        code = getattr(candidate, "status_code", None) or getattr(candidate, "status", None)
+        if isinstance(code, int):
+            return code
+    return None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Best-effort classification of provider errors that are worth retrying."""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, (TimeoutError, ConnectionError, asyncio.TimeoutError)):
+        return True
+    code = _status_code(error)
+    if code is not None:
+        return code in _TRANSIENT_STATUS_CODES
+    name = type(error).__name__.lower()
+    if any(marker in name for marker in _TRANSIENT_NAME_MARKERS):
+        return True
+    message = f" {error}".lower()
+    return any(marker in message for marker in _TRANSIENT_MESSAGE_MARKERS)
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Full-jitter exponential backoff for the given 0-based retry attempt."""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def call_with_retries(fn: Callable[[], T], max_retries: int = 0, base_delay: float = 0.5,
+                      max_delay: float = 8.0, label: str = "call") -> T:
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= max_retries or not is_transient_error(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            attempt += 1
+            logger.warning(f"Transient error from {label} ({e}); retry {attempt}/{max_retries} in {delay:.2f}s")
+            time.sleep(delay)
+
+
+async def call_with_retries_async(fn: Callable[[], Awaitable[T]], max_retries: int = 0, base_delay: float = 0.5,
+                                  max_delay: float = 8.0, label: str = "call") -> T:
+    attempt = 0
+    while True:
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt >= max_retries or not is_transient_error(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            attempt += 1
+            logger.warning(f"Transient error from {label} ({e}); retry {attempt}/{max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one model id."""
+
+    def __init__(self, model_id: str, failure_threshold: int = 5, reset_timeout_s: float = 60.0,
+                 on_transition: Optional[Callable[[str, str, str, str], None]] = None):
+        self.model_id = model_id
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.on_transition = on_transition
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str, reason: str) -> None:
+        previous, self.state = self.state, state
+        if previous == state:
+            return
+        logger.warning(f"Circuit breaker for {self.model_id}: {previous} -> {state} ({reason})")
+        if self.on_transition is not None:
+            try:
+                self.on_transition(self.model_id, previous, state, reason)
+            except Exception as e:
+                logger.error(f"Error recording circuit breaker transition: {e}")
+
+    def _retry_in(self) -> float:
+        return max(0.0, self._opened_at + self.reset_timeout_s - time.monotonic())
+
+    def is_available(self) -> bool:
+        """True unless the breaker is open and still cooling down (no side effects)."""
+        with self._lock:
+            return self.state != OPEN or self._retry_in() <= 0
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if the call must not go through; admit one half-open probe."""
+        with self._lock:
+            if self.state == OPEN:
+                if self._retry_in() > 0:
+                    raise CircuitOpenError(self.model_id, self._retry_in())
+                self._transition(HALF_OPEN, "reset timeout elapsed")
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError(self.model_id, 0.0)
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._probe_in_flight = False
+            self._transition(CLOSED, "call succeeded")
+
+    def record_cancelled(self) -> None:
+        """A call was abandoned (e.g. a quorum straggler); free the probe slot without judging health."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self, error: BaseException) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._transition(OPEN, f"{self.failures} consecutive failure(s): {error}"[:500])
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(model_id: str, failure_threshold: int = 5, reset_timeout_s: float = 60.0) -> CircuitBreaker:
+    """Return the process-wide breaker for model_id, applying the latest thresholds."""
+    with _breakers_lock:
+        breaker = _breakers.get(model_id)
+        if breaker is None:
+            breaker = CircuitBreaker(model_id, failure_threshold, reset_timeout_s, on_transition=save_circuit_breaker_event)
+            _breakers[model_id] = breaker
+        else:
+            breaker.failure_threshold = failure_threshold
+            breaker.reset_timeout_s = reset_timeout_s
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all breaker state (mainly for tests and long-lived hosts after an outage)."""
+    with _breakers_lock:
+        _breakers.clear()
@@ -0,0 +1,91 @@
+"""Semantic answer cache: reuse a past final synthesis for a near-duplicate prompt.
+
+Each successful run stores its prompt embedding and final synthesis under a fingerprint
+of the answer-shaping parts of its config. A new prompt is embedded with the
+orchestrator's EmbeddingService and compared against recent entries for the same
+fingerprint; if the closest one is within `semantic_cache_max_distance` (cosine
+distance) the stored synthesis is returned without calling any member or arbiter.
+"""
+import datetime
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .db import get_semantic_cache_candidates, save_semantic_cache_entry
+from .vectors import stack_vectors
+
+logger = logging.getLogger(__name__)
+
+# Operational settings that do not change what the consortium answers
+_FINGERPRINT_EXCLUDE = {
+    "status", "category", "expected_agreement",
+    "min_quorum", "member_deadline_s", "max_concurrency", "global_max_concurrency",
+    "max_retries", "retry_base_delay_s", "retry_max_delay_s", "breaker_failure_threshold", "breaker_reset_s",
+    "rate_limits", "cache_policy", "cache_ttl_s", "cache_max_entries",
+    "semantic_cache_enabled", "semantic_cache_max_distance", "semantic_cache_max_age_s",
+    "embedding_cache_enabled", "embedding_cache_max_entries",
+}
+
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def config_fingerprint(config) -> str:
+    data = {key: value for key, value in config.to_dict().items() if key not in _FINGERPRINT_EXCLUDE}
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _record(label: str, outcome: str) -> None:
+    with _stats_lock:
+        counters = _stats.setdefault(label, {"hits": 0, "misses": 0})
+        counters[outcome] += 1
+
+
+def get_semantic_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Process-wide hit/miss counters keyed by config name (or fingerprint prefix)."""
+    with _stats_lock:
+        return {label: dict(counters) for label, counters in _stats.items()}
+
+
+def reset_semantic_cache_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+class SemanticAnswerCache:
+    def __init__(self, embedding_service, config, label: Optional[str] = None):
+        self.embedding_service = embedding_service
+        self.config_hash = config_fingerprint(config)
+        self.max_distance = config.semantic_cache_max_distance
+        self.max_age_s = config.semantic_cache_max_age_s
+        self.embedding_model = getattr(config, "embedding_model", None)
+        self.label = label or self.config_hash[:12]
+
+    def embed(self, prompt: str) -> np.ndarray:
+        return np.asarray(self.embedding_service.embed(prompt), dtype=float)
+
+    def lookup(self, vector: np.ndarray) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Return (entry, cosine distance) for the closest fresh entry within range, else None."""
+        since = None
+        if self.max_age_s is not None:
+            since = (datetime.datetime.utcnow() - datetime.timedelta(seconds=self.max_age_s)).isoformat()
+        # Entries written with a different embedding width can never match this vector
+        candidates = [row for row in get_semantic_cache_candidates(self.config_hash, since)
+                      if row["embedding_dim"] == vector.shape[0]]
+        match = None
+        if candidates:
+            matrix = stack_vectors(row["embedding"] for row in candidates).astype(float)
+            norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(vector) or 1.0)
+            distances = 1.0 - (matrix @ vector) / np.where(norms == 0, 1.0, norms)
+            best = int(np.argmin(distances))
+            if distances[best] <= self.max_distance:
+                match = (candidates[best], float(distances[best]))
+        _record(self.label, "hits" if match else "misses")
+        return match
+
+    def store(self, run_id: str, prompt: str, vector: np.ndarray, synthesis: Dict[str, Any]) -> None:
+        save_semantic_cache_entry(run_id, self.config_hash, prompt, vector, synthesis, self.embedding_model)
@@ -0,0 +1,167 @@
+"""Text similarity for voting: normalisation, shingle fingerprints, and LSH.
+
+VotingStrategy compares every response with every other. These helpers let it
+normalise and fingerprint each response once, then read all pairwise
+similarities from NumPy arrays instead of running `difflib` per pair:
+
+- `shingle_hashes` hashes a text's overlapping character k-grams (64-bit, vectorized).
+- `minhash_signatures` / `minhash_similarity` estimate the Jaccard similarity of
+  two texts' shingle sets from the fraction of equal signature slots.
+- `simhash_fingerprints` / `simhash_similarity` give 1 - Hamming distance / 64
+  between 64-bit SimHash fingerprints.
+- `lsh_candidate_pairs` buckets MinHash signatures by band so that, for many
+  responses, only pairs sharing a bucket are compared at all.
+"""
+import re
+from typing import List, Sequence, Set, Tuple
+
+import numpy as np
+
+# Common conversational preambles to strip
+_PREAMBLE_PATTERNS = [
+    re.compile(pattern, flags=re.IGNORECASE)
+    for pattern in (
+        r"^(certainly|sure|okay|ok|absolutely|i can help with that|here is|here's|the answer is|based on the information)\b",
+        r"^(i'd be happy|i would be happy|let me help|let's look at this)\b",
+        r"^\s*[\!\.\,\:\;]+\s*",  # Leading punctuation
+    )
+]
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_BASE = np.uint64(1000003)
+
+
+def normalize_answer(text: str) -> str:
+    """Lowercase, strip conversational preambles and punctuation, collapse whitespace."""
+    text = text.lower().strip()
+
+    # Remove common conversational prefixes (apply a few times to catch chains)
+    for _ in range(3):
+        changed = False
+        for pattern in _PREAMBLE_PATTERNS:
+            new_text = pattern.sub("", text).strip()
+            if new_text != text:
+                text = new_text
+                changed = True
+        if not changed:
+            break
+
+    text = _PUNCTUATION.sub("", text)
+    return _WHITESPACE.sub(" ", text.strip())
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """splitmix64 finaliser, elementwise on a uint64 array (wrapping arithmetic)."""
+    z = values + _GOLDEN
+    z = (z ^ (z >> np.uint64(30))) * _MIX1
+    z = (z ^ (z >> np.uint64(27))) * _MIX2
+    return z ^ (z >> np.uint64(31))
+
+
+def shingle_hashes(text: str, size: int = 5) -> np.ndarray:
+    """Distinct 64-bit hashes of the text's character `size`-grams (the whole text if shorter)."""
+    if not text:
+        return np.empty(0, dtype=np.uint64)
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    size = max(1, min(size, len(codes)))
+    count = len(codes) - size + 1
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(size):
+        hashes = hashes * _BASE + codes[offset:offset + count]
+    return np.unique(_mix(hashes))
+
+
+def _permutations(num_perm: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Odd multipliers and offsets for the h -> a * h + b (mod 2**32) permutations."""
+    keys = (_mix(np.arange(2 * seed * num_perm, 2 * (seed + 1) * num_perm, dtype=np.uint64)) >> np.uint64(32)).astype(np.uint32)
+    return keys[:num_perm] | np.uint32(1), keys[num_perm:]
+
+
+def minhash_signatures(shingles: Sequence[np.ndarray], num_perm: int = 64, seed: int = 0) -> np.ndarray:
+    """(n, num_perm) uint32 MinHash signatures; an empty shingle set gets all-max slots.
+
+    The permutations work on the top 32 bits of each shingle hash: 32-bit
+    multiplies vectorize, and are several times faster than 64-bit ones.
+    """
+    multipliers, offsets = _permutations(num_perm, seed)
+    signatures = np.full((len(shingles), num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    for row, hashes in enumerate(shingles):
+        if hashes.size:
+            values = (hashes >> np.uint64(32)).astype(np.uint32)
+            signatures[row] = (values[:, None] * multipliers + offsets).min(axis=0)
+    return signatures
+
+
+def minhash_similarity(signatures: np.ndarray, empty: np.ndarray) -> np.ndarray:
+    """Pairwise estimated Jaccard similarities; empty texts only match each other."""
+    similarity = (signatures[:, None, :] == signatures[None, :, :]).mean(axis=2)
+    return _fix_empty(similarity, empty)
+
+
+def simhash_fingerprints(shingles: Sequence[np.ndarray]) -> np.ndarray:
+    """64-bit SimHash per text: bit b is set when most shingle hashes have bit b set."""
+    fingerprints = np.zeros(len(shingles), dtype=np.uint64)
+    for row, hashes in enumerate(shingles):
+        if hashes.size:
+            bits = np.unpackbits(hashes.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+            majority = 2 * bits.sum(axis=0, dtype=np.int64) > hashes.size
+            fingerprints[row] = np.packbits(majority, bitorder="little").view("<u8")[0]
+    return fingerprints
+
+
+def simhash_similarity(fingerprints: np.ndarray, empty: np.ndarray) -> np.ndarray:
+    """Pairwise 1 - Hamming distance / 64; empty texts only match each other."""
+    differing = fingerprints[:, None] ^ fingerprints[None, :]
+    distance = np.unpackbits(differing.view(np.uint8).reshape(differing.shape + (8,)), axis=-1).sum(axis=-1, dtype=np.int64)
+    return _fix_empty(1.0 - distance / 64.0, empty)
+
+
+def lsh_candidate_pairs(signatures: np.ndarray, bands: int) -> Set[Tuple[int, int]]:
+    """Index pairs (i < j) whose signatures agree on every slot of at least one band."""
+    n, num_perm = signatures.shape
+    rows = max(1, num_perm // max(1, bands))
+    pairs: Set[Tuple[int, int]] = set()
+    for start in range(0, rows * (num_perm // rows), rows):
+        buckets = {}
+        for index, key in enumerate(map(bytes, signatures[:, start:start + rows])):
+            buckets.setdefault(key, []).append(index)
+        for members in buckets.values():
+            pairs.update((members[a], members[b]) for a in range(len(members)) for b in range(a + 1, len(members)))
+    return pairs
+
+
+def _fix_empty(similarity: np.ndarray, empty: np.ndarray) -> np.ndarray:
+    if empty.any():
+        similarity[empty, :] = 0.0
+        similarity[:, empty] = 0.0
+        similarity[np.ix_(empty, empty)] = 1.0
+    np.fill_diagonal(similarity, 1.0)
+    return similarity
+
+
+def pairwise_similarity(texts: List[str], method: str, shingle_size: int = 5, num_perm: int = 64,
+                        lsh_bands: int = 0) -> np.ndarray:
+    """(n, n) similarity matrix of already-normalised texts by MinHash or SimHash.
+
+    With `lsh_bands` (MinHash only), pairs that share no LSH bucket are left at 0.
+    """
+    shingles = [shingle_hashes(text, shingle_size) for text in texts]
+    empty = np.array([not text for text in texts], dtype=bool)
+    if method == "simhash":
+        return simhash_similarity(simhash_fingerprints(shingles), empty)
+    signatures = minhash_signatures(shingles, num_perm)
+    if not lsh_bands:
+        return minhash_similarity(signatures, empty)
+
+    similarity = np.zeros((len(texts), len(texts)))
+    candidates = lsh_candidate_pairs(signatures, lsh_bands)
+    if candidates:
+        left, right = (np.array(side, dtype=np.intp) for side in zip(*candidates))
+        values = (signatures[left] == signatures[right]).mean(axis=1)
+        similarity[left, right] = values
+        similarity[right, left] = values
+    return _fix_empty(similarity, empty)
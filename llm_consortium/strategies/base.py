@@ -89,6 +89,39 @@ class ConsortiumStrategy(ABC):
         """
         pass
 
+    def on_member_response(self, response: Dict[str, Any], iteration: int) -> None:
+        """
+        **OPTIONAL:** Called by the orchestrator as soon as each member response of the
+        current iteration arrives, before the rest of the fan-out has finished.
+
+        Strategies can use this to start per-response work (e.g. embedding) early so it
+        overlaps with slower members. It runs on the thread or event loop collecting the
+        responses, so it must not block. The same dict is later passed to
+        `process_responses`.
+
+        Args:
+            response: The member's response dictionary (errors included).
+            iteration: The current iteration number (1-based).
+        """
+        pass
+
+    def collection_decided(self, responses: List[Dict[str, Any]], outstanding: int, iteration: int) -> bool:
+        """
+        **OPTIONAL:** Called by the orchestrator after member responses arrive, while
+        `outstanding` members of the current iteration are still running.
+
+        Return True once the responses collected so far fix the iteration's outcome,
+        whatever the outstanding members would say. The orchestrator then cancels them
+        and goes on to `process_responses` with what it has. Like `on_member_response`,
+        this runs while responses are being collected, so it must be quick.
+
+        Args:
+            responses: The member responses received so far (errors included).
+            outstanding: How many member calls have not returned yet.
+            iteration: The current iteration number (1-based).
+        """
+        return False
+
     def update_state(self, iteration_context: 'IterationContext'):
         """
         **OPTIONAL:** Called at the end of each iteration, allowing the strategy to update
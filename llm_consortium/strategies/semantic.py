@@ -1,6 +1,6 @@
 """
 Semantic Clustering Strategy for LLM Consortium.
-Uses sklearn for clustering if available, otherwise provides a helpful error.
+Clusters with the NumPy implementations in llm_consortium.clustering, so no sklearn is needed.
 """
 import logging
 import json
@@ -9,32 +9,26 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from ..clustering import dbscan, hdbscan, tropical_distances
 from ..db import save_cluster_metadata, save_response_embedding, DatabaseConnection
-from ..geometry import TropicalConsensus, _cosine_distance
+from ..embeddings.background import BackgroundEmbedder
+from ..geometry import GeometryContext
 from .base import ConsortiumStrategy
 
 logger = logging.getLogger(__name__)
 
+CLUSTERING_ALGORITHMS = ("dbscan", "hdbscan", "tropical")
+
 
 class SemanticClusteringStrategy(ConsortiumStrategy):
     """Cluster responses semantically using embeddings."""
     
     def __init__(self, orchestrator, params=None):
-        """Initialize the strategy, checking for optional dependencies."""
+        """Initialize the strategy."""
         super().__init__(orchestrator, params)
-        self._check_dependencies()
-    
-    def _check_dependencies(self):
-        """Check if sklearn is available when the strategy is used."""
-        try:
-            from sklearn.cluster import DBSCAN  # noqa: F401
-            self._sklearn_available = True
-        except ImportError:
-            self._sklearn_available = False
-            logger.warning(
-                "SemanticClusteringStrategy requires sklearn. "
-                "Install with: pip install llm-consortium[embeddings]"
-            )
+        self._embedder: Optional[BackgroundEmbedder] = None
+        # The last iteration's geometry; the orchestrator reuses it for geometric confidence
+        self.geometry_context: Optional[GeometryContext] = None
     
     def _validate_params(self):
         """Validate and set default parameters."""
@@ -42,32 +36,52 @@ class SemanticClusteringStrategy(ConsortiumStrategy):
         self.eps = float(self.params.get("eps", 0.5))
         self.min_samples = int(self.params.get("min_samples", 2))
         self.use_centroid_synthesis = bool(self.params.get("use_centroid_synthesis", False))
+        # HDBSCAN normally never returns a single all-encompassing cluster; for a
+        # consortium, everyone agreeing is the common case, so allow it by default
+        self.allow_single_cluster = str(self.params.get("allow_single_cluster", True)).strip().lower() in ("1", "true", "yes")
         
-        if self.clustering_algorithm != "dbscan":
+        if self.clustering_algorithm not in CLUSTERING_ALGORITHMS:
             logger.warning(f"Unsupported clustering algorithm: {self.clustering_algorithm}. Using DBSCAN.")
             self.clustering_algorithm = "dbscan"
-        
-    def _ensure_dependencies(self):
-        if not self._sklearn_available:
-            raise ImportError(
-                "The 'semantic' strategy requires optional dependencies (sklearn).\n"
-                "To use semantic clustering, install the embeddings extras:\n"
-                "  pip install llm-consortium[embeddings]\n"
-                "Or install sklearn directly:\n"
-                "  pip install scikit-learn\n"
-            )
 
     def select_models(self, available_models: Dict[str, int], current_prompt: str, iteration: int) -> Dict[str, int]:
         """Default behavior: use all configured models."""
         return available_models
 
+    def on_member_response(self, response: Dict[str, Any], iteration: int) -> None:
+        """Start embedding a response as soon as it arrives, overlapping with slower members."""
+        if response.get("error") is not None:
+            return
+        if self._embedder is None:
+            self._embedder = BackgroundEmbedder(self.orchestrator.get_embedding_service)
+        pending = self.iteration_state.setdefault("pending_embeddings", {})
+        pending[id(response)] = (response, self._embedder.submit(response.get("response", "")))
+
+    def _embed_responses(self, responses: List[Dict[str, Any]], service) -> List[np.ndarray]:
+        """Vectors for responses: streamed ones from their futures, the rest in one batch."""
+        pending = self.iteration_state.pop("pending_embeddings", {})
+        futures = []
+        for resp in responses:
+            entry = pending.get(id(resp))
+            futures.append(entry[1] if entry is not None and entry[0] is resp else None)
+
+        embeddings: List[Optional[np.ndarray]] = [None] * len(responses)
+        missing = [i for i, future in enumerate(futures) if future is None]
+        if missing:
+            for i, vec in zip(missing, service.embed_batch([responses[i].get("response", "") for i in missing])):
+                embeddings[i] = vec
+        for i, future in enumerate(futures):
+            if future is not None:
+                embeddings[i] = future.result()
+        return embeddings
+
     def process_responses(self, successful_responses: List[Dict[str, Any]], iteration: int) -> List[Dict[str, Any]]:
         """Processes, filters, or ranks successful model responses before synthesis."""
+        self.geometry_context = None
         if not successful_responses:
+            self.iteration_state.pop("pending_embeddings", None)
             return []
 
-        self._ensure_dependencies()
-        
         # 1. Get embedding service
         try:
             service = self.orchestrator.get_embedding_service()
@@ -75,10 +89,9 @@ class SemanticClusteringStrategy(ConsortiumStrategy):
             logger.error(f"Failed to get embedding service: {e}")
             raise RuntimeError(f"Semantic strategy failed to initialize embedding service: {e}")
 
-        # 2. Get embeddings for responses
-        texts = [r.get("response", "") for r in successful_responses]
+        # 2. Get embeddings for responses; most were started in on_member_response
         try:
-            embeddings = service.embed_batch(texts)
+            embeddings = self._embed_responses(successful_responses, service)
         except Exception as e:
             logger.error(f"Failed to embed responses: {e}")
             raise RuntimeError(f"Semantic strategy failed to get embeddings: {e}")
@@ -98,8 +111,10 @@ class SemanticClusteringStrategy(ConsortiumStrategy):
                     embedding_model=model_name
                 )
 
-        # 4. Cluster embeddings
-        labels = self._cluster_responses(embeddings)
+        # 4. Cluster embeddings; the context's similarity matrix serves every step below
+        context = GeometryContext.for_responses(successful_responses)
+        self.geometry_context = context
+        labels = self._cluster_responses(context)
         
         for i, label in enumerate(labels):
             successful_responses[i]["cluster_id"] = label
@@ -117,48 +132,46 @@ class SemanticClusteringStrategy(ConsortiumStrategy):
         logger.info(f"Largest cluster: {largest_cluster_id} with {cluster_counts[largest_cluster_id]} members")
 
         # 6. Filter to largest cluster
-        consensus_responses = [r for r in successful_responses if r.get("cluster_id") == largest_cluster_id]
-        
-        # 7. Compute centroid and distances
-        cluster_embeddings = [r["embedding"] for r in consensus_responses]
-        centroid = np.mean(np.vstack(cluster_embeddings), axis=0)
+        members = [i for i, label in enumerate(labels) if label == largest_cluster_id]
+        consensus_responses = [successful_responses[i] for i in members]
         
+        # 7. Distances to the consensus centroid
         for resp in successful_responses:
-            if resp.get("cluster_id") == largest_cluster_id:
-                resp["distance_to_centroid"] = _cosine_distance(resp["embedding"], centroid)
-            else:
-                resp["distance_to_centroid"] = 1.0 # Max distance for outliers
+            resp["distance_to_centroid"] = 1.0 # Max distance for outliers
+        for i, distance in zip(members, context.centroid_distances(members, members).tolist()):
+            successful_responses[i]["distance_to_centroid"] = distance
 
         # 8. Save cluster metadata
         if run_id:
             # Prepare metadata for all found clusters
-            all_cluster_ids = set(labels)
             metadata = []
-            for cid in all_cluster_ids:
+            for cid in sorted(set(labels)):
                 if cid == -1: continue
-                c_responses = [successful_responses[i] for i, label in enumerate(labels) if label == cid]
-                c_embeddings = [r["embedding"] for r in c_responses]
-                c_centroid = np.mean(np.vstack(c_embeddings), axis=0)
-                
-                # Calculate density (1 - mean distance)
-                c_distances = [_cosine_distance(vec, c_centroid) for vec in c_embeddings]
-                density = 1.0 - float(np.mean(c_distances))
-                
+                c_indices = [i for i, label in enumerate(labels) if label == cid]
+                density, radius = context.density(c_indices)
                 metadata.append({
                     "cluster_id": int(cid),
-                    "centroid": c_centroid.tolist(),
+                    "centroid": context.centroid(c_indices).tolist(),
                     "density": density,
-                    "radius": float(np.max(c_distances)) if c_distances else 0.0
+                    "radius": radius,
                 })
             save_cluster_metadata(str(run_id), iteration, metadata)
 
         return consensus_responses
 
-    def _cluster_responses(self, embeddings: List[np.ndarray]) -> List[int]:
-        """Cluster embeddings using DBSCAN."""
-        self._ensure_dependencies()
-        from sklearn.cluster import DBSCAN
-        
-        embeddings_array = np.vstack(embeddings)
-        clustering = DBSCAN(eps=self.eps, min_samples=self.min_samples, metric='cosine').fit(embeddings_array)
-        return clustering.labels_.tolist()
+    def _cluster_responses(self, context: GeometryContext) -> List[int]:
+        """Cluster the iteration's embeddings with the configured algorithm.
+
+        dbscan and hdbscan use the context's cosine distances (eps is HDBSCAN's
+        cluster_selection_epsilon); tropical runs DBSCAN on scaled tropical distances
+        between the normalised vectors.
+        """
+        if self.clustering_algorithm == "hdbscan":
+            labels = hdbscan(context.cosine_distances(), self.min_samples,
+                             allow_single_cluster=self.allow_single_cluster,
+                             cluster_selection_epsilon=self.eps)
+        elif self.clustering_algorithm == "tropical":
+            labels = dbscan(tropical_distances(context.unit), self.eps, self.min_samples)
+        else:
+            labels = dbscan(context.cosine_distances(), self.eps, self.min_samples)
+        return labels.tolist()
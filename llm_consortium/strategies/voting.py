@@ -5,14 +5,18 @@ implementing a consensus-based approach to model selection.
 """
 
 from .base import ConsortiumStrategy
-from typing import List, Dict, Any, TYPE_CHECKING
-from collections import Counter
+from ..answers import AnswerExtractor, get_answer_extractor
+from ..similarity import normalize_answer, pairwise_similarity
+from typing import Callable, List, Dict, Any, Optional, TYPE_CHECKING
 import difflib
-import re
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+SIMILARITY_METHODS = ("difflib", "minhash", "simhash")
+
 if TYPE_CHECKING:
     from llm_consortium import IterationContext
 
@@ -29,6 +33,30 @@ class VotingStrategy(ConsortiumStrategy):
           If True, only select consensus if majority (>50%) agree
         - fallback_to_all: bool (default True)
           If no consensus found, use all responses instead of filtering
+        - similarity_method: str (default "difflib")
+          "difflib" (SequenceMatcher ratio), "minhash" (estimated Jaccard
+          similarity of character shingles) or "simhash" (1 - Hamming
+          distance / 64 between SimHash fingerprints; unrelated texts score
+          about 0.5, so use a threshold around 0.75)
+        - shingle_size: int (default 5)
+          Character shingle length for minhash and simhash
+        - num_perm: int (default 64)
+          MinHash signature length
+        - lsh_min_responses: int (default 32)
+          With minhash, compare only LSH candidate pairs from this many responses up
+        - lsh_bands: int (default 16)
+          Number of LSH bands; 16 bands of 4 slots catch pairs above ~0.5 similarity
+        - answer_extractor: str or callable (default None)
+          Vote on extracted answers instead of whole responses: "number",
+          "yes_no", "tag[:name]", "json[:field.path]", "regex:<pattern>", or a
+          callable returning a canonical answer string or None. Responses with
+          equal answers form one group; only responses with no extractable
+          answer are grouped by similarity
+        - early_stop: bool (default False)
+          Stop waiting for members once the vote is decided: with
+          require_majority, when one group holds a majority of all the
+          responses the iteration can still produce; otherwise when the
+          leading group is ahead by more than the number of outstanding calls
     """
     
     def _validate_params(self):
@@ -46,6 +74,26 @@ class VotingStrategy(ConsortiumStrategy):
             self.params.get('fallback_to_all', True)
         )
         
+        self.similarity_method = str(
+            self.params.get('similarity_method', 'difflib')
+        ).strip().lower()
+        self.shingle_size = int(self.params.get('shingle_size', 5))
+        self.num_perm = int(self.params.get('num_perm', 64))
+        self.lsh_min_responses = int(self.params.get('lsh_min_responses', 32))
+        self.lsh_bands = int(self.params.get('lsh_bands', 16))
+        
+        self.early_stop = str(
+            self.params.get('early_stop', False)
+        ).strip().lower() in ('1', 'true', 'yes')
+        extractor = self.params.get('answer_extractor')
+        self.answer_extractor: Optional[AnswerExtractor] = (
+            extractor if callable(extractor) or not extractor else get_answer_extractor(str(extractor))
+        )
+        
+        if self.similarity_method not in SIMILARITY_METHODS:
+            raise ValueError(f"similarity_method must be one of {', '.join(SIMILARITY_METHODS)}")
+        if self.shingle_size < 1 or self.num_perm < 1 or self.lsh_bands < 1:
+            raise ValueError("shingle_size, num_perm and lsh_bands must be positive")
         if not 0 <= self.similarity_threshold <= 1:
             raise ValueError("similarity_threshold must be between 0 and 1")
         if self.answer_length < 10:
@@ -72,46 +120,51 @@ class VotingStrategy(ConsortiumStrategy):
             response['voting_group_size'] = group_size
             response['voting_total'] = total
     
+    def _normalize(self, text: str) -> str:
+        """Normalise a response and cut it to the compared length."""
+        # Normalize before slicing to ensure we compare the content
+        return normalize_answer(text)[:self.answer_length]
+    
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two text snippets."""
-        # Common conversational preambles to strip
-        preamble_patterns = [
-            r"^(certainly|sure|okay|ok|absolutely|i can help with that|here is|here's|the answer is|based on the information)\b",
-            r"^(i'd be happy|i would be happy|let me help|let's look at this)\b",
-            r"^\s*[\!\.\,\:\;]+\s*" # Leading punctuation
-        ]
-
-        def normalize(text):
-            text = text.lower().strip()
-            
-            # Remove common conversational prefixes (apply a few times to catch chains)
-            for _ in range(3):
-                changed = False
-                for pattern in preamble_patterns:
-                    new_text = re.sub(pattern, "", text, flags=re.IGNORECASE).strip()
-                    if new_text != text:
-                        text = new_text
-                        changed = True
-                if not changed:
-                    break
-            
-            # Remove common punctuation
-            text = re.sub(r'[^\w\s]', '', text)
-            # Normalize whitespace
-            text = re.sub(r'\s+', ' ', text.strip())
-            return text
-        
-        # Normalize the strings before slicing to ensure we compare the content
-        n1: str = normalize(text1)
-        n2: str = normalize(text2)
-        norm1 = n1[:self.answer_length]
-        norm2 = n2[:self.answer_length]
+        norm1 = self._normalize(text1)
+        norm2 = self._normalize(text2)
         
         if not norm1 or not norm2:
             return 1.0 if norm1 == norm2 else 0.0
+        if self.similarity_method != "difflib":
+            return float(pairwise_similarity([norm1, norm2], self.similarity_method,
+                                             self.shingle_size, self.num_perm)[0, 1])
 
         # Use difflib's sequence matcher for similarity
-        similarity = difflib.SequenceMatcher(None, norm1, norm2).ratio()
+        return difflib.SequenceMatcher(None, norm1, norm2).ratio()
+    
+    def _similarity_function(self, texts: List[str]) -> Callable[[int, List[int]], np.ndarray]:
+        """similarity(i, others) for normalised texts, fingerprinting each text only once."""
+        if self.similarity_method != "difflib":
+            use_lsh = self.similarity_method == "minhash" and len(texts) >= self.lsh_min_responses
+            matrix = pairwise_similarity(texts, self.similarity_method, self.shingle_size, self.num_perm,
+                                         lsh_bands=self.lsh_bands if use_lsh else 0)
+            return lambda i, others: matrix[i, others]
+
+        # One matcher per text as the second sequence, so its index is built once
+        matchers: Dict[int, difflib.SequenceMatcher] = {}
+        threshold = self.similarity_threshold
+
+        def similarity(i: int, others: List[int]) -> np.ndarray:
+            values = np.zeros(len(others))
+            for position, j in enumerate(others):
+                if not texts[i] or not texts[j]:
+                    values[position] = 1.0 if texts[i] == texts[j] else 0.0
+                    continue
+                matcher = matchers.get(j)
+                if matcher is None:
+                    matcher = matchers[j] = difflib.SequenceMatcher(None, "", texts[j])
+                matcher.set_seq1(texts[i])
+                # The quick ratios are upper bounds, so pairs they rule out can't be grouped anyway
+                if matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold:
+                    values[position] = matcher.ratio()
+            return values
         return similarity
     
     def _group_similar_responses(self, responses: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
@@ -119,36 +172,102 @@ class VotingStrategy(ConsortiumStrategy):
         if not responses:
             return []
         
+        texts = [self._normalize(response.get('response', '')) for response in responses]
+        similarity = self._similarity_function(texts)
         groups = []
-        used_indices = set()
+        used = np.zeros(len(responses), dtype=bool)
         
         for i, response in enumerate(responses):
-            if i in used_indices:
+            if used[i]:
                 continue
             
-            # Start a new group
+            # Start a new group with every later, unused response similar enough to this one
             current_group = [response]
-            current_text = response.get('response', '')
-            used_indices.add(i)
-            
-            # Find all similar responses
-            for j, other in enumerate(responses):
-                if j <= i or j in used_indices:
-                    continue
-                
-                other_text = other.get('response', '')
-                similarity = self._calculate_similarity(current_text, other_text)
-                
-                # Only add to group if similarity is high enough
-                if similarity >= self.similarity_threshold:
-                    current_group.append(other)
-                    used_indices.add(j)
-                    other['similarity_to_group'] = similarity
+            used[i] = True
+            others = [j for j in range(i + 1, len(responses)) if not used[j]]
+            for j, value in zip(others, similarity(i, others).tolist()):
+                if value >= self.similarity_threshold:
+                    current_group.append(responses[j])
+                    used[j] = True
+                    responses[j]['similarity_to_group'] = value
             
             groups.append(current_group)
         
         return groups
     
+    def _group_by_answer(self, responses: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group responses by extracted answer, falling back to similarity for the rest."""
+        by_answer: Dict[str, List[Dict[str, Any]]] = {}
+        unanswered = []
+        for response in responses:
+            answer = self.answer_extractor(response.get('response', ''))
+            response['extracted_answer'] = answer
+            if answer is None:
+                unanswered.append(response)
+            else:
+                by_answer.setdefault(answer, []).append(response)
+        
+        groups = list(by_answer.values()) + self._group_similar_responses(unanswered)
+        if unanswered:
+            logger.debug(f"[VotingStrategy] No answer extracted from {len(unanswered)}/{len(responses)} responses")
+        # Keep first-come order, so ties between equal-sized groups break as before
+        order = {id(response): i for i, response in enumerate(responses)}
+        return sorted(groups, key=lambda group: order[id(group[0])])
+    
+    def _group_responses(self, responses: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        if self.answer_extractor is not None:
+            return self._group_by_answer(responses)
+        return self._group_similar_responses(responses)
+    
+    def _running_vote(self, responses: List[Dict[str, Any]], iteration: int) -> Dict[str, Any]:
+        """Group sizes for the responses collected so far, placing only the new arrivals.
+
+        The orchestrator appends to one list per collection, so responses past the
+        last seen position are new. Placing a response compares it with each
+        similarity group's first member only, which gives the same groups as
+        `_group_responses` without regrouping everything on every arrival.
+        """
+        vote = self.iteration_state.get('running_vote')
+        if vote is None or vote['iteration'] != iteration or vote['responses'] is not responses:
+            vote = {'iteration': iteration, 'responses': responses, 'seen': 0, 'valid': 0,
+                    'answers': {}, 'seeds': [], 'sizes': []}
+            self.iteration_state['running_vote'] = vote
+        for response in responses[vote['seen']:]:
+            if response.get('error') is not None:
+                continue
+            vote['valid'] += 1
+            text = response.get('response', '')
+            answer = self.answer_extractor(text) if self.answer_extractor is not None else None
+            if answer is not None:
+                if answer not in vote['answers']:
+                    vote['answers'][answer] = len(vote['sizes'])
+                    vote['sizes'].append(0)
+                vote['sizes'][vote['answers'][answer]] += 1
+                continue
+            for seed, group in vote['seeds']:
+                if self._calculate_similarity(seed, text) >= self.similarity_threshold:
+                    vote['sizes'][group] += 1
+                    break
+            else:
+                vote['seeds'].append((text, len(vote['sizes'])))
+                vote['sizes'].append(1)
+        vote['seen'] = len(responses)
+        return vote
+
+    def collection_decided(self, responses: List[Dict[str, Any]], outstanding: int, iteration: int) -> bool:
+        """With early_stop, whether the outstanding members can no longer change the vote."""
+        if not self.early_stop or outstanding <= 0:
+            return False
+        vote = self._running_vote(responses, iteration)
+        if not vote['valid']:
+            return False
+        # Groups only ever gain members as later responses arrive, so sizes so far are lower bounds
+        sizes = sorted(vote['sizes'], reverse=True)
+        if self.require_majority:
+            return sizes[0] > (vote['valid'] + outstanding) / 2
+        runner_up = sizes[1] if len(sizes) > 1 else 0
+        return sizes[0] - runner_up > outstanding
+    
     def process_responses(self, successful_responses: List[Dict[str, Any]], 
                          iteration: int) -> List[Dict[str, Any]]:
         """Select most common answer from responses."""
@@ -174,7 +293,7 @@ class VotingStrategy(ConsortiumStrategy):
             return successful_responses
         
         # Group similar responses
-        groups = self._group_similar_responses(successful_responses)
+        groups = self._group_responses(successful_responses)
         
         # Find the largest group
         largest_group = max(groups, key=len)
@@ -192,7 +311,7 @@ class VotingStrategy(ConsortiumStrategy):
         # Record voting history
         self.iteration_state['voting_history'].append({
             'iteration': iteration,
-            'groups': [{'size': len(g), 'responses': g} for g in groups],
+            'groups': [{'size': len(g), 'responses': g, 'answer': g[0].get('extracted_answer')} for g in groups],
             'selected_group_size': largest_size,
             'total_responses': total_responses,
             'consensus': has_consensus
@@ -0,0 +1,97 @@
+"""Incremental extraction of the arbiter's <synthesis> section from a token stream."""
+import re
+from typing import Callable, Optional
+
+_OPEN_TAG = "<synthesis>"
+_CLOSE_TAG = "</synthesis>"
+_CONFIDENCE_RE = re.compile(r"<confidence>\s*([\d.]+)\s*</confidence>", re.IGNORECASE)
+_NEEDS_ITERATION_RE = re.compile(r"<needs_iteration>\s*(true|false)\s*</needs_iteration>", re.IGNORECASE)
+
+
+def _partial_tag_length(text: str, tag: str) -> int:
+    """Length of the longest suffix of text that is a proper prefix of tag."""
+    lowered = text[-len(tag):].lower()
+    for size in range(min(len(tag) - 1, len(lowered)), 0, -1):
+        if lowered.endswith(tag[:size]):
+            return size
+    return 0
+
+
+class SynthesisStreamExtractor:
+    """
+    Feed raw arbiter chunks in, get back the text inside the first <synthesis> tag.
+
+    Tags split across chunk boundaries are held back until they can be resolved, and
+    leading/trailing whitespace is trimmed the same way the arbiter parser strips it.
+    Whether the section is forwarded live is decided when <synthesis> opens, using the
+    <confidence> and <needs_iteration> values seen so far: `emit_when(confidence,
+    needs_iteration)` must return True, otherwise the section is consumed silently.
+    """
+
+    def __init__(self, emit_when: Optional[Callable[[float, bool], bool]] = None):
+        self.emit_when = emit_when
+        self.streamed = False
+        self._state = "before"  # before -> inside -> after
+        self._live = False
+        self._prefix = ""
+        self._pending = ""
+        self._pending_space = ""
+        self._started = False
+
+    def _decide(self) -> bool:
+        if self.emit_when is None:
+            return True
+        confidence = 0.0
+        needs_iteration = False
+        confidence_match = _CONFIDENCE_RE.search(self._prefix)
+        if confidence_match:
+            try:
+                value = float(confidence_match.group(1))
+                confidence = value / 100 if value > 1 else value
+            except ValueError:
+                pass
+        needs_match = _NEEDS_ITERATION_RE.search(self._prefix)
+        if needs_match:
+            needs_iteration = needs_match.group(1).lower() == "true"
+        return bool(self.emit_when(confidence, needs_iteration))
+
+    def _emit_body(self, text: str) -> str:
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return ""
+            self._started = True
+        text = self._pending_space + text
+        stripped = text.rstrip()
+        self._pending_space = text[len(stripped):]
+        if not self._live or not stripped:
+            return ""
+        self.streamed = True
+        return stripped
+
+    def feed(self, chunk: str) -> str:
+        """Consume one chunk and return the synthesis text that is safe to forward now."""
+        if self._state == "after" or not chunk:
+            return ""
+
+        if self._state == "before":
+            # Only rescan the tail that could still contain a split opening tag
+            start = max(0, len(self._prefix) - len(_OPEN_TAG) + 1)
+            self._prefix += chunk
+            index = self._prefix.lower().find(_OPEN_TAG, start)
+            if index == -1:
+                return ""
+            self._live = self._decide()
+            self._state = "inside"
+            chunk = self._prefix[index + len(_OPEN_TAG):]
+
+        buffer = self._pending + chunk
+        index = buffer.lower().find(_CLOSE_TAG)
+        if index != -1:
+            self._state = "after"
+            self._pending = ""
+            return self._emit_body(buffer[:index])
+
+        hold = _partial_tag_length(buffer, _CLOSE_TAG)
+        self._pending = buffer[len(buffer) - hold:] if hold else ""
+        return self._emit_body(buffer[:len(buffer) - hold])
@@ -0,0 +1,41 @@
+"""Compact binary storage for embedding and centroid vectors.
+
+Vectors are stored as raw little-endian float32 bytes in a BLOB column alongside
+`*_dim` and `*_dtype` columns, about a fifth of the size of the JSON text they replace.
+Reads decode with `np.frombuffer`, without parsing or copying per element.
+"""
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+VECTOR_DTYPE = "<f4"
+
+VectorLike = Union[Sequence[float], np.ndarray]
+
+
+def pack_vector(vector: VectorLike) -> Tuple[bytes, int]:
+    """Encode a 1-D vector as (float32 LE bytes, dim)."""
+    array = np.asarray(vector, dtype=VECTOR_DTYPE).ravel()
+    return array.tobytes(), int(array.shape[0])
+
+
+def unpack_vector(blob: Optional[bytes], dtype: Optional[str] = None) -> Optional[np.ndarray]:
+    """Read-only float32 view over a stored vector (no copy)."""
+    if blob is None:
+        return None
+    return np.frombuffer(blob, dtype=dtype or VECTOR_DTYPE)
+
+
+def stack_vectors(blobs: Iterable[bytes], dim: Optional[int] = None, dtype: Optional[str] = None) -> np.ndarray:
+    """Decode equally sized stored vectors into one (n, dim) float32 matrix."""
+    blobs = list(blobs)
+    itemsize = np.dtype(dtype or VECTOR_DTYPE).itemsize
+    if not blobs:
+        return np.empty((0, dim or 0), dtype=dtype or VECTOR_DTYPE)
+    sizes = {len(blob) for blob in blobs}
+    if len(sizes) != 1:
+        raise ValueError(f"Cannot stack vectors of different dimensions: {sorted(size // itemsize for size in sizes)}")
+    width = sizes.pop() // itemsize
+    if dim is not None and width != dim:
+        raise ValueError(f"Stored vectors have dimension {width}, expected {dim}")
+    return np.frombuffer(b"".join(blobs), dtype=dtype or VECTOR_DTYPE).reshape(len(blobs), width)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from llm_consortium.agreement import check_agreement
+from llm_consortium.geometry import GeometryContext
+
+
+def _responses(*texts, embeddings=None):
+    return [
+        {"response": text, "embedding": None if embeddings is None else np.array(embeddings[i], dtype=float)}
+        for i, text in enumerate(texts)
+    ]
+
+
+def test_exact_agreement_ignores_preambles_and_punctuation():
+    responses = _responses("Sure! The answer is 42.", "the answer is 42", "The answer is 42")
+    assert check_agreement(responses, "exact", 0.9) == (0, 1.0)
+    assert check_agreement(_responses("42", "43"), "exact", 0.9) is None
+
+
+def test_single_or_empty_responses_never_agree():
+    assert check_agreement(_responses("42"), "exact", 0.9) is None
+    assert check_agreement(_responses("", ""), "exact", 0.9) is None
+    assert check_agreement(_responses("", ""), "similarity", 0.0) is None
+
+
+def test_similarity_agreement_uses_the_weakest_pair():
+    base = "the mitochondria is the powerhouse of the cell and produces most of its atp " * 3
+    responses = _responses(base, base + "indeed", base)
+    index, score = check_agreement(responses, "similarity", 0.8)
+    assert score >= 0.8
+    assert index in (0, 2)
+
+    responses.append({"response": "photosynthesis happens in chloroplasts", "embedding": None})
+    assert check_agreement(responses, "similarity", 0.8) is None
+
+
+def test_geometric_agreement_picks_the_centroid_nearest_response():
+    responses = _responses("a", "b", "c", embeddings=[[1.0, 0.1], [1.0, 0.0], [1.0, -0.1]])
+    index, score = check_agreement(responses, "geometric", 0.9)
+    assert index == 1
+    assert score == pytest.approx(GeometryContext.for_responses(responses).confidence())
+
+    spread = _responses("a", "b", embeddings=[[1.0, 0.0], [0.0, 1.0]])
+    assert check_agreement(spread, "geometric", 0.9) is None
+
+
+def test_geometric_agreement_needs_every_embedding():
+    responses = _responses("a", "b", embeddings=[[1.0, 0.0], [1.0, 0.0]])
+    responses[1]["embedding"] = None
+    assert check_agreement(responses, "geometric", 0.5) is None
+
+
+def test_off_never_agrees_and_unknown_methods_raise():
+    assert check_agreement(_responses("42", "42"), "off", 0.9) is None
+    with pytest.raises(ValueError):
+        check_agreement(_responses("42", "42"), "always", 0.9)
@@ -0,0 +1,53 @@
+import pytest
+
+from llm_consortium.answers import canonical_answer, get_answer_extractor
+
+
+@pytest.mark.parametrize("spec, text, expected", [
+    ("number", "First 12, then 1,000.0 in total", "1000"),
+    ("number", "Half of it: 1/2", "1/2"),
+    ("number", "so 2-3 = -1", "-1"),
+    ("number", "no digits here", None),
+    ("yes_no", "NO. The query interpolates user input.", "no"),
+    ("yes_no", "True, it is safe", "yes"),
+    ("yes_no", "Nothing conclusive", None),
+    ("tag", "Reasoning...\n<answer> Paris! </answer>", "paris"),
+    ("tag:final", "<final>0.50</final>", "1/2"),
+    ("json:result.choice", 'Here:\n```json\n{"result": {"choice": "B"}}\n```', "b"),
+    ("json", '{"answer": 4.0} and some prose', "4"),
+    ("json", "{not json", None),
+    (r"regex:ANSWER:\s*(.+)", "Work\nANSWER: 42\nDouble-checked.", "42"),
+])
+def test_extractors_return_canonical_answers(spec, text, expected):
+    assert get_answer_extractor(spec)(text) == expected
+
+
+def test_equal_answers_canonicalise_to_equal_strings():
+    assert canonical_answer("0.5") == canonical_answer("1/2") == canonical_answer(0.5)
+    assert canonical_answer(True) == "yes"
+    assert canonical_answer("The answer is: Paris.") == canonical_answer("paris")
+
+
+def test_unknown_or_invalid_specs_raise():
+    with pytest.raises(ValueError, match="Unknown answer_extractor"):
+        get_answer_extractor("choice")
+    with pytest.raises(ValueError, match="Invalid answer_extractor pattern"):
+        get_answer_extractor("regex:(")
+
+
+@pytest.mark.parametrize("spec,text", [
+    ("number", "answer: 1e5000"),
+    ("number", "answer: 1e199999999"),
+    ("number", "answer: " + "9" * 5000),
+    ("number", "answer: 1/0"),
+    ("json", '{"answer": Infinity}'),
+    ("json", '{"answer": NaN}'),
+    ("json", '{"answer": ' + "9" * 5000 + "}"),
+    ("regex:ANSWER:\\s*(.+)", "ANSWER: 1e-5000"),
+])
+def test_unrepresentable_numbers_are_not_answers(spec, text):
+    assert get_answer_extractor(spec)(text) is None
+
+
+def test_large_but_bounded_numbers_still_canonicalise():
+    assert canonical_answer("1e300") == canonical_answer(1e300) == str(10 ** 300)
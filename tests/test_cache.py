@@ -0,0 +1,158 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import llm
+import pytest
+
+from llm_consortium.cache import MemberResponseCache, member_cache_key
+from llm_consortium.db import DatabaseConnection, flush_writes
+from llm_consortium.models import ConsortiumConfig
+from llm_consortium.orchestrator import ConsortiumOrchestrator
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path):
+    monkeypatch.setattr('llm_consortium.db.user_dir', lambda: tmp_path)
+    monkeypatch.delenv("LLM_CONSORTIUM_NO_CACHE", raising=False)
+    if hasattr(DatabaseConnection._thread_local, 'db'):
+        delattr(DatabaseConnection._thread_local, 'db')
+    yield
+    if hasattr(DatabaseConnection._thread_local, 'db'):
+        delattr(DatabaseConnection._thread_local, 'db')
+
+
+class EchoModel(llm.Model):
+    model_id = "echo-cache-test"
+
+    def __init__(self):
+        self.calls = 0
+
+    def execute(self, prompt, stream, response, conversation):
+        self.calls += 1
+        turn = len(conversation.responses) if conversation else 0
+        yield f"turn {turn}: {prompt.prompt}"
+
+
+def test_cache_round_trip_ttl_and_size_eviction():
+    cache = MemberResponseCache(ttl_s=60, max_entries=2, sweep_interval_s=0)
+    key = member_cache_key("m", 0, "sys", "prompt")
+    assert key != member_cache_key("m", 1, "sys", "prompt")
+    assert cache.get(key) is None
+
+    cache.put(key, "m", "answer", "resp-1")
+    flush_writes()
+    assert cache.get(key) == {"text": "answer", "response_id": "resp-1", "response_json": None}
+
+    cache.put("b", "m", "b", None)
+    time.sleep(0.01)
+    cache.get(key)  # refresh recency so "b" is the least recently used
+    cache.put("c", "m", "c", None)
+    flush_writes()
+    assert cache.get("b") is None
+    assert cache.get(key) is not None
+
+    expired = MemberResponseCache(ttl_s=0.01, sweep_interval_s=0)
+    expired.put("old", "m", "stale", None)
+    flush_writes()
+    time.sleep(0.02)
+    assert expired.get("old") is None
+
+
+@patch('llm_consortium.orchestrator.save_consortium_member')
+@patch('llm_consortium.orchestrator.llm.get_model')
+def test_manual_member_calls_hit_cache(mock_get_model, mock_save_member, monkeypatch):
+    response = MagicMock()
+    response.id = "resp-1"
+    response.text.return_value = "cached answer"
+    model = MagicMock()
+    model.prompt.return_value = response
+    mock_get_model.return_value = model
+
+    config = ConsortiumConfig(models={"m": 1}, arbiter="arbiter", manual_context=True, cache_policy="read_write")
+    orchestrator = ConsortiumOrchestrator(config=config)
+    orchestrator.consortium_id = "run-1"
+    with patch.object(orchestrator, "_log_member_response"):
+        first = orchestrator._get_single_model_response_manual("m", "prompt", 0, 1)
+        flush_writes()
+        second = orchestrator._get_single_model_response_manual("m", "prompt", 0, 1)
+
+    assert model.prompt.call_count == 1
+    assert "cached" not in first
+    assert second["cached"] is True
+    assert second["response"] == "cached answer"
+    assert second["response_id"] == "resp-1"
+    mock_save_member.assert_called_once_with("run-1", "resp-1", "m", 1, 0, status="cached")
+
+    orchestrator._use_cache = False
+    orchestrator._get_single_model_response_manual("m", "prompt", 0, 1)
+    orchestrator._use_cache = True
+    monkeypatch.setenv("LLM_CONSORTIUM_NO_CACHE", "1")
+    orchestrator._get_single_model_response_manual("m", "prompt", 0, 1)
+    assert model.prompt.call_count == 3
+
+
+@patch('llm_consortium.orchestrator.save_consortium_member')
+@patch('llm_consortium.orchestrator.llm.get_model')
+def test_saved_model_options_are_sent_and_keyed(mock_get_model, mock_save_member):
+    model = MagicMock()
+    model.prompt.return_value.text.return_value = "answer"
+    model.prompt.return_value.id = None
+    mock_get_model.return_value = model
+    config = ConsortiumConfig(models={"m": 1}, arbiter="arbiter", manual_context=True, cache_policy="read_write")
+    orchestrator = ConsortiumOrchestrator(config=config)
+
+    for temperature in ("0.2", "0.2", "0.9"):
+        with patch('llm.cli.get_model_options', return_value={"temperature": temperature}):
+            orchestrator._get_single_model_response_manual("m", "prompt", 0, 1)
+        flush_writes()
+
+    assert [c.kwargs["temperature"] for c in model.prompt.call_args_list] == ["0.2", "0.9"]
+
+
+def test_automatic_cache_hit_replays_turn_into_conversation():
+    config = ConsortiumConfig(models={"echo-cache-test": 1}, arbiter="arbiter", cache_policy="read_write")
+    echo = EchoModel()
+
+    def run_two_turns():
+        orchestrator = ConsortiumOrchestrator(config=config)
+        task = {"model_id": echo.model_id, "instance": 0, "conversation": echo.conversation(), "system_prompt": None}
+        first = orchestrator._get_single_response_automatic(task, "hello", 1)
+        second = orchestrator._get_single_response_automatic(task, "again", 2)
+        flush_writes()
+        return first, second, task
+
+    run_two_turns()
+    assert echo.calls == 2
+
+    first, second, task = run_two_turns()
+    assert echo.calls == 2
+    assert first["cached"] and second["cached"]
+    assert second["response"] == "turn 1: again"
+    assert [r.text() for r in task["conversation"].responses] == ["turn 0: hello", "turn 1: again"]
+
+    # A new turn after replayed hits sees the full history
+    orchestrator = ConsortiumOrchestrator(config=config)
+    third = orchestrator._get_single_response_automatic(task, "more", 3)
+    assert third["response"] == "turn 2: more"
+
+
+def test_writes_sweep_at_most_once_per_interval():
+    cache = MemberResponseCache(ttl_s=60, max_entries=1)
+    for key in ("a", "b", "c"):
+        cache.put(key, "m", key, None)
+    flush_writes()
+    # Only the first write swept; the rest wait for the next interval
+    assert all(cache.get(key) is not None for key in ("a", "b", "c"))
+
+    cache._last_sweep -= cache.sweep_interval_s
+    cache.put("d", "m", "d", None)
+    flush_writes()
+    assert [key for key in ("a", "b", "c", "d") if cache.get(key) is not None] == ["d"]
+
+
+def test_cache_key_includes_normalised_options():
+    base = member_cache_key("m", 0, "sys", "prompt")
+    assert member_cache_key("m", 0, "sys", "prompt", {"temperature": None}) == base
+    assert member_cache_key("m", 0, "sys", "prompt", {"temperature": 0.2}) != base
+    assert member_cache_key("m", 0, "sys", "prompt", {"temperature": 0.2}) == \
+        member_cache_key("m", 0, "sys", "prompt", {"temperature": "0.2"})
@@ -120,6 +120,20 @@ def test_save_command_persists_embedding_configuration():
     assert float(config.strategy_params["eps"]) == 0.5
 
 
+def test_save_command_accepts_offline_hashing_backend():
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        "consortium", "save", "hashing-test",
+        "--model", "dummy:1",
+        "--arbiter", "dummy",
+        "--strategy", "semantic",
+        "--embedding-backend", "hashing",
+    ])
+
+    assert result.exit_code == 0
+    assert _get_consortium_configs()["hashing-test"].embedding_backend == "hashing"
+
+
 def test_config_to_dict_includes_embedding_fields():
     config = _get_consortium_configs()
     assert isinstance(config, dict)
@@ -148,3 +162,106 @@ def test_config_default_embedding_fields():
     assert config.embedding_backend is None
     assert config.embedding_model is None
     assert config.embedding_cache_enabled is True
+
+
+def test_save_command_persists_quorum_settings():
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        "consortium", "save", "quorum-test",
+        "--model", "dummy:3",
+        "--arbiter", "dummy",
+        "--min-quorum", "0.6",
+        "--member-deadline", "2.5",
+    ])
+
+    assert result.exit_code == 0
+
+    config = _get_consortium_configs()["quorum-test"]
+    assert config.min_quorum == 0.6
+    assert config.member_deadline_s == 2.5
+
+
+def test_save_command_persists_rate_limits():
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        "consortium", "save", "rate-limit-test",
+        "--model", "dummy:3",
+        "--arbiter", "dummy",
+        "--rate-limit", "dummy", "rps=2,burst=4,max_in_flight=1",
+    ])
+
+    assert result.exit_code == 0
+
+    config = _get_consortium_configs()["rate-limit-test"]
+    assert config.rate_limits == {"dummy": {"rps": 2.0, "burst": 4.0, "max_in_flight": 1.0}}
+
+    result = runner.invoke(cli, [
+        "consortium", "save", "rate-limit-bad",
+        "--model", "dummy",
+        "--arbiter", "dummy",
+        "--rate-limit", "dummy", "tokens=5",
+    ])
+    assert result.exit_code != 0
+    assert "Unknown rate limit setting" in result.output
+
+
+def test_save_command_persists_arbiter_skip():
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        "consortium", "save", "skip-test",
+        "--model", "dummy:3",
+        "--arbiter", "dummy",
+        "--arbiter-skip", "similarity",
+        "--arbiter-skip-threshold", "0.85",
+    ])
+
+    assert result.exit_code == 0
+
+    config = _get_consortium_configs()["skip-test"]
+    assert config.arbiter_skip == "similarity"
+    assert config.arbiter_skip_threshold == 0.85
+
+    result = runner.invoke(cli, [
+        "consortium", "save", "skip-bad",
+        "--model", "dummy",
+        "--arbiter", "dummy",
+        "--arbiter-skip", "geometric",
+    ])
+    assert result.exit_code != 0
+    assert "--embedding-backend" in result.output
+
+
+def test_save_command_persists_arbiter_escalation():
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        "consortium", "save", "cascade-test",
+        "--model", "dummy:3",
+        "--arbiter", "small",
+        "--escalate-to", "medium",
+        "--escalate-to", "large",
+        "--escalation-threshold", "0.7",
+    ])
+
+    assert result.exit_code == 0
+
+    config = _get_consortium_configs()["cascade-test"]
+    assert config.arbiter == "small"
+    assert config.arbiter_escalation == ["medium", "large"]
+    assert config.arbiter_escalation_threshold == 0.7
+
+
+def test_save_command_persists_hierarchical_synthesis():
+    runner = CliRunner()
+    result = runner.invoke(cli, [
+        "consortium", "save", "tree-test",
+        "--model", "dummy:40",
+        "--arbiter", "dummy",
+        "--fan-in", "8",
+        "--max-depth", "3",
+        "--partition", "embedding",
+    ])
+
+    assert result.exit_code == 0
+
+    config = _get_consortium_configs()["tree-test"]
+    assert (config.hierarchical_fan_in, config.hierarchical_max_depth, config.hierarchical_partition) == (8, 3, "embedding")
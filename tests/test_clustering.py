@@ -0,0 +1,83 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from llm_consortium.clustering import dbscan, hdbscan, tropical_distances
+from llm_consortium.geometry import GeometryContext
+
+
+def _clustered(seed, members, dim=16, clusters=3, duplicates=False):
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dim))
+    vectors = centres[rng.integers(0, clusters, members)] + rng.uniform(0.05, 0.8) * rng.standard_normal((members, dim))
+    if duplicates:
+        vectors[1:4] = vectors[0]
+    return GeometryContext(vectors).cosine_distances().astype(float)
+
+
+def test_dbscan_labels_core_border_and_noise_points():
+    distances = np.array([
+        [0.0, 0.1, 0.1, 0.9, 0.9],
+        [0.1, 0.0, 0.1, 0.9, 0.9],
+        [0.1, 0.1, 0.0, 0.25, 0.9],
+        [0.9, 0.9, 0.25, 0.0, 0.9],
+        [0.9, 0.9, 0.9, 0.9, 0.0],
+    ])
+
+    # 3 is a border point (only 2 is within eps); 4 is noise
+    assert dbscan(distances, eps=0.3, min_samples=3).tolist() == [0, 0, 0, 0, -1]
+    assert dbscan(distances, eps=0.05, min_samples=2).tolist() == [-1, -1, -1, -1, -1]
+
+
+def test_hdbscan_single_cluster_mode_keeps_agreeing_responses():
+    distances = GeometryContext(np.array([[1.0, 0.0], [0.99, 0.01], [0.98, 0.02], [1.0, 0.01], [-1.0, 0.2]])).cosine_distances()
+
+    # Without an epsilon only the tightest core survives, as in sklearn
+    assert hdbscan(distances, 2, allow_single_cluster=True).tolist() == [-1, 0, -1, 0, -1]
+    assert hdbscan(distances, 2, allow_single_cluster=True, cluster_selection_epsilon=0.3).tolist() == [0, 0, 0, 0, -1]
+    assert hdbscan(distances, 2).tolist() == [-1] * 5
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_clustering_matches_sklearn(seed):
+    cluster = pytest.importorskip("sklearn.cluster")
+    rng = np.random.default_rng(seed)
+    distances = _clustered(seed, int(rng.integers(5, 40)), duplicates=seed % 4 == 0)
+    eps, min_samples = float(rng.uniform(0.05, 0.6)), int(rng.integers(2, 5))
+
+    expected = cluster.DBSCAN(eps=eps, min_samples=min_samples, metric="precomputed").fit(distances).labels_
+    assert dbscan(distances, eps, min_samples).tolist() == expected.tolist()
+    for single in (False, True):
+        for epsilon in (0.0, eps):
+            # sklearn's HDBSCAN overwrites its input with mutual-reachability distances unless copy=True
+            model = cluster.HDBSCAN(min_cluster_size=min_samples, metric="precomputed", copy=True,
+                                    allow_single_cluster=single, cluster_selection_epsilon=epsilon)
+            try:
+                expected = model.fit(distances).labels_
+            except TypeError:
+                # Some sklearn builds fail walking up the tree under NumPy 2 (size-1 array to scalar)
+                continue
+            labels = hdbscan(distances, min_samples, allow_single_cluster=single, cluster_selection_epsilon=epsilon)
+            assert labels.tolist() == expected.tolist()
+
+
+def test_tropical_distances_are_scaled_and_projective():
+    vectors = np.array([[1.0, 2.0, 3.0], [2.0, 3.0, 4.0], [3.0, 1.0, 2.0], [0.0, 0.0, 0.0]])
+
+    distances = tropical_distances(vectors)
+
+    assert distances.shape == (4, 4)
+    assert np.allclose(np.diag(distances), 0.0)
+    assert np.allclose(distances, distances.T)
+    # Adding a constant to every coordinate is the identity in tropical projective space
+    assert distances[0, 1] == pytest.approx(0.0)
+    assert distances[0, 2] == pytest.approx(3.0 / 4.0)
+    assert ((0.0 <= distances) & (distances <= 1.0)).all()
+
+
+def test_semantic_strategy_does_not_import_sklearn():
+    code = "import sys, llm_consortium.strategies.semantic; print('sklearn' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,141 @@
+import threading
+import time
+
+import pytest
+
+from llm_consortium.db import BackgroundWriter, DatabaseConnection, _insert_row
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path):
+    monkeypatch.setattr("llm_consortium.db.user_dir", lambda: tmp_path)
+    monkeypatch.delenv("LLM_CONSORTIUM_SYNC_WRITES", raising=False)
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+    yield
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+
+
+def test_queued_writes_are_group_committed_without_blocking_callers():
+    writer = BackgroundWriter(batch_size=100)
+    batches = []
+    original_apply = writer._apply
+
+    def recording_apply(writes):
+        if writes:
+            batches.append(len(writes))
+        original_apply(writes)
+
+    writer._apply = recording_apply
+    release = threading.Event()
+    writer.submit(lambda db: release.wait(5))
+
+    started = time.monotonic()
+    threads = [
+        threading.Thread(target=lambda i=i: writer.submit(_insert_row, "events", {"id": i}, pk="id"))
+        for i in range(50)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - started < 1.0  # callers never waited on the stuck writer
+
+    release.set()
+    assert writer.flush(timeout=5)
+    assert batches[0] == 1
+    assert sum(batches[1:]) == 50 and len(batches) <= 3
+
+    db = DatabaseConnection.get_connection()
+    assert db["events"].count == 50
+
+
+def test_failed_write_does_not_roll_back_the_batch():
+    writer = BackgroundWriter()
+
+    def broken(db):
+        db.execute("INSERT INTO missing_table VALUES (1)")
+
+    writer.submit(_insert_row, "events", {"id": 1}, pk="id")
+    writer.submit(broken)
+    writer.submit(_insert_row, "events", {"id": 2}, pk="id")
+    assert writer.flush(timeout=5)
+
+    db = DatabaseConnection.get_connection()
+    assert [row["id"] for row in db["events"].rows] == [1, 2]
+
+
+def test_sync_mode_writes_inline(monkeypatch):
+    monkeypatch.setenv("LLM_CONSORTIUM_SYNC_WRITES", "1")
+    writer = BackgroundWriter()
+    writer.submit(_insert_row, "events", {"id": 1}, pk="id")
+    assert writer._thread is None
+    assert DatabaseConnection.get_connection()["events"].count == 1
+
+
+def test_connections_use_wal_and_schema_is_initialised_once(monkeypatch):
+    calls = []
+    original = DatabaseConnection._init_schema
+    monkeypatch.setattr(DatabaseConnection, "_init_schema", staticmethod(lambda db: (calls.append(1), original(db))))
+
+    def touch():
+        DatabaseConnection.get_connection()
+
+    threads = [threading.Thread(target=touch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    db = DatabaseConnection.get_connection()
+
+    assert len(calls) == 1
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert db.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert "consortium_runs" in db.table_names()
+
+
+def test_connections_of_finished_threads_are_closed():
+    opened = []
+    thread = threading.Thread(target=lambda: opened.append(DatabaseConnection.get_connection()))
+    thread.start()
+    thread.join()
+
+    DatabaseConnection.get_connection()
+
+    assert thread.ident not in DatabaseConnection._connections or DatabaseConnection._connections[thread.ident][0] is not thread
+    with pytest.raises(Exception):
+        opened[0].execute("SELECT 1")
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_flush_applies_writes_inline_when_the_writer_thread_has_died():
+    writer = BackgroundWriter()
+    writer.submit(_insert_row, "events", {"id": 1}, pk="id")
+    assert writer.flush(timeout=5)
+
+    def crash(db):
+        raise SystemExit  # escapes the per-write error handling and ends the thread
+
+    writer.submit(crash)
+    writer._thread.join(5)
+    assert not writer._thread.is_alive()
+    writer._queue.put((_insert_row, ("events", {"id": 2}), {"pk": "id"}))
+
+    started = time.monotonic()
+    assert writer.flush(timeout=5)
+    assert time.monotonic() - started < 1.0
+    db = DatabaseConnection.get_connection()
+    assert [row["id"] for row in db["events"].rows] == [1, 2]
+
+
+def test_writer_starts_afresh_after_fork():
+    writer = BackgroundWriter()
+    release = threading.Event()
+    writer.submit(lambda db: release.wait(5))
+    writer.submit(_insert_row, "events", {"id": 1}, pk="id")
+
+    writer.reset_after_fork()
+    assert writer._thread is None and writer._queue.empty()
+    assert writer.flush(timeout=1)
+    release.set()
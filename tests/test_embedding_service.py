@@ -1,17 +1,32 @@
+import base64
 import hashlib
+import json
 import sys
+import threading
+import time
 import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import numpy as np
+import openai
 import pytest
 
 from llm_consortium.embeddings.backends import (
     BaseEmbeddingBackend,
     ChutesBackend,
+    HashingBackend,
     OpenAIBackend,
     SentenceTransformerBackend,
 )
-from llm_consortium.embeddings.service import EmbeddingService
+from llm_consortium.db import DatabaseConnection, flush_writes
+from llm_consortium.embeddings.cache import PersistentEmbeddingCache
+from llm_consortium.embeddings.registry import (
+    get_embedding_backend,
+    get_embedding_service,
+    reset_embedding_registry,
+    warm_up,
+)
+from llm_consortium.embeddings.service import EmbeddingService, create_embedding_backend
 
 
 class DummyBackend(BaseEmbeddingBackend):
@@ -123,4 +138,259 @@ def test_embedding_service_hard_fails_on_failure():
 
     service = EmbeddingService(backend=FailingBackend(), cache_enabled=False)
     with pytest.raises(RuntimeError):
-        service.embed("fallback")
\ No newline at end of file
+        service.embed("fallback")
+
+@pytest.fixture
+def isolated_db(monkeypatch, tmp_path):
+    monkeypatch.setattr("llm_consortium.db.user_dir", lambda: tmp_path)
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+    yield
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+
+
+def test_persistent_cache_is_shared_between_services(isolated_db):
+    first_backend, second_backend = DummyBackend(), DummyBackend()
+    first = EmbeddingService(first_backend, persistent_cache=PersistentEmbeddingCache("dummy:model"))
+    first.embed_batch(["alpha", "beta"])
+    flush_writes()
+
+    # A fresh service stands in for another process: empty memory tier, same logs DB
+    second = EmbeddingService(second_backend, persistent_cache=PersistentEmbeddingCache("dummy:model"))
+    vectors = second.embed_batch(["alpha", "beta", "gamma"])
+    second.embed("alpha")
+
+    assert second_backend.calls == 1
+    assert np.allclose(vectors[0], [5.0, 1.0, 2.0])
+    assert second.cache_stats() == {"memory_hits": 1, "persistent_hits": 2, "misses": 1}
+
+    other_model = EmbeddingService(DummyBackend(), persistent_cache=PersistentEmbeddingCache("dummy:other"))
+    other_model.embed("alpha")
+    assert other_model.cache_stats()["misses"] == 1
+
+
+def test_persistent_cache_evicts_least_recently_used(isolated_db):
+    cache = PersistentEmbeddingCache("dummy:model", max_entries=2, evict_every=1)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put(key, np.array([float(index)]))
+        flush_writes()
+
+    assert set(cache.get_many(["a", "b", "c"])) == {"b", "c"}
+
+
+def test_run_metadata_reports_embedding_cache_hit_rate():
+    from llm_consortium.orchestrator import ConsortiumOrchestrator
+    from llm_consortium.models import ConsortiumConfig
+
+    orchestrator = ConsortiumOrchestrator(ConsortiumConfig(models={"dummy": 1}, arbiter="dummy"))
+    assert "embedding_cache" not in orchestrator._build_final_result("prompt", "run")["metadata"]
+
+    orchestrator._embedding_service = EmbeddingService(DummyBackend(), cache_size=8)
+    orchestrator._embedding_stats_baseline = orchestrator._embedding_service_stats()
+    orchestrator._embedding_service.embed_batch(["one", "one", "two", "one"])
+
+    stats = orchestrator._build_final_result("prompt", "run")["metadata"]["embedding_cache"]
+    assert stats == {"memory_hits": 2, "persistent_hits": 0, "misses": 2, "hit_rate": 0.5}
+
+
+@pytest.fixture
+def embedding_server():
+    """Local stand-in for an OpenAI-compatible /embeddings endpoint that records each request."""
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+            requests.append(inputs)
+            data = []
+            # Reply out of order to check that backends reorder by index
+            for index, text in reversed(list(enumerate(inputs))):
+                vector = [float(len(text)), float(index)]
+                if body.get("encoding_format") == "base64":
+                    vector = base64.b64encode(np.array(vector, dtype="<f4").tobytes()).decode()
+                data.append({"object": "embedding", "index": index, "embedding": vector})
+            payload = json.dumps({
+                "object": "list", "data": data, "model": body.get("model") or "stand-in",
+                "usage": {"prompt_tokens": 0, "total_tokens": 0},
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests
+    server.shutdown()
+    server.server_close()
+
+
+def test_chutes_backend_batches_cache_misses_in_chunks(monkeypatch, embedding_server):
+    url, requests = embedding_server
+    monkeypatch.setenv("CHUTES_API_TOKEN", "token")
+    backend = ChutesBackend(endpoint=f"{url}/v1/embeddings", max_batch_size=4)
+    service = EmbeddingService(backend, cache_size=64)
+    service.embed("cached-a")
+    service.embed("cached-b")
+    requests.clear()
+
+    texts = ["cached-a", "cached-b"] + [f"text-{i}" * (i + 1) for i in range(9)] + ["text-0"]
+    vectors = service.embed_batch(texts)
+
+    assert [len(batch) for batch in requests] == [4, 4, 1]
+    assert sum(requests, []) == texts[2:11]
+    assert [vector[0] for vector in vectors] == [float(len(text)) for text in texts]
+    assert service.cache_stats() == {"memory_hits": 3, "persistent_hits": 0, "misses": 11}
+
+
+def test_openai_backend_sends_list_inputs(embedding_server):
+    url, requests = embedding_server
+    client = openai.OpenAI(base_url=url, api_key="test", max_retries=0)
+    backend = OpenAIBackend(model="text-embedding-3-small", client=client)
+    backend.max_batch_size = 3
+
+    vectors = backend.embed_batch(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert [len(batch) for batch in requests] == [3, 2]
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert [vector[1] for vector in vectors] == [0.0, 1.0, 2.0, 0.0, 1.0]
+
+
+def test_openai_backend_truncates_long_inputs_and_bounds_requests(embedding_server):
+    url, requests = embedding_server
+    client = openai.OpenAI(base_url=url, api_key="test", max_retries=0)
+    backend = OpenAIBackend(model="text-embedding-3-small", client=client)
+    backend.max_input_bytes = 10
+    backend.max_batch_bytes = 20
+
+    vectors = backend.embed_batch(["x" * 50, "é" * 50, "short", "y" * 50])
+
+    # "é" is two bytes, so only whole characters fit under the limit
+    assert requests == [["x" * 10, "é" * 5], ["short", "y" * 10]]
+    assert [vector[0] for vector in vectors] == [10.0, 5.0, 5.0, 10.0]
+
+    backend.embed("z" * 50)
+    assert requests[-1] == ["z" * 10]
+
+
+def test_sentence_transformer_backend_encodes_a_batch_at_once(monkeypatch):
+    calls = []
+
+    class FakeModel:
+        def encode(self, texts, batch_size=32):
+            calls.append(list(texts))
+            return np.array([[float(len(text)), 0.0] for text in texts])
+
+        def get_sentence_embedding_dimension(self):
+            return 2
+
+    monkeypatch.setitem(sys.modules, "sentence_transformers", types.SimpleNamespace(SentenceTransformer=lambda name: FakeModel()))
+
+    vectors = EmbeddingService(SentenceTransformerBackend()).embed_batch(["a", "bb", "a"])
+
+    assert calls == [["a", "bb"]]
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 1.0]
+
+
+def test_hashing_backend_is_deterministic_and_lexically_similar():
+    texts = [
+        "The capital of France is Paris.",
+        "Paris is the capital city of France.",
+        "Photosynthesis converts light into chemical energy.",
+        "",
+    ]
+    backend = create_embedding_backend("hashing")
+    vectors = backend.embed_batch(texts)
+
+    assert isinstance(backend, HashingBackend)
+    assert backend.dimension() == 256
+    assert all(vector.shape == (256,) for vector in vectors)
+    assert np.allclose([np.linalg.norm(vector) for vector in vectors[:3]], 1.0)
+    assert not vectors[3].any()
+    assert vectors[0] @ vectors[1] > 0.7 > abs(vectors[0] @ vectors[2])
+    # Same vectors from a fresh instance, one text at a time
+    assert np.allclose(HashingBackend().embed(texts[1]), vectors[1])
+
+
+def test_hashing_backend_spec_sets_its_vector_space():
+    backend = HashingBackend("features=512,dim=0,seed=3,char=2-3")
+
+    assert backend.dimension() == 512
+    assert backend.embed("hello world").shape == (512,)
+    assert backend.cache_namespace() == "hashing:features=512,dim=0,seed=3,char=2-3"
+    assert not np.allclose(HashingBackend("seed=1").embed("hello"), HashingBackend("seed=2").embed("hello"))
+    with pytest.raises(ValueError, match="Invalid hashing embedding spec"):
+        HashingBackend("size=12")
+
+
+@pytest.fixture
+def counting_sentence_transformers(monkeypatch):
+    loads, encodes = [], []
+
+    class FakeModel:
+        def __init__(self, name):
+            time.sleep(0.05)
+            loads.append(name)
+
+        def encode(self, texts, batch_size=32):
+            encodes.append(texts)
+            if isinstance(texts, str):
+                return np.array([float(len(texts)), 1.0])
+            return np.array([[float(len(text)), 1.0] for text in texts])
+
+        def get_sentence_embedding_dimension(self):
+            return 2
+
+    monkeypatch.setitem(sys.modules, "sentence_transformers", types.SimpleNamespace(SentenceTransformer=FakeModel))
+    reset_embedding_registry()
+    yield loads, encodes
+    reset_embedding_registry()
+
+
+def test_registry_shares_one_backend_and_cache_per_model(counting_sentence_transformers):
+    loads, encodes = counting_sentence_transformers
+    config = types.SimpleNamespace(embedding_backend="sentence-transformers", embedding_model="mini",
+                                   embedding_cache_enabled=True, embedding_cache_max_entries=0)
+
+    services = []
+    threads = [threading.Thread(target=lambda: services.append(get_embedding_service(config))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == ["mini"]
+    services[0].embed("shared text")
+    services[1].embed("shared text")
+    assert len(encodes) == 1
+    assert services[0].cache_stats()["misses"] == 1
+    assert services[1].cache_stats() == {"memory_hits": 1, "persistent_hits": 0, "misses": 0}
+
+    other = types.SimpleNamespace(embedding_backend="sentence-transformers", embedding_model="other",
+                                  embedding_cache_enabled=True, embedding_cache_max_entries=0)
+    get_embedding_service(other)
+    assert loads == ["mini", "other"]
+
+
+def test_warm_up_loads_backends_in_the_background(counting_sentence_transformers):
+    loads, encodes = counting_sentence_transformers
+    configs = [
+        types.SimpleNamespace(embedding_backend="sentence-transformers", embedding_model="mini"),
+        types.SimpleNamespace(embedding_backend=None, embedding_model=None),
+    ]
+
+    thread = warm_up(configs, background=True)
+    thread.join(5)
+
+    assert loads == ["mini"]
+    assert encodes == [["warm-up"]]
+    assert get_embedding_backend("sentence-transformers", "mini").model_name == "mini"
+    assert loads == ["mini"]
+    assert warm_up([configs[1]]) is None
@@ -1,14 +1,20 @@
 import pathlib
+import sqlite3
 
 import numpy as np
 import pytest
+import sqlite_utils
 
 from llm_consortium.db import (
     DatabaseConnection,
+    flush_writes,
+    get_embedding_matrix_for_run,
     get_embeddings_for_run,
     save_cluster_metadata,
     save_response_embedding,
 )
+from llm_consortium.migrations import migrate
+from llm_consortium.vectors import unpack_vector
 
 
 @pytest.fixture(autouse=True)
@@ -29,6 +35,7 @@ def test_save_response_embedding_creates_table_and_round_trips_vector():
         model="model-a",
         embedding_model="qwen3-embedding-8b",
     )
+    flush_writes()
 
     db = DatabaseConnection.get_connection()
     row = db["response_embeddings"].get("resp-1")
@@ -87,7 +94,46 @@ def test_embedding_and_decision_writes_are_migration_safe():
         model="legacy-model",
         embedding_model="qwen3-embedding-8b",
     )
+    flush_writes()
 
     columns = {column.name for column in db["response_embeddings"].columns}
     assert "embedding_model" in columns
-    assert "created_at" in columns
\ No newline at end of file
+    assert "created_at" in columns
+
+def test_embeddings_are_stored_as_float32_blobs_and_read_stacked():
+    for index in range(3):
+        save_response_embedding(f"resp-{index}", "run-3", np.arange(4) + index, "model-a")
+    flush_writes()
+
+    db = DatabaseConnection.get_connection()
+    row = db["response_embeddings"].get("resp-0")
+    assert row["embedding_dim"] == 4
+    assert row["embedding_dtype"] == "<f4"
+    assert len(row["embedding"]) == 16
+
+    matrix = get_embeddings_for_run("run-3")
+    assert matrix.shape == (3, 4) and matrix.dtype == np.float32
+    assert np.allclose(matrix[2], [2, 3, 4, 5])
+
+    records, stacked = get_embedding_matrix_for_run("run-3")
+    assert [record["response_id"] for record in records] == ["resp-0", "resp-1", "resp-2"]
+    assert np.array_equal(stacked, matrix)
+
+
+def test_binary_vector_migration_converts_json_rows(tmp_path):
+    db = sqlite_utils.Database(sqlite3.connect(tmp_path / "legacy.db"))
+    migrate(db, until="m004_indexes")
+    db["response_embeddings"].insert({"response_id": "r1", "run_id": "run", "embedding_json": "[0.5, 1.5, 2.5]"})
+    db["consensus_clusters"].insert({"run_id": "run", "iteration": 1, "cluster_id": 0, "centroid_json": "[1.0, 2.0]"})
+    db["arbiter_decisions"].insert({"run_id": "run", "iteration": 1, "centroid_vector": None})
+    db.conn.commit()
+
+    assert migrate(db, until="m005_binary_vectors") == ["m005_binary_vectors"]
+
+    embedding = db["response_embeddings"].get("r1")
+    assert embedding["embedding_json"] is None
+    assert embedding["embedding_dim"] == 3
+    assert np.array_equal(unpack_vector(embedding["embedding"]), np.array([0.5, 1.5, 2.5], dtype=np.float32))
+    cluster = next(db["consensus_clusters"].rows)
+    assert np.array_equal(unpack_vector(cluster["centroid"]), np.array([1.0, 2.0], dtype=np.float32))
+    assert next(db["arbiter_decisions"].rows)["centroid"] is None
@@ -0,0 +1,148 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumModel, ConsortiumOrchestrator
+from llm_consortium.executor import ConsortiumExecutor, in_worker_thread
+
+
+class ConcurrencyProbe:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+        self.threads = set()
+
+    def call(self, value, delay=0.02):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+            self.threads.add(threading.get_ident())
+        time.sleep(delay)
+        with self.lock:
+            self.current -= 1
+        return value
+
+
+def _wait_all(batch, futures):
+    pending = set(futures)
+    while pending:
+        _, pending = batch.wait(pending)
+    return [future.result() for future in futures]
+
+
+def test_global_cap_is_shared_across_batches():
+    executor = ConsortiumExecutor(max_workers=2)
+    probe = ConcurrencyProbe()
+    batches = [executor.batch(), executor.batch()]
+    futures = [(batch, batch.submit(probe.call, i)) for batch in batches for i in range(5)]
+
+    for batch, future in futures:
+        _wait_all(batch, [future])
+
+    assert probe.peak <= 2
+    assert len(probe.threads) <= 2
+    assert sorted(future.result() for _, future in futures) == sorted(list(range(5)) * 2)
+
+
+def test_per_batch_cap_limits_one_run():
+    executor = ConsortiumExecutor(max_workers=8)
+    probe = ConcurrencyProbe()
+    batch = executor.batch(max_concurrency=1)
+
+    results = _wait_all(batch, [batch.submit(probe.call, i) for i in range(4)])
+
+    assert results == [0, 1, 2, 3]
+    assert probe.peak == 1
+
+
+def test_nested_batches_run_inline_instead_of_deadlocking():
+    executor = ConsortiumExecutor(max_workers=1)
+
+    def nested_run():
+        assert in_worker_thread()
+        inner = executor.batch()
+        return sum(_wait_all(inner, [inner.submit(lambda i=i: i) for i in range(3)]))
+
+    outer = executor.batch()
+    results = _wait_all(outer, [outer.submit(nested_run) for _ in range(2)])
+
+    assert results == [3, 3]
+    assert executor.in_flight == 0
+
+
+def test_cancelled_queued_calls_never_run():
+    executor = ConsortiumExecutor(max_workers=1)
+    batch = executor.batch()
+    gate = threading.Event()
+    calls = []
+
+    first = batch.submit(gate.wait, 5)
+    second = batch.submit(calls.append, "ran")
+    assert second.cancel()
+    gate.set()
+
+    _wait_all(batch, [first])
+    time.sleep(0.05)
+    assert calls == []
+
+
+def test_nested_wait_stops_running_queued_calls_at_the_timeout():
+    executor = ConsortiumExecutor(max_workers=1)
+    calls = []
+
+    def nested_run():
+        inner = executor.batch()
+        futures = [inner.submit(lambda i=i: calls.append(i) or time.sleep(0.05)) for i in range(5)]
+        done, pending = inner.wait(futures[1:], timeout=0.01)
+        for future in pending:
+            future.cancel()
+        return len(done), len(pending)
+
+    outer = executor.batch()
+    assert _wait_all(outer, [outer.submit(nested_run)]) == [(0, 4)]
+    assert calls == [0]
+
+
+def test_shared_cap_limits_every_batch_that_holds_it():
+    executor = ConsortiumExecutor(max_workers=8)
+    probe = ConcurrencyProbe()
+    cap = executor.shared_cap("consortium", 2)
+    assert executor.shared_cap("consortium", 2) is cap
+    batches = [executor.batch(shared_cap=cap), executor.batch(shared_cap=cap), executor.batch()]
+    futures = [(batch, batch.submit(probe.call, i)) for batch in batches[:2] for i in range(4)]
+
+    for batch, future in futures:
+        _wait_all(batch, [future])
+
+    assert probe.peak == 2
+    assert executor.max_workers == 8
+    assert cap.running == 0
+
+
+@patch("llm_consortium.orchestrator.update_consortium_run")
+@patch("llm_consortium.orchestrator.save_consortium_run")
+@patch("llm_consortium.orchestrator.log_response")
+@patch("llm_consortium.orchestrator.save_consortium_member")
+@patch("llm_consortium.orchestrator.save_arbiter_decision")
+@patch("llm_consortium.orchestrator.llm.get_model")
+def test_nested_consortium_model_runs_under_a_cap_of_one(mock_get_model, *_):
+    executor = ConsortiumExecutor(max_workers=1)
+    inner = ConsortiumModel("inner", ConsortiumConfig(models={"leaf": 2}, arbiter="arbiter", manual_context=True))
+    leaf = MagicMock()
+    leaf.prompt.return_value.text.return_value = "Leaf answer"
+    arbiter = MagicMock()
+    arbiter.prompt.return_value.text.return_value = "<synthesis>Merged</synthesis><confidence>0.95</confidence>"
+    mock_get_model.side_effect = lambda model_id: {"inner": inner, "leaf": leaf}.get(model_id, arbiter)
+    outer = ConsortiumOrchestrator(ConsortiumConfig(models={"inner": 2}, arbiter="arbiter", manual_context=True))
+    outcome = {}
+
+    with patch("llm_consortium.executor._shared_executor", executor):
+        runner = threading.Thread(target=lambda: outcome.update(result=outer.orchestrate("prompt")), daemon=True)
+        runner.start()
+        runner.join(10)
+
+    assert not runner.is_alive(), "nested consortium deadlocked the shared pool"
+    assert outcome["result"]["synthesis"]["synthesis"] == "Merged"
+    assert leaf.prompt.call_count == 4
+    assert executor.in_flight == 0
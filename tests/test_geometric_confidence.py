@@ -1,6 +1,6 @@
 import numpy as np
 
-from llm_consortium.geometry import GeometricConfidenceCalculator
+from llm_consortium.geometry import GeometricConfidenceCalculator, GeometryContext, _cosine_distance
 
 
 def test_compute_confidence_uses_inverse_average_cosine_distance():
@@ -38,4 +38,35 @@ def test_compute_returns_confidence_and_centroid():
 
     assert isinstance(confidence, float)
     assert isinstance(centroid, np.ndarray)
-    assert centroid.shape == (2,)
\ No newline at end of file
+    assert centroid.shape == (2,)
+
+
+def test_geometry_context_matches_per_vector_cosine_distances():
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((12, 16)) + 2.0
+    vectors[4] = 0.0
+    context = GeometryContext(vectors)
+    cluster = [0, 2, 5, 7]
+
+    centroid = vectors[cluster].mean(axis=0)
+    expected = [_cosine_distance(vectors[i], centroid) for i in cluster]
+
+    assert np.allclose(context.centroid_distances(cluster, cluster), expected, atol=1e-6)
+    assert np.allclose(context.centroid(cluster), centroid, atol=1e-6)
+    assert context.centroid_distances()[4] == 1.0
+    distances = context.cosine_distances()
+    assert distances.shape == (12, 12)
+    assert np.allclose(np.diag(distances), 0.0)
+    assert np.allclose(distances[0, 1], 1.0 - vectors[0] @ vectors[1] / np.linalg.norm(vectors[0]) / np.linalg.norm(vectors[1]), atol=1e-6)
+
+
+def test_geometry_context_selects_responses_without_recomputing():
+    responses = [{"embedding": np.array(vector)} for vector in ([1.0, 0.0], [0.9, 0.1], [-1.0, 0.0])]
+    context = GeometryContext.for_responses(responses)
+
+    sub = context.select([responses[2], responses[0]])
+
+    assert np.allclose(sub.similarity, [[1.0, -1.0], [-1.0, 1.0]])
+    assert context.select([{"embedding": np.array([1.0, 0.0])}]) is None
+    confidence, centroid = GeometricConfidenceCalculator.compute(context.select(responses[:2]))
+    assert confidence == GeometricConfidenceCalculator.compute([r["embedding"] for r in responses[:2]])[0]
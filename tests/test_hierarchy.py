@@ -0,0 +1,32 @@
+import numpy as np
+
+from llm_consortium.geometry import GeometryContext
+from llm_consortium.hierarchy import expand_ranking, partition_by_embedding, partition_round_robin
+
+
+def test_round_robin_groups_are_balanced_and_within_fan_in():
+    assert partition_round_robin(7, 3) == [[0, 3, 6], [1, 4], [2, 5]]
+    assert partition_round_robin(4, 4) == [[0, 1, 2, 3]]
+    for n in range(1, 40):
+        groups = partition_round_robin(n, 5)
+        assert sorted(i for group in groups for i in group) == list(range(n))
+        assert max(map(len, groups)) - min(map(len, groups)) <= 1
+        assert max(map(len, groups)) <= 5
+
+
+def test_embedding_partition_keeps_nearby_responses_together():
+    angles = [0.0, 3.0, 0.1, 3.1, 0.2, 3.2]
+    context = GeometryContext([np.array([np.cos(a), np.sin(a)]) for a in angles])
+
+    assert partition_by_embedding(context, 3) == [[0, 2, 4], [1, 3, 5]]
+    assert [len(group) for group in partition_by_embedding(context, 4)] == [3, 3]
+
+
+def test_expand_ranking_maps_sub_syntheses_back_to_members():
+    inputs = [
+        {"id": 0, "member_ranking": [4, 1]},
+        {"id": 1, "member_ranking": [2, 3]},
+        {"id": 2, "member_ranking": [0]},
+    ]
+    assert expand_ranking([1, 0], inputs) == [2, 3, 4, 1, 0]
+    assert expand_ranking([], [{"id": 5}, {"id": 6}]) == [5, 6]
@@ -1,5 +1,9 @@
+import asyncio
+import re
+import threading
+import time
 import unittest
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import patch, MagicMock, AsyncMock, call
 import uuid
 import numpy as np
 from llm_consortium import (
@@ -173,6 +177,559 @@ class TestConsortiumOrchestrator(unittest.TestCase):
         self.assertEqual(result["original_prompt"], current_prompt)
 
 
+class TestAsyncOrchestration(unittest.TestCase):
+    def setUp(self):
+        self.orchestrator = ConsortiumOrchestrator(config=TEST_CONFIG)
+
+    @staticmethod
+    def _async_model(text):
+        model = MagicMock()
+        response = MagicMock()
+        response.text = AsyncMock(return_value=text)
+        model.prompt.return_value = response
+        return model
+
+    @patch('llm_consortium.orchestrator.update_consortium_run')
+    @patch('llm_consortium.orchestrator.save_consortium_run')
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    @patch('llm_consortium.orchestrator.llm.get_async_model')
+    def test_orchestrate_async_awaits_members_and_arbiter(self, mock_get_async_model, mock_get_model, *_):
+        arbiter = self._async_model(
+            "<synthesis>Async synthesis</synthesis><confidence>0.9</confidence><needs_iteration>false</needs_iteration>"
+        )
+        members = {
+            "model1": self._async_model("Member one <confidence>0.8</confidence>"),
+            "model2": self._async_model("Member two"),
+            "arbiter_model": arbiter,
+        }
+        mock_get_async_model.side_effect = lambda model_id: members[model_id]
+
+        result = asyncio.run(self.orchestrator.orchestrate_async("Test prompt"))
+
+        self.assertEqual(result["synthesis"]["synthesis"], "Async synthesis")
+        self.assertEqual(result["metadata"]["total_iterations"], 1)
+        responses = result["iterations"][0]["model_responses"]
+        self.assertEqual({r["model"] for r in responses}, {"model1", "model2"})
+        arbiter.prompt.return_value.text.assert_awaited_once()
+        mock_get_model.assert_not_called()
+
+    @patch('llm_consortium.orchestrator.update_consortium_run')
+    @patch('llm_consortium.orchestrator.save_consortium_run')
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    @patch('llm_consortium.orchestrator.llm.get_async_model')
+    def test_orchestrate_async_falls_back_to_sync_models(self, mock_get_async_model, mock_get_model, *_):
+        import llm
+        mock_get_async_model.side_effect = llm.UnknownModelError("Unknown async model (sync model exists)")
+        sync_model = MagicMock()
+        sync_response = MagicMock()
+        sync_response.text.return_value = "<synthesis>Sync synthesis</synthesis><confidence>0.95</confidence>"
+        sync_model.prompt.return_value = sync_response
+        mock_get_model.return_value = sync_model
+
+        result = asyncio.run(self.orchestrator.orchestrate_async("Test prompt"))
+
+        self.assertEqual(result["synthesis"]["synthesis"], "Sync synthesis")
+        self.assertEqual(sync_model.prompt.call_count, 3)
+
+
+class TestQuorumMode(unittest.TestCase):
+    def _orchestrator(self, **overrides):
+        config = TEST_CONFIG.model_copy(update={"models": {"fast": 2, "slow": 1}, **overrides})
+        return ConsortiumOrchestrator(config=config)
+
+    def test_quorum_size_accepts_counts_and_fractions(self):
+        self.assertIsNone(self._orchestrator()._quorum_size(5))
+        self.assertEqual(self._orchestrator(min_quorum=2)._quorum_size(5), 2)
+        self.assertEqual(self._orchestrator(min_quorum=0.5)._quorum_size(5), 3)
+        self.assertEqual(self._orchestrator(min_quorum=10)._quorum_size(5), 5)
+        self.assertEqual(self._orchestrator(member_deadline_s=1.0)._quorum_size(5), 1)
+
+    def test_uncancellable_stragglers_are_labelled_by_whether_a_deadline_was_set(self):
+        without_deadline = self._orchestrator(min_quorum=1)._late_member_entry("slow", 0, cancelled=False)
+        with_deadline = self._orchestrator(min_quorum=1, member_deadline_s=0.1)._late_member_entry("slow", 0, cancelled=False)
+
+        self.assertEqual(without_deadline["error"], "Still running when quorum was reached")
+        self.assertEqual(with_deadline["error"], "Missed the member deadline")
+
+    @patch('llm_consortium.orchestrator.update_consortium_run')
+    @patch('llm_consortium.orchestrator.save_consortium_run')
+    @patch('llm_consortium.orchestrator.mark_consortium_member_late')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_voting_ignores_the_placeholders_of_stragglers(self, mock_get_model, *_):
+        release = threading.Event()
+
+        def make_model(model_id):
+            model = MagicMock()
+            if model_id == "slow":
+                model.prompt.return_value.text.side_effect = lambda: release.wait(5) and "ANSWER: 7"
+            elif model_id == "fast":
+                model.prompt.return_value.text.return_value = "ANSWER: 42"
+            else:
+                model.prompt.return_value.text.return_value = "<synthesis>42</synthesis><confidence>0.95</confidence>"
+            return model
+
+        mock_get_model.side_effect = make_model
+        orchestrator = self._orchestrator(
+            models={"fast": 2, "slow": 3}, min_quorum=2, max_iterations=1,
+            strategy="voting", strategy_params={"answer_extractor": "number"},
+        )
+        try:
+            result = orchestrator.orchestrate("prompt")
+        finally:
+            release.set()
+
+        self.assertNotEqual(orchestrator.config.status, "model_failure")
+        self.assertEqual(result["synthesis"]["synthesis"], "42")
+        model_responses = orchestrator.iteration_history[0]["model_responses"]
+        self.assertEqual([r["model"] for r in model_responses if r.get("error") is None], ["fast", "fast"])
+        self.assertEqual(sum(1 for r in model_responses if r.get("late")), 3)
+
+    def test_invalid_quorum_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ConsortiumConfig(models={"m": 1}, min_quorum=0)
+
+    @patch('llm_consortium.orchestrator.mark_consortium_member_late')
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_stragglers_are_recorded_as_late(self, mock_get_model, mock_save_member, mock_log, mock_mark_late):
+        release = threading.Event()
+
+        def make_model(model_id):
+            model = MagicMock()
+            response = MagicMock()
+            response.id = f"{model_id}-response"
+            if model_id == "slow":
+                response.text.side_effect = lambda: release.wait(5) and "slow answer"
+            else:
+                response.text.return_value = "fast answer"
+            model.prompt.return_value = response
+            return model
+
+        mock_get_model.side_effect = make_model
+        orchestrator = self._orchestrator(min_quorum=2, member_deadline_s=0.05)
+        orchestrator.consortium_id = "run-quorum"
+
+        started = time.monotonic()
+        responses = orchestrator._get_model_responses_manual("prompt", {"fast": 2, "slow": 1}, 1)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 2.0)
+        self.assertEqual(sum(1 for r in responses if r.get("error") is None), 2)
+        late = [r for r in responses if r.get("late")]
+        self.assertEqual([(r["model"], r["instance"]) for r in late], [("slow", 0)])
+        self.assertEqual(late[0]["error"], "Missed the member deadline")
+
+        release.set()
+        deadline = time.monotonic() + 5
+        while not mock_mark_late.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        mock_mark_late.assert_called_once_with("run-quorum", "slow-response")
+
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    def test_async_runs_skip_sync_members_still_running_in_a_thread(self, *_):
+        release = threading.Event()
+
+        def conversation(text):
+            conv = MagicMock()
+            conv.prompt.return_value.text.side_effect = text
+            return conv
+
+        slow = conversation(lambda: release.wait(5) and "slow answer")
+        tasks = [
+            {"model_id": "fast", "instance": 0, "conversation": conversation(lambda: "fast answer"), "is_async": False},
+            {"model_id": "slow", "instance": 0, "conversation": slow, "is_async": False},
+        ]
+        orchestrator = self._orchestrator(min_quorum=1, member_deadline_s=0.05)
+
+        async def two_iterations():
+            first = await orchestrator._get_model_responses_automatic_async("prompt", tasks, {"fast": 1, "slow": 1}, 1)
+            second = await orchestrator._get_model_responses_automatic_async("prompt", tasks, {"fast": 1, "slow": 1}, 2)
+            release.set()
+            return first, second
+
+        first, second = asyncio.run(two_iterations())
+
+        self.assertEqual([r["model"] for r in first if r.get("late")], ["slow"])
+        self.assertEqual([r["model"] for r in second], ["fast"])
+        self.assertEqual(slow.prompt.call_count, 1)
+
+
+class TestEarlyMajorityStop(unittest.TestCase):
+    def _orchestrator(self):
+        config = TEST_CONFIG.model_copy(update={
+            "models": {"fast": 3, "slow": 2},
+            "strategy": "voting",
+            "strategy_params": {"answer_extractor": "number", "require_majority": True, "early_stop": True},
+        })
+        return ConsortiumOrchestrator(config=config)
+
+    @patch('llm_consortium.orchestrator.mark_consortium_member_late')
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_running_members_are_abandoned_once_the_vote_is_decided(self, mock_get_model, mock_save_member, mock_log, mock_mark_late):
+        release = threading.Event()
+        both_slow_running = threading.Event()
+        slow_started = []
+
+        def slow_text():
+            slow_started.append(True)
+            if len(slow_started) == 2:
+                both_slow_running.set()
+            return release.wait(5) and "ANSWER: 7"
+
+        def fast_text():
+            both_slow_running.wait(5)
+            return "ANSWER: 42"
+
+        def make_model(model_id):
+            model = MagicMock()
+            response = MagicMock()
+            response.id = f"{model_id}-response"
+            if model_id == "slow":
+                response.text.side_effect = slow_text
+            else:
+                response.text.side_effect = fast_text
+            model.prompt.return_value = response
+            return model
+
+        mock_get_model.side_effect = make_model
+        orchestrator = self._orchestrator()
+        orchestrator.consortium_id = "run-early-stop"
+        orchestrator._member_latency["slow"] = 30.0
+
+        started = time.monotonic()
+        responses = orchestrator._get_model_responses_manual("prompt", {"fast": 3, "slow": 2}, 1)
+        elapsed = time.monotonic() - started
+        release.set()
+
+        self.assertLess(elapsed, 2.0)
+        self.assertEqual(sum(1 for r in responses if r.get("error") is None), 3)
+        stopped = [r for r in responses if r.get("late")]
+        self.assertEqual({r["error"] for r in stopped}, {"Abandoned after the vote was decided"})
+        self.assertEqual(len(stopped), 2)
+
+        orchestrator.iteration_history = []
+        metadata = orchestrator._build_final_result("prompt", "run-early-stop")["metadata"]["early_stop"]
+        self.assertEqual(metadata["cancelled_calls"], 0)
+        self.assertEqual(metadata["abandoned_calls"], 2)
+        self.assertEqual(metadata["time_saved_s"], 0.0)
+        self.assertEqual(metadata["iterations"][0]["iteration"], 1)
+
+        # Let the released stragglers finish while the DB helpers are still patched
+        deadline = time.monotonic() + 5
+        while mock_mark_late.call_count < len(slow_started) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_only_cancelled_calls_count_towards_time_saved(self):
+        orchestrator = self._orchestrator()
+        orchestrator._member_latency.update({"slow": 30.0, "stuck": 60.0})
+
+        orchestrator._record_early_stop(1, ["slow"], ["stuck"], time.monotonic())
+
+        stop = orchestrator._early_stops[0]
+        self.assertEqual((stop["cancelled_calls"], stop["abandoned_calls"]), (1, 1))
+        self.assertGreater(stop["time_saved_s"], 25.0)
+        self.assertLess(stop["time_saved_s"], 31.0)
+        self.assertEqual(orchestrator._late_member_entry("slow", 0, cancelled=True, decided=True)["error"],
+                         "Cancelled after the vote was decided")
+
+
+class TestArbiterSkip(unittest.TestCase):
+    @staticmethod
+    def _models(texts):
+        def make_model(model_id):
+            model = MagicMock()
+            response = MagicMock()
+            response.text.return_value = texts[model_id]
+            model.prompt.return_value = response
+            return model
+        return make_model
+
+    @patch('llm_consortium.orchestrator.update_consortium_run')
+    @patch('llm_consortium.orchestrator.save_consortium_run')
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_agreeing_members_skip_the_arbiter(self, mock_get_model, mock_save_decision, *_):
+        mock_get_model.side_effect = self._models({"model1": "The answer is 42.", "model2": "the answer is 42"})
+        config = TEST_CONFIG.model_copy(update={"arbiter_skip": "exact", "minimum_iterations": 1})
+        orchestrator = ConsortiumOrchestrator(config=config)
+
+        result = orchestrator.orchestrate("Test prompt")
+
+        self.assertNotIn("arbiter_model", [c.args[0] for c in mock_get_model.call_args_list])
+        mock_save_decision.assert_not_called()
+        synthesis = result["synthesis"]
+        self.assertTrue(synthesis["arbiter_skipped"])
+        self.assertIn(synthesis["synthesis"], ("The answer is 42.", "the answer is 42"))
+        self.assertEqual(synthesis["agreement"], {"method": "exact", "score": 1.0})
+        self.assertEqual(result["metadata"]["total_iterations"], 1)
+        self.assertEqual(result["metadata"]["arbiter_skipped_iterations"], [1])
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_disagreeing_members_still_reach_the_arbiter(self, mock_get_model, *_):
+        mock_get_model.side_effect = self._models({
+            "arbiter_model": "<synthesis>Arbitrated</synthesis><confidence>0.9</confidence>",
+        })
+        config = TEST_CONFIG.model_copy(update={"arbiter_skip": "similarity", "arbiter_skip_threshold": 0.9})
+        orchestrator = ConsortiumOrchestrator(config=config)
+        responses = [
+            {"model": "model1", "response": "Paris is the capital of France", "id": 0},
+            {"model": "model2", "response": "Lyon is the largest city in France", "id": 1},
+        ]
+
+        result = orchestrator._synthesize_responses_manual("prompt", responses, [], 1)
+
+        self.assertEqual(result["synthesis"], "Arbitrated")
+        self.assertNotIn("arbiter_skipped", result)
+
+    @patch('llm_consortium.orchestrator.llm.get_async_model')
+    def test_async_synthesis_skips_the_arbiter_for_geometric_agreement(self, mock_get_async_model):
+        config = TEST_CONFIG.model_copy(update={"arbiter_skip": "geometric", "arbiter_skip_threshold": 0.95})
+        orchestrator = ConsortiumOrchestrator(config=config)
+        responses = [
+            {"model": "model1", "response": "A", "id": 0, "embedding": np.array([1.0, 0.05])},
+            {"model": "model2", "response": "B", "id": 1, "embedding": np.array([1.0, 0.0])},
+            {"model": "model2", "response": "C", "id": 2, "embedding": np.array([1.0, -0.05])},
+        ]
+
+        result = asyncio.run(orchestrator._synthesize_responses_async("prompt", responses, [], 1))
+
+        mock_get_async_model.assert_not_called()
+        self.assertEqual(result["synthesis"], "B")
+        self.assertEqual(result["ranking"], [1, 0, 2])
+        self.assertGreater(result["geometric_confidence"], 0.95)
+
+    def test_invalid_arbiter_skip_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ConsortiumConfig(models={"m": 1}, arbiter_skip="always")
+        with self.assertRaises(ValueError):
+            ConsortiumConfig(models={"m": 1}, arbiter_skip="exact", arbiter_skip_threshold=1.5)
+
+
+class TestArbiterEscalation(unittest.TestCase):
+    RESPONSES = [
+        {"model": "model1", "response": "Answer one", "id": 0},
+        {"model": "model2", "response": "Answer two", "id": 1},
+    ]
+
+    @staticmethod
+    def _arbiters(texts):
+        arbiters = {}
+
+        def make_model(model_id):
+            model = MagicMock()
+            response = MagicMock()
+            response.id = f"{model_id}-response"
+            response.text.return_value = texts[model_id]
+            model.prompt.return_value = response
+            arbiters[model_id] = model
+            return model
+        return make_model, arbiters
+
+    def _orchestrator(self, **overrides):
+        config = TEST_CONFIG.model_copy(update={"arbiter": "cheap", "arbiter_escalation": ["strong"], **overrides})
+        orchestrator = ConsortiumOrchestrator(config=config)
+        orchestrator.consortium_id = "run-cascade"
+        return orchestrator
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_low_confidence_escalates_to_the_next_arbiter(self, mock_get_model, mock_save_decision, *_):
+        mock_get_model.side_effect, arbiters = self._arbiters({
+            "cheap": "<synthesis>Unsure</synthesis><confidence>0.4</confidence>",
+            "strong": "<synthesis>Sure</synthesis><confidence>0.95</confidence>",
+        })
+
+        result = self._orchestrator()._synthesize_responses_manual("prompt", self.RESPONSES, [], 1)
+
+        self.assertEqual(result["synthesis"], "Sure")
+        self.assertEqual(result["arbiter"], "strong")
+        self.assertEqual(result["escalations"], [{"arbiter": "cheap", "reason": "low_confidence", "confidence": 0.4}])
+        self.assertEqual(arbiters["strong"].prompt.call_args.args, arbiters["cheap"].prompt.call_args.args)
+        decisions = [c.kwargs for c in mock_save_decision.call_args_list]
+        self.assertEqual([(d["arbiter_model"], d["attempt"], d["escalation_reason"]) for d in decisions],
+                         [("cheap", 0, "low_confidence"), ("strong", 1, None)])
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_confident_first_arbiter_is_not_escalated(self, mock_get_model, mock_save_decision, *_):
+        mock_get_model.side_effect, arbiters = self._arbiters({
+            "cheap": "<synthesis>Easy</synthesis><confidence>0.6</confidence>",
+        })
+
+        result = self._orchestrator(arbiter_escalation_threshold=0.5)._synthesize_responses_manual("prompt", self.RESPONSES, [], 1)
+
+        self.assertEqual(result["synthesis"], "Easy")
+        self.assertEqual(result["escalations"], [])
+        self.assertEqual(list(arbiters), ["cheap"])
+        self.assertEqual(mock_save_decision.call_count, 1)
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_async_model')
+    def test_parse_failure_escalates_in_async_runs(self, mock_get_async_model, mock_save_decision, *_):
+        texts = {
+            "cheap": "no ranking here",
+            "strong": '<ranking><rank position="1">1</rank><rank position="2">0</rank></ranking>',
+        }
+
+        def make_model(model_id):
+            model = MagicMock()
+            response = MagicMock()
+            response.text = AsyncMock(return_value=texts[model_id])
+            model.prompt.return_value = response
+            return model
+        mock_get_async_model.side_effect = make_model
+
+        orchestrator = self._orchestrator(judging_method="rank")
+        result = asyncio.run(orchestrator._synthesize_responses_async("prompt", self.RESPONSES, [], 1))
+
+        self.assertEqual(result["synthesis"], "Answer two")
+        self.assertEqual(result["escalations"][0]["reason"], "parse_failed")
+        decisions = [c.kwargs for c in mock_save_decision.call_args_list]
+        self.assertEqual([(d["arbiter_model"], d["attempt"], d["escalation_reason"]) for d in decisions],
+                         [("cheap", 0, "parse_failed"), ("strong", 1, None)])
+
+    def test_escalation_needs_an_arbiter(self):
+        with self.assertRaises(ValueError):
+            ConsortiumConfig(models={"m": 1}, arbiter_escalation=["strong"])
+
+
+class TestHierarchicalSynthesis(unittest.TestCase):
+    RESPONSES = [{"model": f"m{i}", "response": f"Answer {i}", "id": i, "response_id": f"r{i}"} for i in range(7)]
+
+    @staticmethod
+    def _arbiter_text(arbiter_prompt):
+        # Sub-arbiters rank their group's last response first; the final arbiter picks sub-synthesis 2
+        if "sub-synthesis" in arbiter_prompt:
+            return '<synthesis>Merged</synthesis><confidence>0.9</confidence><ranking><rank position="1">2</rank></ranking>'
+        ids = [int(i) for i in re.findall(r"RESPONSE (\d+)", arbiter_prompt)]
+        return f'<synthesis>Group {ids}</synthesis><confidence>0.8</confidence><ranking><rank position="1">{ids[-1]}</rank></ranking>'
+
+    def _orchestrator(self, **overrides):
+        config = TEST_CONFIG.model_copy(update={"hierarchical_fan_in": 3, **overrides})
+        return ConsortiumOrchestrator(config=config)
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_sub_arbiters_feed_a_final_merge(self, mock_get_model, *_):
+        prompts = []
+
+        def prompt(arbiter_prompt, stream=False):
+            prompts.append(arbiter_prompt)
+            response = MagicMock()
+            response.text.return_value = self._arbiter_text(arbiter_prompt)
+            return response
+        mock_get_model.return_value.prompt.side_effect = prompt
+
+        result = self._orchestrator()._synthesize_responses_manual("prompt", self.RESPONSES, [], 1)
+
+        self.assertEqual(len(prompts), 4)
+        self.assertTrue(all("sub-synthesis" not in p for p in prompts[:3]))
+        self.assertEqual(sorted(len(re.findall(r"RESPONSE \d+", p)) for p in prompts[:3]), [2, 2, 3])
+        self.assertEqual(len(re.findall(r"RESPONSE \d+", prompts[3])), 3)
+        self.assertEqual(result["synthesis"], "Merged")
+        # Round-robin groups [0, 3, 6], [1, 4], [2, 5]; each sub-arbiter ranked its last response first
+        self.assertEqual(result["ranking"], [5, 2, 6, 0, 3, 4, 1])
+        self.assertEqual(result["chosen_response_id"], "r5")
+        self.assertEqual(result["hierarchy"], {"fan_in": 3, "partition": "round_robin", "sub_syntheses": [3]})
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_async_model')
+    def test_depth_limits_the_levels_in_async_runs(self, mock_get_async_model, mock_save_decision, mock_save_member, _):
+        prompts = []
+
+        def prompt(arbiter_prompt, stream=False):
+            prompts.append(arbiter_prompt)
+            response = MagicMock()
+            response.text = AsyncMock(return_value=self._arbiter_text(arbiter_prompt))
+            return response
+        mock_get_async_model.return_value.prompt.side_effect = prompt
+        orchestrator = self._orchestrator(hierarchical_fan_in=2, hierarchical_max_depth=1)
+        orchestrator.consortium_id = "run-tree"
+
+        result = asyncio.run(orchestrator._synthesize_responses_async("prompt", self.RESPONSES, [], 1))
+
+        # One level of four sub-syntheses, then a final merge of all four despite fan-in 2
+        self.assertEqual(len(prompts), 5)
+        self.assertEqual(result["hierarchy"]["sub_syntheses"], [4])
+        self.assertEqual(mock_save_decision.call_count, 1)
+        roles = [c.args[2] for c in mock_save_member.call_args_list]
+        self.assertEqual(roles.count("sub_arbiter"), 4)
+        self.assertEqual(roles.count("arbiter"), 1)
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_async_model')
+    def test_async_sub_arbiters_respect_max_concurrency(self, mock_get_async_model, *_):
+        in_flight = []
+        peak = []
+
+        def prompt(arbiter_prompt, stream=False):
+            async def text():
+                in_flight.append(arbiter_prompt)
+                peak.append(len(in_flight))
+                await asyncio.sleep(0.01)
+                in_flight.remove(arbiter_prompt)
+                return self._arbiter_text(arbiter_prompt)
+            response = MagicMock()
+            response.text = text
+            return response
+        mock_get_async_model.return_value.prompt.side_effect = prompt
+        orchestrator = self._orchestrator(hierarchical_fan_in=2, hierarchical_max_depth=1, max_concurrency=2)
+
+        result = asyncio.run(orchestrator._synthesize_responses_async("prompt", self.RESPONSES, [], 1))
+
+        self.assertEqual(result["hierarchy"]["sub_syntheses"], [4])
+        self.assertEqual(max(peak), 2)
+
+    @patch('llm_consortium.orchestrator.log_response')
+    @patch('llm_consortium.orchestrator.save_consortium_member')
+    @patch('llm_consortium.orchestrator.save_arbiter_decision')
+    @patch('llm_consortium.orchestrator.llm.get_model')
+    def test_small_fan_outs_use_a_single_arbiter(self, mock_get_model, *_):
+        mock_get_model.return_value.prompt.return_value.text.return_value = "<synthesis>Direct</synthesis><confidence>0.9</confidence>"
+
+        result = self._orchestrator()._synthesize_responses_manual("prompt", self.RESPONSES[:3], [], 1)
+
+        self.assertEqual(mock_get_model.return_value.prompt.call_count, 1)
+        self.assertNotIn("hierarchy", result)
+
+    def test_invalid_hierarchy_settings_are_rejected(self):
+        with self.assertRaises(ValueError):
+            ConsortiumConfig(models={"m": 1}, hierarchical_fan_in=1)
+        with self.assertRaises(ValueError):
+            ConsortiumConfig(models={"m": 1}, hierarchical_partition="kmeans")
+
+
 class TestDatabaseConnection(unittest.TestCase):
     @patch('llm_consortium.db.sqlite_utils.Database')
     def test_get_connection(self, mock_database):
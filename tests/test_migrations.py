@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+import sqlite_utils
+
+from llm_consortium.db import DatabaseConnection, logs_db_path
+from llm_consortium.migrations import MIGRATIONS, applied_migrations, migrate
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path):
+    monkeypatch.setattr("llm_consortium.db.user_dir", lambda: tmp_path)
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+    yield
+    if hasattr(DatabaseConnection._thread_local, "db"):
+        delattr(DatabaseConnection._thread_local, "db")
+
+
+def _indexes(db, table):
+    return {row[1] for row in db.execute(f"PRAGMA index_list({table})")}
+
+
+def test_legacy_logs_db_is_upgraded_on_first_connection():
+    conn = sqlite3.connect(logs_db_path())
+    conn.execute("CREATE TABLE consortium_runs (id TEXT PRIMARY KEY, created_at TEXT, strategy TEXT)")
+    conn.execute("CREATE TABLE response_embeddings (response_id TEXT PRIMARY KEY, run_id TEXT, model TEXT, embedding_json TEXT)")
+    conn.execute("INSERT INTO consortium_runs VALUES ('old-run', '2024-01-01', 'default')")
+    conn.commit()
+    conn.close()
+
+    db = DatabaseConnection.get_connection()
+
+    assert applied_migrations(db) == [fn.__name__ for fn in MIGRATIONS]
+    assert {"status", "category", "visualization_json"} <= {c.name for c in db["consortium_runs"].columns}
+    assert {"embedding_model", "created_at"} <= {c.name for c in db["response_embeddings"].columns}
+    assert db["consortium_runs"].get("old-run")["strategy"] == "default"
+    assert "idx_consortium_runs_created_at" in _indexes(db, "consortium_runs")
+    assert "idx_consortium_members_run_iteration" in _indexes(db, "consortium_members")
+    assert "idx_response_embeddings_run_id" in _indexes(db, "response_embeddings")
+
+
+def test_migrate_is_idempotent_and_uses_indexes(tmp_path):
+    db = sqlite_utils.Database(sqlite3.connect(tmp_path / "other.db"))
+    assert migrate(db) == [fn.__name__ for fn in MIGRATIONS]
+    assert migrate(db) == []
+
+    plan = " ".join(
+        row[3] for row in db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM consortium_members WHERE run_id = ? ORDER BY iteration, member_index",
+            ["run"],
+        )
+    )
+    assert "idx_consortium_members_run_iteration" in plan
+
+    sweep_plan = " ".join(
+        row[3] for row in db.execute("EXPLAIN QUERY PLAN DELETE FROM member_response_cache WHERE created_at < ?", [0])
+    )
+    assert "idx_member_response_cache_created_at" in sweep_plan
+
+
+def test_arbiter_decisions_are_keyed_by_attempt(tmp_path):
+    db = sqlite_utils.Database(sqlite3.connect(tmp_path / "cascade.db"))
+    migrate(db, until="m006_embedding_cache")
+    db["arbiter_decisions"].insert({"run_id": "run", "iteration": 1, "response_id": "r1", "confidence": 0.9})
+
+    assert migrate(db, until="m007_arbiter_decision_attempts") == ["m007_arbiter_decision_attempts"]
+
+    db["arbiter_decisions"].insert({"run_id": "run", "iteration": 1, "attempt": 1, "arbiter_model": "strong"})
+    rows = list(db.query("SELECT attempt, arbiter_model, escalated, confidence FROM arbiter_decisions ORDER BY attempt"))
+    assert rows == [
+        {"attempt": 0, "arbiter_model": None, "escalated": 0, "confidence": 0.9},
+        {"attempt": 1, "arbiter_model": "strong", "escalated": 0, "confidence": None},
+    ]
+    assert db["arbiter_decisions"].pks == ["run_id", "iteration", "attempt"]
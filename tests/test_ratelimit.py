@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_consortium.models import ConsortiumConfig
+from llm_consortium.orchestrator import ConsortiumOrchestrator
+from llm_consortium.ratelimit import (
+    ModelLimiter,
+    TokenBucket,
+    get_model_limiter,
+    match_rate_limit,
+    parse_rate_limit_spec,
+)
+
+
+def test_parse_rate_limit_spec():
+    assert parse_rate_limit_spec("rps=2, burst=4,max_in_flight=3") == {"rps": 2.0, "burst": 4.0, "max_in_flight": 3.0}
+    with pytest.raises(ValueError):
+        parse_rate_limit_spec("rps")
+    with pytest.raises(ValueError):
+        parse_rate_limit_spec("rps=0")
+    with pytest.raises(ValueError):
+        ConsortiumConfig(models={"m": 1}, rate_limits={"m": {"concurrency": 2}})
+
+
+def test_exact_model_id_beats_longest_prefix():
+    limits = {"openrouter/": {"rps": 1}, "openrouter/openai/": {"rps": 2}, "openrouter/openai/gpt-4o": {"rps": 3}}
+    assert match_rate_limit("openrouter/openai/gpt-4o", limits) == "openrouter/openai/gpt-4o"
+    assert match_rate_limit("openrouter/openai/o3", limits) == "openrouter/openai/"
+    assert match_rate_limit("openrouter/meta/llama", limits) == "openrouter/"
+    assert match_rate_limit("claude-3", limits) is None
+    assert match_rate_limit("claude-3", None) is None
+
+
+def test_limiter_is_shared_per_pattern():
+    limits = {"shared-prefix/": {"max_in_flight": 2}}
+    first = get_model_limiter("shared-prefix/a", limits)
+    assert get_model_limiter("shared-prefix/b", limits) is first
+    # Another config's looser limit neither replaces nor loosens the provider's limiter
+    assert get_model_limiter("shared-prefix/a", {"shared-prefix/": {"max_in_flight": 3}}) is first
+    assert first.max_in_flight == 2
+
+
+def test_stricter_limits_tighten_the_shared_limiter_in_place():
+    limiter = get_model_limiter("tighten-prefix/a", {"tighten-prefix/": {"rps": 10, "max_in_flight": 4}})
+    with limiter.slot():
+        tightened = get_model_limiter("tighten-prefix/b", {"tighten-prefix/": {"rps": 2, "burst": 1, "max_in_flight": 1}})
+        assert tightened is limiter
+        # The call already in flight still counts against the tightened cap
+        assert not limiter._try_acquire()
+    assert limiter._bucket.rate == 2 and limiter._bucket.capacity == 1
+    assert limiter.limits == {"rps": 2, "burst": 1, "max_in_flight": 1}
+    assert get_model_limiter("tighten-prefix/a", {"tighten-prefix/": {"rps": 10, "max_in_flight": 4}}).max_in_flight == 1
+
+
+def test_token_bucket_spaces_calls_after_burst():
+    bucket = TokenBucket(rate=20, burst=2)
+    started = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    # Two calls ride the burst, the next two wait ~50ms each
+    assert time.monotonic() - started >= 0.09
+
+
+def test_max_in_flight_caps_threads_and_tasks():
+    limiter = ModelLimiter("m", {"max_in_flight": 2})
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    def enter():
+        with lock:
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+
+    def leave():
+        with lock:
+            state["current"] -= 1
+
+    def call():
+        with limiter.slot():
+            enter()
+            time.sleep(0.02)
+            leave()
+
+    async def call_async():
+        async with limiter.slot_async():
+            enter()
+            await asyncio.sleep(0.02)
+            leave()
+
+    async def run_tasks():
+        await asyncio.gather(*(call_async() for _ in range(4)))
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(run_tasks())
+    for thread in threads:
+        thread.join()
+
+    assert state["peak"] == 2
+
+
+@patch('llm_consortium.orchestrator.llm.get_model')
+def test_member_calls_respect_max_in_flight(mock_get_model):
+    lock = threading.Lock()
+    state = {"current": 0, "peak": 0}
+
+    def slow_text():
+        with lock:
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+        time.sleep(0.02)
+        with lock:
+            state["current"] -= 1
+        return "answer"
+
+    # llm responses are lazy, so the provider call happens inside text()
+    response = MagicMock()
+    response.text.side_effect = slow_text
+    model = MagicMock()
+    model.prompt.return_value = response
+    mock_get_model.return_value = model
+
+    config = ConsortiumConfig(models={"limited-model": 4}, arbiter="arbiter", manual_context=True,
+                              rate_limits={"limited-": {"max_in_flight": 1}})
+    orchestrator = ConsortiumOrchestrator(config=config)
+    responses = orchestrator._get_model_responses_manual("prompt", {"limited-model": 4}, 1)
+
+    assert len(responses) == 4
+    assert all(r.get("error") is None for r in responses)
+    assert state["peak"] == 1
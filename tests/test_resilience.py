@@ -0,0 +1,129 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from llm_consortium.models import ConsortiumConfig
+from llm_consortium.orchestrator import ConsortiumOrchestrator
+from llm_consortium.resilience import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    call_with_retries,
+    call_with_retries_async,
+    is_transient_error,
+    reset_circuit_breakers,
+)
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.fixture(autouse=True)
+def clean_breakers():
+    reset_circuit_breakers()
+    yield
+    reset_circuit_breakers()
+
+
+def test_transient_error_classification():
+    assert is_transient_error(StatusError(429))
+    assert is_transient_error(StatusError(503))
+    assert not is_transient_error(StatusError(401))
+    assert is_transient_error(TimeoutError())
+    assert is_transient_error(Exception("Rate limit exceeded, please slow down"))
+    assert not is_transient_error(ValueError("bad prompt"))
+    assert not is_transient_error(CircuitOpenError("m", 10))
+
+
+def test_retries_transient_errors_only():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise StatusError(429)
+        return "ok"
+
+    assert call_with_retries(flaky, max_retries=2, base_delay=0) == "ok"
+    assert len(calls) == 3
+
+    fatal = MagicMock(side_effect=StatusError(401))
+    with pytest.raises(StatusError):
+        call_with_retries(fatal, max_retries=3, base_delay=0)
+    assert fatal.call_count == 1
+
+
+def test_async_retries_give_up_after_max_retries():
+    attempts = []
+
+    async def always_busy():
+        attempts.append(1)
+        raise StatusError(503)
+
+    with pytest.raises(StatusError):
+        asyncio.run(call_with_retries_async(always_busy, max_retries=2, base_delay=0))
+    assert len(attempts) == 3
+
+
+def test_breaker_opens_probes_and_closes():
+    transitions = []
+    breaker = CircuitBreaker("m", failure_threshold=2, reset_timeout_s=0,
+                             on_transition=lambda *args: transitions.append(args[1:3]))
+    breaker.record_failure(RuntimeError("boom"))
+    assert breaker.state == CLOSED
+    breaker.record_failure(RuntimeError("boom"))
+    assert breaker.state == OPEN
+
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one probe at a time
+    breaker.record_success()
+
+    assert breaker.state == CLOSED
+    assert transitions == [(CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)]
+
+
+def test_open_breaker_fast_fails_until_reset():
+    breaker = CircuitBreaker("m", failure_threshold=1, reset_timeout_s=60)
+    breaker.record_failure(RuntimeError("down"))
+    assert not breaker.is_available()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+@patch('llm_consortium.resilience.save_circuit_breaker_event')
+@patch('llm_consortium.orchestrator.llm.get_model')
+def test_dead_model_is_dropped_from_selection(mock_get_model, mock_save_event):
+    models = {}
+
+    def make_model(model_id):
+        model = models.setdefault(model_id, MagicMock())
+        response = MagicMock()
+        if model_id == "dead-model":
+            response.text.side_effect = StatusError(500)
+        else:
+            response.text.return_value = "fine"
+        model.prompt.return_value = response
+        return model
+
+    mock_get_model.side_effect = make_model
+    config = ConsortiumConfig(models={"dead-model": 1, "live-model": 1}, arbiter="arbiter", manual_context=True,
+                              max_retries=1, retry_base_delay_s=0, breaker_failure_threshold=1)
+    orchestrator = ConsortiumOrchestrator(config=config)
+
+    responses = orchestrator._get_model_responses_manual("prompt", orchestrator._available_models(config.models), 1)
+    errors = {r["model"] for r in responses if r.get("error")}
+    assert errors == {"dead-model"}
+    # one initial call plus one retry before the breaker opened
+    assert models["dead-model"].prompt.call_count == 2
+
+    assert orchestrator._available_models(config.models) == {"live-model": 1}
+    mock_save_event.assert_called_once()
+    assert mock_save_event.call_args[0][:3] == ("dead-model", CLOSED, OPEN)
@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from llm_consortium.db import DatabaseConnection
+from llm_consortium.models import ConsortiumConfig
+from llm_consortium.orchestrator import ConsortiumOrchestrator
+from llm_consortium.semantic_cache import config_fingerprint, get_semantic_cache_stats, reset_semantic_cache_stats
+
+
+VECTORS = {
+    "What is the capital of France?": [1.0, 0.0, 0.0],
+    "Tell me France's capital city": [0.99, 0.05, 0.0],
+    "How do magnets work?": [0.0, 1.0, 0.0],
+}
+
+
+class FakeEmbeddingService:
+    def embed(self, text):
+        return np.array(VECTORS[text])
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path):
+    monkeypatch.setattr('llm_consortium.db.user_dir', lambda: tmp_path)
+    monkeypatch.delenv("LLM_CONSORTIUM_NO_CACHE", raising=False)
+    if hasattr(DatabaseConnection._thread_local, 'db'):
+        delattr(DatabaseConnection._thread_local, 'db')
+    reset_semantic_cache_stats()
+    yield
+    if hasattr(DatabaseConnection._thread_local, 'db'):
+        delattr(DatabaseConnection._thread_local, 'db')
+
+
+def _orchestrator(**overrides):
+    config = ConsortiumConfig(models={"m": 1}, arbiter="arbiter", manual_context=True, embedding_backend="openai",
+                              semantic_cache_enabled=True, **overrides)
+    orchestrator = ConsortiumOrchestrator(config=config, config_name="semantic-test")
+    orchestrator._embedding_service = FakeEmbeddingService()
+    return orchestrator
+
+
+def _fake_run(self, prompt, conversation_history=None, consortium_id=None):
+    self.iteration_history = [{"iteration": 1, "synthesis": {"synthesis": f"answer to {prompt}", "confidence": 0.9}}]
+    return self._build_final_result(prompt, consortium_id)
+
+
+@patch.object(ConsortiumOrchestrator, "_orchestrate_manual", autospec=True, side_effect=_fake_run)
+def test_paraphrase_is_served_from_semantic_cache(mock_run):
+    first = _orchestrator().orchestrate("What is the capital of France?")
+    assert "semantic_cache" not in first["metadata"]
+
+    second = _orchestrator().orchestrate("Tell me France's capital city")
+    assert mock_run.call_count == 1
+    assert second["synthesis"]["synthesis"] == "answer to What is the capital of France?"
+    assert second["metadata"]["semantic_cache"]["source_run_id"] == first["metadata"]["consortium_id"]
+    assert second["metadata"]["consortium_id"] != first["metadata"]["consortium_id"]
+
+    _orchestrator().orchestrate("How do magnets work?")
+    assert mock_run.call_count == 2
+    assert get_semantic_cache_stats()["semantic-test"] == {"hits": 1, "misses": 2}
+
+
+@patch.object(ConsortiumOrchestrator, "_orchestrate_manual", autospec=True, side_effect=_fake_run)
+def test_semantic_cache_respects_threshold_history_and_bypass(mock_run):
+    _orchestrator().orchestrate("What is the capital of France?")
+
+    _orchestrator(semantic_cache_max_distance=0.0001).orchestrate("Tell me France's capital city")
+    _orchestrator().orchestrate("Tell me France's capital city", conversation_history="Human: hi")
+    _orchestrator().orchestrate("Tell me France's capital city", use_cache=False)
+    assert mock_run.call_count == 4
+
+
+def test_fingerprint_ignores_operational_settings():
+    base = ConsortiumConfig(models={"m": 1}, arbiter="a")
+    assert config_fingerprint(base) == config_fingerprint(base.model_copy(update={"max_retries": 7, "status": "running"}))
+    assert config_fingerprint(base) != config_fingerprint(base.model_copy(update={"arbiter": "b"}))
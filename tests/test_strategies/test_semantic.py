@@ -1,7 +1,12 @@
+import threading
 from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 
+from llm_consortium.models import ConsortiumConfig
+from llm_consortium.orchestrator import ConsortiumOrchestrator
 from llm_consortium.strategies.base import ConsortiumStrategy
 from llm_consortium.strategies.semantic import SemanticClusteringStrategy
 
@@ -69,6 +74,8 @@ def test_process_responses_filters_to_largest_cluster():
     assert all("embedding" in response for response in filtered)
     assert all(response["cluster_id"] == 0 for response in filtered)
     assert all("distance_to_centroid" in response for response in filtered)
+    # The arbiter's geometric confidence reuses this iteration's distance matrix
+    assert strategy.geometry_context.select(filtered) is not None
 
 
 def test_process_responses_falls_back_to_all_when_everything_is_outlier():
@@ -90,4 +97,105 @@ def test_process_responses_falls_back_to_all_when_everything_is_outlier():
     filtered = strategy.process_responses(responses, iteration=1)
 
     assert len(filtered) == 3
-    assert {response["cluster_id"] for response in filtered} == {-1}
\ No newline at end of file
+    assert {response["cluster_id"] for response in filtered} == {-1}
+
+
+@pytest.mark.parametrize("algorithm, eps", [("hdbscan", 0.3), ("tropical", 0.2)])
+def test_hdbscan_and_tropical_keep_the_agreeing_responses(algorithm, eps):
+    mapping = {
+        "a1": [1.0, 0.0, 0.1],
+        "a2": [0.99, 0.01, 0.1],
+        "a3": [0.98, 0.02, 0.1],
+        "a4": [1.0, 0.01, 0.1],
+        "outlier": [-1.0, 0.2, 0.9],
+    }
+    strategy = SemanticClusteringStrategy(
+        _make_orchestrator(mapping),
+        {"clustering_algorithm": algorithm, "eps": eps, "min_samples": 2},
+    )
+    responses = [
+        {"response": text, "id": i, "response_id": f"r{i}", "model": f"m{i}"}
+        for i, text in enumerate(mapping)
+    ]
+
+    filtered = strategy.process_responses(responses, iteration=1)
+
+    assert strategy.clustering_algorithm == algorithm
+    assert [response["response"] for response in filtered] == ["a1", "a2", "a3", "a4"]
+    assert responses[-1]["cluster_id"] == -1
+
+class RecordingEmbeddingService(StubEmbeddingService):
+    def __init__(self, mapping):
+        super().__init__(mapping)
+        self.batches = []
+        self.embedded = {text: threading.Event() for text in mapping}
+
+    def embed_batch(self, texts):
+        self.batches.append((threading.current_thread().name, list(texts)))
+        vectors = super().embed_batch(texts)
+        for text in texts:
+            self.embedded[text].set()
+        return vectors
+
+
+def test_member_responses_are_embedded_as_they_arrive():
+    mapping = {"a-1": [1.0, 0.0], "a-2": [0.95, 0.05], "late": [0.9, 0.1]}
+    service = RecordingEmbeddingService(mapping)
+    orchestrator = _make_orchestrator(mapping)
+    orchestrator.get_embedding_service = lambda: service
+    strategy = SemanticClusteringStrategy(orchestrator, {"eps": 0.2, "min_samples": 2})
+    strategy.initialize_state()
+    responses = [
+        {"response": "a-1", "id": 1, "response_id": "r1", "model": "m1"},
+        {"response": "a-2", "id": 2, "response_id": "r2", "model": "m2"},
+        {"response": "late", "id": 3, "response_id": "r3", "model": "m3"},
+    ]
+
+    strategy.on_member_response(responses[0], 1)
+    strategy.on_member_response(responses[1], 1)
+    strategy.on_member_response({"model": "m4", "error": "boom"}, 1)
+    assert service.embedded["a-1"].wait(5) and service.embedded["a-2"].wait(5)
+
+    filtered = strategy.process_responses(responses, iteration=1)
+
+    assert len(filtered) == 3
+    streamed = [texts for thread, texts in service.batches if thread.startswith("consortium-embed")]
+    assert sorted(text for texts in streamed for text in texts) == ["a-1", "a-2"]
+    # Only the response that never went through the hook is embedded at fan-in
+    assert [texts for thread, texts in service.batches if not thread.startswith("consortium-embed")] == [["late"]]
+    assert np.allclose(filtered[0]["embedding"], mapping["a-1"])
+    assert "pending_embeddings" not in strategy.iteration_state
+
+
+@patch("llm_consortium.orchestrator.llm.get_model")
+def test_orchestrator_embeds_fast_members_while_slow_ones_run(mock_get_model, monkeypatch, tmp_path):
+    monkeypatch.setattr("llm_consortium.db.user_dir", lambda: tmp_path)
+    mapping = {"fast answer": [1.0, 0.0], "slow answer": [0.99, 0.01]}
+    service = RecordingEmbeddingService(mapping)
+    overlapped = []
+
+    def make_model(model_id):
+        response = MagicMock()
+        if model_id == "slow":
+            # Finishes only once the fast member's answer has been embedded
+            response.text.side_effect = lambda: overlapped.append(service.embedded["fast answer"].wait(5)) or "slow answer"
+        else:
+            response.text.return_value = "fast answer"
+        model = MagicMock()
+        model.prompt.return_value = response
+        return model
+
+    mock_get_model.side_effect = make_model
+    config = ConsortiumConfig(models={"fast": 1, "slow": 1}, arbiter="arbiter", manual_context=True,
+                              strategy="semantic", strategy_params={"eps": 0.2, "min_samples": 2},
+                              cache_policy="off")
+    orchestrator = ConsortiumOrchestrator(config=config)
+    orchestrator._embedding_service = service
+    orchestrator.strategy.initialize_state()
+
+    responses = orchestrator._get_model_responses_manual("prompt", {"fast": 1, "slow": 1}, 1)
+    filtered = orchestrator.strategy.process_responses(responses, 1)
+
+    assert overlapped == [True]
+    assert len(filtered) == 2
+    assert all(thread.startswith("consortium-embed") for thread, _ in service.batches)
@@ -1,5 +1,8 @@
 """Tests for the VotingStrategy."""
 
+import random
+import string
+
 import pytest
 from unittest.mock import Mock
 from llm_consortium.strategies.voting import VotingStrategy
@@ -235,3 +238,143 @@ class TestVotingStrategy:
         # State should be preserved
         assert strategy.iteration_state['consensus_count'] == 2
         assert strategy.iteration_state['no_consensus_count'] == 1
+
+    def test_difflib_grouping_matches_pairwise_similarity(self):
+        """Normalising once and pre-filtering with quick ratios gives the old groups."""
+        rng = random.Random(3)
+        words = ["alpha", "beta", "gamma", "delta", "paris", "berlin", "42", "forty"]
+        responses = [
+            {'model': f'm{i}', 'response': ("Sure! " if i % 3 == 0 else "") + " ".join(rng.choices(words, k=6))}
+            for i in range(12)
+        ]
+        strategy = VotingStrategy(Mock(), {'similarity_threshold': 0.6})
+
+        expected, used = [], set()
+        for i, response in enumerate(responses):
+            if i in used:
+                continue
+            group = [response]
+            used.add(i)
+            for j in range(i + 1, len(responses)):
+                if j not in used and strategy._calculate_similarity(response['response'], responses[j]['response']) >= 0.6:
+                    group.append(responses[j])
+                    used.add(j)
+            expected.append(group)
+
+        assert strategy._group_similar_responses(responses) == expected
+
+    @pytest.mark.parametrize("method, threshold", [("minhash", 0.5), ("simhash", 0.75)])
+    def test_fingerprint_methods_group_long_paraphrases(self, method, threshold):
+        """MinHash and SimHash group lightly edited copies of long answers."""
+        rng = random.Random(0)
+        vocabulary = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 8))) for _ in range(500)]
+        bases = [rng.choices(vocabulary, k=300) for _ in range(2)]
+        responses = []
+        for i in range(6):
+            words = list(bases[i % 2])
+            for _ in range(15):
+                words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            responses.append({'model': f'm{i}', 'response': " ".join(words)})
+        strategy = VotingStrategy(Mock(), {'similarity_method': method, 'similarity_threshold': threshold})
+
+        groups = strategy._group_similar_responses(responses)
+
+        assert [[r['model'] for r in group] for group in groups] == [['m0', 'm2', 'm4'], ['m1', 'm3', 'm5']]
+        assert strategy._calculate_similarity(responses[0]['response'], responses[2]['response']) >= threshold
+
+    def test_minhash_lsh_matches_all_pairs_for_many_responses(self):
+        """LSH bucketing keeps the same groups when answers are clearly separated."""
+        rng = random.Random(1)
+        answers = [" ".join(rng.choices(string.ascii_lowercase, k=400)) for _ in range(4)]
+        responses = [{'model': f'm{i}', 'response': answers[i % 4]} for i in range(40)]
+        exact = VotingStrategy(Mock(), {'similarity_method': 'minhash', 'lsh_min_responses': 1000})
+        bucketed = VotingStrategy(Mock(), {'similarity_method': 'minhash', 'lsh_min_responses': 32})
+
+        assert [len(g) for g in bucketed._group_similar_responses(responses)] == [10, 10, 10, 10]
+        assert bucketed._group_similar_responses(responses) == exact._group_similar_responses(responses)
+
+    def test_validate_params_invalid_similarity_method(self):
+        """Test validation fails with an unknown similarity method."""
+        with pytest.raises(ValueError, match="similarity_method must be one of"):
+            VotingStrategy(Mock(), {'similarity_method': 'levenshtein'})
+
+    def test_answer_extractor_groups_exact_answers(self):
+        """Extracted answers are grouped exactly, whatever the surrounding text."""
+        strategy = VotingStrategy(Mock(), {'answer_extractor': 'number', 'require_majority': True})
+        strategy.initialize_state()
+        responses = [
+            {'model': 'a', 'response': 'Working it out step by step gives 120 km.'},
+            {'model': 'b', 'response': 'They meet at 210 km from A.'},
+            {'model': 'c', 'response': 'Distance: 120.0'},
+            {'model': 'd', 'response': 'After 2 hours the trains meet 120 km from station A... wait, 1,20? No: 120'},
+        ]
+
+        result = strategy.process_responses(responses, 1)
+
+        assert [r['model'] for r in result] == ['a', 'c', 'd']
+        assert all(r['extracted_answer'] == '120' for r in result)
+        history = strategy.iteration_state['voting_history'][0]
+        assert [(g['answer'], g['size']) for g in history['groups']] == [('120', 3), ('210', 1)]
+
+    def test_answer_extractor_falls_back_to_similarity(self):
+        """Responses without an extractable answer are grouped by similarity among themselves."""
+        strategy = VotingStrategy(Mock(), {'answer_extractor': 'yes_no', 'similarity_threshold': 0.7})
+        responses = [
+            {'model': 'a', 'response': 'It depends on the driver'},
+            {'model': 'b', 'response': 'Yes, it is parameterised'},
+            {'model': 'c', 'response': 'It depends on the driver.'},
+            {'model': 'd', 'response': 'No: it interpolates user input'},
+        ]
+
+        groups = strategy._group_by_answer(responses)
+
+        assert [[r['model'] for r in g] for g in groups] == [['a', 'c'], ['b'], ['d']]
+        assert responses[0]['extracted_answer'] is None
+
+    def test_answer_extractor_accepts_a_callable(self):
+        """A callable extractor is used as is."""
+        strategy = VotingStrategy(Mock(), {'answer_extractor': lambda text: text.split()[-1]})
+        groups = strategy._group_by_answer([{'response': 'pick A'}, {'response': 'I pick B'}, {'response': 'A'}])
+
+        assert [len(g) for g in groups] == [2, 1]
+
+    def test_validate_params_invalid_answer_extractor(self):
+        """Test validation fails with an unknown answer extractor."""
+        with pytest.raises(ValueError, match="Unknown answer_extractor"):
+            VotingStrategy(Mock(), {'answer_extractor': 'letter'})
+
+    def test_collection_decided_once_outstanding_members_cannot_change_the_vote(self):
+        """With early_stop, the vote is decided when the leader can no longer be caught."""
+        answers = lambda *values: [{'response': f'Result: {v}'} for v in values]
+        majority = VotingStrategy(Mock(), {'answer_extractor': 'number', 'require_majority': True, 'early_stop': 'true'})
+        plurality = VotingStrategy(Mock(), {'answer_extractor': 'number', 'early_stop': True})
+
+        # 3 of 7 possible is not yet a majority; 4 of 7 is
+        assert not majority.collection_decided(answers(1, 1, 1), 4, 1)
+        assert majority.collection_decided(answers(1, 1, 1, 1), 3, 1)
+        # A lead of 2 over the runner-up survives 1 outstanding call but not 2
+        assert plurality.collection_decided(answers(1, 1, 1, 2), 1, 1)
+        assert not plurality.collection_decided(answers(1, 1, 1, 2), 2, 1)
+        assert not VotingStrategy(Mock(), {'answer_extractor': 'number'}).collection_decided(answers(1, 1, 1, 1), 1, 1)
+
+    def test_collection_decided_places_only_each_new_arrival(self):
+        """Each arrival is compared with the existing groups, not regrouped with everything."""
+        strategy = VotingStrategy(Mock(), {'early_stop': True, 'similarity_threshold': 0.9})
+        calls = []
+        compare = strategy._calculate_similarity
+        strategy._calculate_similarity = lambda a, b: calls.append((a, b)) or compare(a, b)
+        texts = [f"distinct answer {chr(97 + i) * 12} {i}" for i in range(12)]
+        responses = []
+
+        per_arrival = []
+        for i, text in enumerate(texts):
+            responses.append({'response': text})
+            before = len(calls)
+            assert not strategy.collection_decided(responses, len(texts) - i, 1)
+            per_arrival.append(len(calls) - before)
+
+        # The i-th arrival meets at most the i groups formed before it
+        assert per_arrival == list(range(len(texts)))
+        # Grouping matches a full regroup of the same responses
+        assert sorted(strategy.iteration_state['running_vote']['sizes']) == sorted(
+            len(g) for g in strategy._group_responses(list(responses)))
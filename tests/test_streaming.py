@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock, patch
+
+from llm_consortium import ConsortiumConfig, ConsortiumModel, ConsortiumOrchestrator
+from llm_consortium.streaming import SynthesisStreamExtractor
+
+ARBITER_OUTPUT = (
+    "<thinking>Both agree.</thinking><synthesis_output>"
+    "<confidence>0.9</confidence><needs_iteration>false</needs_iteration>"
+    "<synthesis>\n  The earth is round.\n  It orbits the sun.  \n</synthesis>"
+    "<refinement_areas></refinement_areas></synthesis_output>"
+)
+
+
+def _feed_in_pieces(extractor, text, size):
+    return "".join(extractor.feed(text[i:i + size]) for i in range(0, len(text), size))
+
+
+def test_extractor_handles_tags_split_across_chunks():
+    for size in (1, 2, 5, 11, len(ARBITER_OUTPUT)):
+        extractor = SynthesisStreamExtractor()
+        assert _feed_in_pieces(extractor, ARBITER_OUTPUT, size) == "The earth is round.\n  It orbits the sun."
+        assert extractor.streamed
+
+
+def test_extractor_uses_decision_tags_seen_before_synthesis():
+    seen = []
+
+    def emit_when(confidence, needs_iteration):
+        seen.append((confidence, needs_iteration))
+        return confidence >= 0.95
+
+    extractor = SynthesisStreamExtractor(emit_when=emit_when)
+
+    assert _feed_in_pieces(extractor, ARBITER_OUTPUT, 3) == ""
+    assert seen == [(0.9, False)]
+    assert not extractor.streamed
+
+
+def test_extractor_ignores_synthesis_output_wrapper():
+    extractor = SynthesisStreamExtractor()
+    assert extractor.feed("<synthesis_output><synth") == ""
+    assert extractor.feed("esis>Answer</synthesis>") == "Answer"
+    assert extractor.feed("<synthesis>second</synthesis>") == ""
+
+
+@patch("llm_consortium.orchestrator.update_consortium_run")
+@patch("llm_consortium.orchestrator.save_consortium_run")
+@patch("llm_consortium.orchestrator.log_response")
+@patch("llm_consortium.orchestrator.save_consortium_member")
+@patch("llm_consortium.orchestrator.save_arbiter_decision")
+@patch("llm_consortium.orchestrator.llm.get_model")
+def test_consortium_model_streams_final_synthesis(mock_get_model, *_):
+    member = MagicMock()
+    member.prompt.return_value.text.return_value = "Member answer"
+
+    chunks = [ARBITER_OUTPUT[i:i + 7] for i in range(0, len(ARBITER_OUTPUT), 7)]
+    arbiter_response = MagicMock()
+    arbiter_response.__iter__.side_effect = lambda: iter(chunks)
+    arbiter_response.text.return_value = ARBITER_OUTPUT
+    arbiter = MagicMock()
+    arbiter.prompt.return_value = arbiter_response
+
+    mock_get_model.side_effect = lambda model_id: arbiter if model_id == "arbiter" else member
+
+    config = ConsortiumConfig(models={"member": 1}, arbiter="arbiter", manual_context=True)
+    model = ConsortiumModel("streaming-test", config)
+    prompt = MagicMock()
+    prompt.prompt = "Is the earth round?"
+
+    output = list(model.execute(prompt, True, MagicMock(), None))
+
+    assert len(output) > 1
+    assert "".join(output) == "The earth is round.\n  It orbits the sun."
+    assert arbiter.prompt.call_args.kwargs["stream"] is True
+
+
+@patch("llm_consortium.orchestrator.log_response")
+@patch("llm_consortium.orchestrator.save_consortium_member")
+@patch("llm_consortium.orchestrator.save_arbiter_decision")
+@patch("llm_consortium.orchestrator.llm.get_model")
+def test_only_the_arbiter_that_stands_is_streamed(mock_get_model, *_):
+    def arbiter(text):
+        response = MagicMock()
+        response.__iter__.side_effect = lambda: iter([text[i:i + 7] for i in range(0, len(text), 7)])
+        response.text.return_value = text
+        model = MagicMock()
+        model.prompt.return_value = response
+        return model
+
+    arbiters = {
+        "cheap": arbiter(ARBITER_OUTPUT.replace("0.9", "0.5").replace("The earth", "Maybe the earth")),
+        "strong": arbiter(ARBITER_OUTPUT),
+    }
+    mock_get_model.side_effect = arbiters.get
+    config = ConsortiumConfig(models={"member": 1}, arbiter="cheap", arbiter_escalation=["strong"],
+                              max_iterations=1, manual_context=True)
+    orchestrator = ConsortiumOrchestrator(config)
+    chunks = []
+    orchestrator._on_synthesis_chunk = chunks.append
+
+    result = orchestrator._synthesize_responses_manual("prompt", [{"model": "member", "response": "Round", "id": 0}], [], 1)
+
+    assert result["arbiter"] == "strong"
+    assert "".join(chunks) == "The earth is round.\n  It orbits the sun."